@@ -1,39 +1,71 @@
 import os
+from functools import lru_cache
+
+# 検索キーワード（不変定数として一度だけ生成）
+TARGET_KEYWORDS = (
+    'データ入力',
+    'データ入力案件',
+    '入力作業',
+    'キッティング',
+    'PC設定',
+    'コールセンター',
+    '電話受付',
+    '事務業務'
+)
+TARGET_KEYWORDS_LC = frozenset(kw.lower() for kw in TARGET_KEYWORDS)
+
+# 除外キーワード
+EXCLUDE_KEYWORDS = (
+    '清掃',
+    '警備',
+    '建設'
+)
+EXCLUDE_KEYWORDS_LC = frozenset(kw.lower() for kw in EXCLUDE_KEYWORDS)
+
+def _read_env() -> dict:
+    """設定に使用する環境変数を読み込む"""
+    return {
+        'log_level': os.environ.get('LOG_LEVEL', 'INFO'),
+        'teams_webhook_url': os.environ.get('TEAMS_WEBHOOK_URL', ''),
+        'teams_webhook_gzip': os.environ.get('TEAMS_WEBHOOK_GZIP', 'false').lower() == 'true',
+        'report_base_url': os.environ.get('REPORT_BASE_URL', ''),
+        'test_mode': os.environ.get('TEST_MODE', 'false').lower() == 'true'
+    }
+
+# 環境変数はプロセス内で一度だけ読み込む
+_ENV = _read_env()
 
 class Settings:
     def __init__(self):
         # ログ設定
-        self.log_level = os.getenv('LOG_LEVEL', 'INFO')
+        self.log_level = _ENV['log_level']
         self.log_file = 'logs/bidding_system.log'
         
         # Teams通知設定
-        self.teams_webhook_url = os.getenv('TEAMS_WEBHOOK_URL', '')
-        self.test_mode = os.getenv('TEST_MODE', 'false').lower() == 'true'
+        self.teams_webhook_url = _ENV['teams_webhook_url']
+        # 日次レポートをgzip圧縮して送信するか（受信側が Content-Encoding: gzip に対応している場合のみ有効にする）
+        self.teams_webhook_gzip = _ENV['teams_webhook_gzip']
+        self.test_mode = _ENV['test_mode']
+        
+        # 日次レポートのHTML出力先（公開URLを設定するとTeamsカードはリンクのみになる）
+        self.report_base_url = _ENV['report_base_url']
+        self.report_output_dir = 'docs/reports'
         
         # 検索キーワード
-        self.target_keywords = [
-            'データ入力',
-            'データ入力案件', 
-            '入力作業',
-            'キッティング',
-            'PC設定',
-            'コールセンター',
-            '電話受付',
-            '事務業務'
-        ]
+        self.target_keywords = TARGET_KEYWORDS
         
         # 除外キーワード
-        self.exclude_keywords = [
-            '清掃',
-            '警備',
-            '建設'
-        ]
+        self.exclude_keywords = EXCLUDE_KEYWORDS
         
         # API設定
         self.api_timeout = 30
         self.api_retry_count = 3
         self.api_retry_delay = 2
+        self.max_concurrent_requests = 4
+        self.api_request_interval = 1.0  # リクエスト開始間隔（秒）
         self.government_api_base_url = 'https://www.geps.go.jp'
+        self.http_cache_path = 'data/http_cache.sqlite'
+        self.http_cache_expire_after = 3600  # 秒
         
         # メール設定（Teams通知のみなのでダミー値）
         self.email_user = 'dummy@example.com'
@@ -51,10 +83,25 @@ class Settings:
         
         # 通知設定
         self.max_daily_notifications = 10
+        self.notification_rate_limit_per_min = 3  # 60秒あたりの最大プッシュ数
+        self.notification_dedup_window = 3600  # 同一案件を再通知しない期間（秒）
+        self.notification_score_threshold = self.high_score_threshold
+        self.notification_coalesce_window = 30  # アラートをまとめる待ち時間（秒、0で即時送信）
         
         # 実行制限
         self.max_processing_time = 1400  # 23分
         self.max_entries_per_run = 100
         self.data_retention_days = 30
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """設定のシングルトンを取得（プロセス内で一度だけ生成）"""
+    return Settings()
+
+def reset_env_cache():
+    """環境変数を再読込し、設定キャッシュを破棄する（テストで環境変数を変更した後に使用）"""
+    global _ENV
+    _ENV = _read_env()
+    get_settings.cache_clear()
+
+settings = get_settings()
@@ -1,13 +1,148 @@
 import requests
+from requests.adapters import HTTPAdapter
+try:
+    from requests_cache import CachedSession
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
 import xml.etree.ElementTree as ET
-import json
+try:
+    from lxml import etree as lxml_etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+try:
+    import h2  # noqa: F401  httpxのHTTP/2対応に必要
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+import asyncio
+import os
+import random
+import re
+import sys
 import time
-from typing import List, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from types import MappingProxyType
+from typing import Iterator, List, Dict, Optional, Union
+from urllib.parse import urljoin
 from datetime import datetime, date
 import logging
-from config.settings import settings
+from config.settings import get_settings, TARGET_KEYWORDS, TARGET_KEYWORDS_LC
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# XML解析で捕捉する例外（lxml利用時はそのエラー型も含める）
+XML_PARSE_ERRORS = (ET.ParseError, lxml_etree.XMLSyntaxError) if HAS_LXML else (ET.ParseError,)
+
+# Retry-Afterヘッダーを尊重するHTTPステータス
+RETRY_AFTER_STATUSES = (429, 503)
+
+# 日付フォーマット（ISO形式以外のフォールバック用）
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y年%m月%d日")
+
+# 予算文字列から数字以外を除去するパターン
+NON_DIGIT_PATTERN = re.compile(r'\D')
+
+# 検索キーワードの英語変換表（文字化け回避）
+KEYWORD_TRANSLATION = MappingProxyType({
+    "データ入力": "data entry",
+    "データ入力案件": "data entry",
+    "入力作業": "data entry",
+    "キッティング": "kitting",
+    "PC設定": "PC setup",
+    "システム構築": "system construction",
+    "コールセンター": "call center",
+    "電話受付": "telephone reception",
+    "事務業務": "office work"
+})
+
+# SearchResult 子要素タグと BidEntry フィールドの対応表
+SEARCH_RESULT_TAG_FIELDS = MappingProxyType({
+    'ProjectName': 'title',
+    'ProjectDescription': 'description',
+    'OrganizationName': 'organization',
+    'PrefectureName': 'region',
+    'Date': 'published_date',
+    'CftIssueDate': 'deadline_date',
+    'ExternalDocumentURI': 'source_url',
+    'Category': 'category',
+    'CityName': 'city_name',
+    'LgCode': 'lg_code'
+})
+
+# HTTPリクエストヘッダー
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# インスタンス間で共有するHTTPセッション（初回利用時に生成）
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+def get_shared_session() -> requests.Session:
+    """コネクションプールを共有するHTTPセッションを取得"""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            if HAS_REQUESTS_CACHE:
+                # 同一パラメータのGETはディスクキャッシュから返す（サーバーのキャッシュヘッダーも尊重）
+                os.makedirs(os.path.dirname(settings.http_cache_path), exist_ok=True)
+                session = CachedSession(
+                    settings.http_cache_path,
+                    backend='sqlite',
+                    expire_after=settings.http_cache_expire_after,
+                    allowable_methods=('GET',),
+                    stale_if_error=True,
+                    cache_control=True
+                )
+            else:
+                session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            # 並列リクエスト用のコネクションプール
+            adapter = HTTPAdapter(
+                pool_connections=settings.max_concurrent_requests,
+                pool_maxsize=settings.max_concurrent_requests
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _shared_session = session
+        return _shared_session
+
+@dataclass
+class BidEntry:
+    """APIから取得した入札案件（__slots__により辞書より省メモリ）"""
+    __slots__ = (
+        'title', 'description', 'organization', 'region', 'budget_amount',
+        'published_date', 'deadline_date', 'source_url', 'source_type',
+        'category', 'city_name', 'lg_code'
+    )
+    
+    title: str
+    description: str
+    organization: str
+    region: str
+    budget_amount: Optional[int]
+    published_date: Optional[date]
+    deadline_date: Optional[date]
+    source_url: str
+    source_type: str
+    category: str
+    city_name: str
+    lg_code: str
+    
+    def to_dict(self) -> Dict:
+        """後続処理（辞書ベース）向けに変換"""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 class GovernmentProcurementAPI:
     """官公需情報ポータルサイトAPI連携クラス"""
@@ -17,94 +152,198 @@ class GovernmentProcurementAPI:
         self.timeout = settings.api_timeout
         self.retry_count = settings.api_retry_count
         self.retry_delay = settings.api_retry_delay
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.max_workers = settings.max_concurrent_requests
+        self.request_interval = settings.api_request_interval
+        self.headers = DEFAULT_HEADERS
+        self.session = get_shared_session()
+        
+        # レート制限（リクエスト開始時刻の間隔を保証）
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
         
-    def _make_request(self, params: Dict) -> Optional[Dict]:
+    def _reserve_request_slot(self) -> float:
+        """次のリクエスト開始枠を確保し、必要な待機秒数を返す"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + self.request_interval
+        return wait
+    
+    def _wait_for_rate_limit(self):
+        """前回のリクエスト開始から一定間隔が空くまで待機"""
+        wait = self._reserve_request_slot()
+        if wait > 0:
+            time.sleep(wait)
+        
+    def _compute_retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """リトライ待機時間（Retry-After優先、なければジッター付き指数バックオフ）"""
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        delay = self.retry_delay * (2 ** attempt)
+        return random.uniform(0.5 * delay, 1.5 * delay)
+    
+    def _make_request(self, params: Dict, endpoint: str = "") -> Optional[Dict]:
         """API リクエスト実行（リトライ付き）"""
+        content = self._fetch_xml(params, endpoint)
+        if content is None:
+            return None
+        return self._parse_xml_response(content)
+    
+    def _fetch_xml(self, params: Dict, endpoint: str = "") -> Optional[bytes]:
+        """API リクエストを実行してXMLの生バイト列を返す（リトライ付き）"""
+        url = urljoin(self.base_url, endpoint)
         
         for attempt in range(self.retry_count):
             try:
                 logger.info(f"APIリクエスト実行 (試行 {attempt + 1}/{self.retry_count}): {params}")
                 
+                self._wait_for_rate_limit()
                 response = self.session.get(
-                    self.base_url, 
+                    url, 
                     params=params, 
                     timeout=self.timeout
                 )
                 
                 if response.status_code == 200:
-                    return self._parse_xml_response(response.text)
+                    return response.content
                 else:
                     logger.warning(f"HTTP {response.status_code}: {response.text[:200]}")
+                    if attempt < self.retry_count - 1:
+                        retry_after = response.headers.get('Retry-After') if response.status_code in RETRY_AFTER_STATUSES else None
+                        time.sleep(self._compute_retry_delay(attempt, retry_after))
                 
             except requests.exceptions.RequestException as e:
                 logger.warning(f"API request failed (attempt {attempt + 1}/{self.retry_count}): {e}")
                 if attempt < self.retry_count - 1:
-                    time.sleep(self.retry_delay)
+                    time.sleep(self._compute_retry_delay(attempt))
+                else:
+                    logger.error(f"API request failed after {self.retry_count} attempts")
+                    return None
+                    
+        return None
+    
+    async def _fetch_xml_async(self, client: "httpx.AsyncClient", params: Dict, endpoint: str = "") -> Optional[bytes]:
+        """API リクエストを実行してXMLの生バイト列を返す（非同期・リトライ付き）"""
+        url = urljoin(self.base_url, endpoint)
+        
+        for attempt in range(self.retry_count):
+            try:
+                logger.info(f"APIリクエスト実行 (試行 {attempt + 1}/{self.retry_count}): {params}")
+                
+                wait = self._reserve_request_slot()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                response = await client.get(url, params=params)
+                
+                if response.status_code == 200:
+                    return response.content
+                else:
+                    logger.warning(f"HTTP {response.status_code}: {response.text[:200]}")
+                    if attempt < self.retry_count - 1:
+                        retry_after = response.headers.get('Retry-After') if response.status_code in RETRY_AFTER_STATUSES else None
+                        await asyncio.sleep(self._compute_retry_delay(attempt, retry_after))
+                
+            except httpx.HTTPError as e:
+                logger.warning(f"API request failed (attempt {attempt + 1}/{self.retry_count}): {e}")
+                if attempt < self.retry_count - 1:
+                    await asyncio.sleep(self._compute_retry_delay(attempt))
                 else:
                     logger.error(f"API request failed after {self.retry_count} attempts")
                     return None
                     
         return None
     
-    def _parse_xml_response(self, xml_content: str) -> Dict:
+    def _parse_xml_response(self, xml_content: Union[bytes, str]) -> Dict:
         """XMLレスポンスをパース"""
+        summary = {}
+        entries = [entry.to_dict() for entry in self._iter_parse_xml_response(xml_content, summary)]
+        return {
+            "entries": entries,
+            "total_count": summary.get("total_count", 0)
+        }
+    
+    def _iter_parse_xml_response(self, xml_content: Union[bytes, str], summary: Optional[Dict] = None) -> Iterator[BidEntry]:
+        """XMLレスポンスをSearchResult単位で逐次パースして返すジェネレータ
+        
+        summary を渡すと総件数（total_count）を書き込む
+        """
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode('utf-8')
+        if summary is None:
+            summary = {}
+        summary["total_count"] = 0
+        
+        parsed_count = 0
+        found_results = False
+        
         try:
-            root = ET.fromstring(xml_content)
-            
-            # 検索結果を取得
-            search_results = root.find('SearchResults')
-            if search_results is None:
-                logger.warning("SearchResults要素が見つかりません")
-                return {"entries": [], "total_count": 0}
-            
-            search_hits = search_results.find('SearchHits')
-            total_count = int(search_hits.text) if search_hits is not None else 0
-            
-            # 個別の検索結果を解析
-            entries = []
-            search_result_items = search_results.findall('SearchResult')
+            if HAS_LXML:
+                # libxml2による解析、対象タグのみイベントを受け取る
+                events = lxml_etree.iterparse(
+                    BytesIO(xml_content),
+                    events=('end',),
+                    tag=('SearchResults', 'SearchHits', 'SearchResult')
+                )
+            else:
+                events = ET.iterparse(BytesIO(xml_content), events=('end',))
             
-            for item in search_result_items:
-                entry = self._parse_search_result_item(item)
-                if entry:
-                    entries.append(entry)
+            for _, elem in events:
+                tag = elem.tag
+                if tag == 'SearchResult':
+                    # 個別の検索結果を解析
+                    entry = self._parse_search_result_item(elem)
+                    # 解析済み要素を解放してメモリ使用量を抑える
+                    elem.clear()
+                    if HAS_LXML:
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+                    if entry:
+                        parsed_count += 1
+                        yield entry
+                elif tag == 'SearchHits':
+                    summary["total_count"] = int(elem.text) if elem.text else 0
+                elif tag == 'SearchResults':
+                    found_results = True
             
-            logger.info(f"XML解析完了: 総件数={total_count}, 解析件数={len(entries)}")
+            if not found_results:
+                logger.warning("SearchResults要素が見つかりません")
+                return
             
-            return {
-                "entries": entries,
-                "total_count": total_count
-            }
+            logger.info(f"XML解析完了: 総件数={summary['total_count']}, 解析件数={parsed_count}")
             
-        except ET.ParseError as e:
+        except XML_PARSE_ERRORS as e:
             logger.error(f"XML解析エラー: {e}")
-            return {"entries": [], "total_count": 0}
     
-    def _parse_search_result_item(self, item: ET.Element) -> Optional[Dict]:
+    def _parse_search_result_item(self, item: ET.Element) -> Optional[BidEntry]:
         """個別の検索結果アイテムをパース"""
         try:
-            def get_text_safe(element: ET.Element, tag: str) -> str:
-                child = element.find(tag)
-                return child.text if child is not None and child.text is not None else ""
+            # 子要素を一度だけ走査し、タグに対応するフィールドへ振り分ける
+            values = dict.fromkeys(SEARCH_RESULT_TAG_FIELDS.values(), "")
+            for child in item:
+                field = SEARCH_RESULT_TAG_FIELDS.get(child.tag)
+                if field and child.text and not values[field]:
+                    values[field] = child.text
             
-            return {
-                "title": get_text_safe(item, 'ProjectName'),
-                "description": get_text_safe(item, 'ProjectDescription'),
-                "organization": get_text_safe(item, 'OrganizationName'),
-                "region": get_text_safe(item, 'PrefectureName'),
-                "budget_amount": None,  # XMLには予算情報が含まれていない場合が多い
-                "published_date": self._parse_date(get_text_safe(item, 'Date')),
-                "deadline_date": self._parse_date(get_text_safe(item, 'CftIssueDate')),
-                "source_url": get_text_safe(item, 'ExternalDocumentURI'),
-                "source_type": "government_api",
-                "category": get_text_safe(item, 'Category'),
-                "city_name": get_text_safe(item, 'CityName'),
-                "lg_code": get_text_safe(item, 'LgCode')
-            }
+            # 発注機関・地域・分類などは案件間で重複が多いため intern して共有する
+            intern = sys.intern
+            
+            return BidEntry(
+                title=values['title'],
+                description=values['description'],
+                organization=intern(values['organization']),
+                region=intern(values['region']),
+                budget_amount=None,  # XMLには予算情報が含まれていない場合が多い
+                published_date=self._parse_date(values['published_date']),
+                deadline_date=self._parse_date(values['deadline_date']),
+                source_url=values['source_url'],
+                source_type="government_api",
+                category=intern(values['category']),
+                city_name=intern(values['city_name']),
+                lg_code=values['lg_code']
+            )
             
         except Exception as e:
             logger.warning(f"検索結果アイテムの解析エラー: {e}")
@@ -117,25 +356,31 @@ class GovernmentProcurementAPI:
                     date_from: Optional[date] = None,
                     date_to: Optional[date] = None) -> List[Dict]:
         """入札情報検索"""
+        # 後続処理は辞書ベースのため、最終的な受け渡し時に一度だけ変換する
+        all_entries = [entry.to_dict() for entry in self.iter_search_bids(
+            keywords,
+            region=region,
+            organization=organization,
+            date_from=date_from,
+            date_to=date_to
+        )]
         
-        all_entries = []
-        
-        # キーワード毎に検索実行（英語に変換して実行）
-        keyword_translation = {
-            "データ入力": "data entry",
-            "データ入力案件": "data entry",
-            "入力作業": "data entry",
-            "キッティング": "kitting",
-            "PC設定": "PC setup",
-            "システム構築": "system construction",
-            "コールセンター": "call center",
-            "電話受付": "telephone reception",
-            "事務業務": "office work"
-        }
+        logger.info(f"Total found {len(all_entries)} entries from government API")
+        return all_entries
+    
+    def iter_search_bids(self, 
+                         keywords: List[str],
+                         region: Optional[str] = None,
+                         organization: Optional[str] = None,
+                         date_from: Optional[date] = None,
+                         date_to: Optional[date] = None) -> Iterator[BidEntry]:
+        """入札情報検索（取得した案件を BidEntry として逐次返すジェネレータ）"""
         
+        # キーワード毎の検索パラメータを作成
+        search_params = []
         for keyword in keywords:
             # 英語キーワードを使用（文字化け回避）
-            search_keyword = keyword_translation.get(keyword, keyword)
+            search_keyword = KEYWORD_TRANSLATION.get(keyword, keyword)
             params = {"Query": search_keyword}
             
             if region:
@@ -148,18 +393,39 @@ class GovernmentProcurementAPI:
                 params["Date_To"] = date_to.strftime("%Y-%m-%d")
                 
             logger.info(f"Searching bids for keyword '{keyword}' -> '{search_keyword}' with params: {params}")
-            
-            response = self._make_request(params)
-            if response:
-                entries = response.get("entries", [])
-                all_entries.extend(entries)
-                logger.info(f"Found {len(entries)} entries for keyword '{keyword}' -> '{search_keyword}'")
-            
-            # レート制限を考慮して少し待機
-            time.sleep(1)
+            search_params.append((keyword, search_keyword, params))
         
-        logger.info(f"Total found {len(all_entries)} entries from government API")
-        return all_entries
+        params_list = [params for _, _, params in search_params]
+        if HAS_HTTPX and not HAS_REQUESTS_CACHE:
+            # 単一の非同期クライアントで全キーワードを並行取得
+            contents = asyncio.run(self._fetch_all_async(params_list))
+        else:
+            # 並列に検索実行（レート制限は _fetch_xml 内で適用）
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                contents = list(executor.map(self._fetch_xml, params_list))
+        
+        # XMLは取得済みの生データのみ保持し、案件辞書は消費側へ逐次渡す
+        for (keyword, search_keyword, _), content in zip(search_params, contents):
+            if content is None:
+                continue
+            count = 0
+            for entry in self._iter_parse_xml_response(content):
+                count += 1
+                yield entry
+            logger.info(f"Found {count} entries for keyword '{keyword}' -> '{search_keyword}'")
+    
+    async def _fetch_all_async(self, params_list: List[Dict]) -> List[Optional[bytes]]:
+        """共有の httpx.AsyncClient で複数リクエストを並行実行"""
+        limits = httpx.Limits(max_connections=self.max_workers)
+        async with httpx.AsyncClient(
+            http2=HAS_HTTP2,
+            timeout=self.timeout,
+            limits=limits,
+            headers=self.headers
+        ) as client:
+            return await asyncio.gather(
+                *[self._fetch_xml_async(client, params) for params in params_list]
+            )
     
     def _normalize_entries(self, entries: List[Dict]) -> List[Dict]:
         """API レスポンスを標準形式に変換"""
@@ -167,15 +433,20 @@ class GovernmentProcurementAPI:
         
         for entry in entries:
             try:
+                # 解析済みのフィールドはそのまま引き継ぎ、未解析の場合のみ変換する
+                budget_amount = entry.get("budget_amount")
+                if budget_amount is None:
+                    budget_amount = self._parse_budget(entry.get("budget", ""))
+                
                 normalized_entry = {
                     "title": entry.get("title", ""),
                     "description": entry.get("description", ""),
                     "organization": entry.get("organization", ""),
                     "region": entry.get("region", ""),
-                    "budget_amount": self._parse_budget(entry.get("budget", "")),
+                    "budget_amount": budget_amount,
                     "published_date": self._parse_date(entry.get("published_date", "")),
                     "deadline_date": self._parse_date(entry.get("deadline_date", "")),
-                    "source_url": entry.get("url", ""),
+                    "source_url": entry.get("source_url") or entry.get("url", ""),
                     "source_type": "government_api"
                 }
                 normalized.append(normalized_entry)
@@ -186,26 +457,37 @@ class GovernmentProcurementAPI:
                 
         return normalized
     
-    def _parse_budget(self, budget_str: str) -> Optional[int]:
+    def _parse_budget(self, budget_str: Union[str, int, None]) -> Optional[int]:
         """予算文字列を数値に変換"""
+        if isinstance(budget_str, int):
+            return budget_str
         if not budget_str:
             return None
             
         # 数値以外の文字を除去
-        import re
-        numbers = re.findall(r'\d+', budget_str.replace(',', ''))
-        if numbers:
-            return int(''.join(numbers))
-        return None
+        digits = NON_DIGIT_PATTERN.sub('', budget_str)
+        return int(digits) if digits else None
     
-    def _parse_date(self, date_str: str) -> Optional[date]:
+    def _parse_date(self, date_str: Union[str, date, None]) -> Optional[date]:
         """日付文字列をdateオブジェクトに変換"""
-        if not date_str:
+        # 解析済みの値はそのまま返す（datetimeはdateに揃える）
+        if isinstance(date_str, datetime):
+            return date_str.date()
+        if isinstance(date_str, date):
+            return date_str
+        if not date_str or not isinstance(date_str, str):
             return None
             
+        # ISO形式（YYYY-MM-DD / YYYY/MM/DD）は高速パスで変換
+        if len(date_str) >= 10 and date_str[4] in '-/':
+            try:
+                return date.fromisoformat(date_str[:10].replace('/', '-'))
+            except ValueError:
+                pass
+        
         try:
             # 一般的な日付フォーマットを試行
-            for fmt in ["%Y-%m-%d", "%Y/%m/%d", "%Y年%m月%d日"]:
+            for fmt in DATE_FORMATS:
                 try:
                     return datetime.strptime(date_str, fmt).date()
                 except ValueError:
@@ -217,17 +499,39 @@ class GovernmentProcurementAPI:
     
     def get_bid_details(self, bid_id: str) -> Optional[Dict]:
         """案件詳細情報取得"""
-        params = {"id": bid_id}
-        response = self._make_request("detail", params)
+        response = self._make_request({"id": bid_id}, endpoint="detail")
         
-        if response:
-            return self._normalize_entries([response])[0]
+        if response and response.get("entries"):
+            normalized = self._normalize_entries(response["entries"][:1])
+            if normalized:
+                return normalized[0]
         return None
 
 # モックデータ生成（開発・テスト用）
+MOCK_DETAIL_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Results>
+  <SearchResults>
+    <SearchHits>1</SearchHits>
+    <SearchResult>
+      <ProjectName>コールセンター業務委託</ProjectName>
+      <ProjectDescription>市民からの問い合わせ対応業務</ProjectDescription>
+      <OrganizationName>○○市</OrganizationName>
+      <PrefectureName>東京都</PrefectureName>
+      <Date>2025-07-01</Date>
+      <CftIssueDate>2025-07-31</CftIssueDate>
+      <ExternalDocumentURI>https://example.com/bid/1</ExternalDocumentURI>
+    </SearchResult>
+  </SearchResults>
+</Results>""".encode('utf-8')
+
 class MockGovernmentAPI(GovernmentProcurementAPI):
     """開発用モックAPI"""
     
+    def _fetch_xml(self, params: Dict, endpoint: str = "") -> Optional[bytes]:
+        """ネットワークを使わず固定のXMLを返す（get_bid_details の動作確認用）"""
+        logger.info(f"Mock API: {endpoint or 'search'} {params}")
+        return MOCK_DETAIL_XML
+    
     def search_bids(self, keywords: List[str], **kwargs) -> List[Dict]:
         """モックデータを返す"""
         logger.info(f"Mock API: Searching for keywords: {keywords}")
@@ -257,11 +561,19 @@ class MockGovernmentAPI(GovernmentProcurementAPI):
             }
         ]
         
-        # キーワードに基づいてフィルタリング
-        filtered_entries = []
-        for entry in mock_entries:
-            text_to_search = f"{entry['title']} {entry['description']}".lower()
-            if any(keyword.lower() in text_to_search for keyword in keywords):
-                filtered_entries.append(entry)
+        # キーワードに基づいてフィルタリング（小文字化はループ外で一度だけ）
+        if keywords is TARGET_KEYWORDS:
+            keywords_lc = TARGET_KEYWORDS_LC
+        else:
+            keywords_lc = frozenset(keyword.lower() for keyword in keywords)
+        
+        if not keywords_lc:
+            return []
+        
+        # 検索対象テキストは案件ごとに一度だけ作成する
+        texts_to_search = [f"{entry['title']} {entry['description']}".lower() for entry in mock_entries]
         
-        return filtered_entries
\ No newline at end of file
+        return [
+            entry for entry, text_to_search in zip(mock_entries, texts_to_search)
+            if any(keyword in text_to_search for keyword in keywords_lc)
+        ]
\ No newline at end of file
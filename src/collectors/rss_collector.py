@@ -10,171 +10,538 @@ except ImportError:
     HAS_FEEDPARSER = False
     # フォールバック実装をインポート
     from .rss_fallback import FallbackRSSCollector
+from .rss_fallback import strip_html
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import os
 import re
+import json
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Optional, Any, Union, BinaryIO, Callable, Iterable, Iterator, FrozenSet, Tuple
 from urllib.parse import urljoin, urlparse
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 説明文の長さ制限（保存時）と、HTML除去前に切り詰める生データの上限
+DESCRIPTION_MAX_LENGTH = 2000
+RAW_DESCRIPTION_MAX_LENGTH = DESCRIPTION_MAX_LENGTH * 2
+
+# 空白正規化用パターン
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 適合度スコア（キーワード → 加点）
+RELEVANCE_KEYWORD_SCORES = {
+    "データ入力": 25,
+    "入力作業": 25,
+    "キッティング": 30,
+    "pc設定": 25,
+    "コールセンター": 30,
+    "電話受付": 20,
+    "事務業務": 15,
+    "システム構築": 20,
+    "運用保守": 15,
+    "業務委託": 10,
+    "アウトソーシング": 10
+}
+
+# ボーナス条件（語 → 加点）
+BONUS_KEYWORD_SCORES = {
+    "委託": 5,
+    "業務": 5
+}
+IT_BONUS_WORDS = frozenset(("it", "システム", "コンピュータ"))
+IT_BONUS_SCORE = 10
+MAX_RELEVANCE_SCORE = 100
+
+
+def build_keyword_scanner(words: Iterable[str]) -> Callable[[str], FrozenSet[str]]:
+    """テキスト中に含まれる語の集合を返す関数を構築
+    
+    pyahocorasickが利用可能な場合はAho-Corasickオートマトンで一度の走査にまとめる。
+    """
+    words = tuple(dict.fromkeys(words))
+    
+    if HAS_AHOCORASICK and words:
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        
+        def scan(text: str) -> FrozenSet[str]:
+            return frozenset(word for _, word in automaton.iter(text))
+    else:
+        def scan(text: str) -> FrozenSet[str]:
+            return frozenset(word for word in words if word in text)
+    
+    return scan
+
+# 組織名 → 地域
+REGION_MAPPING = {
+    # 都道府県レベル
+    "東京都": "東京都",
+    "大阪府": "大阪府", 
+    "愛知県": "愛知県",
+    "福岡県": "福岡県",
+    "神奈川県": "神奈川県",
+    "北海道": "北海道",
+    "京都府": "京都府",
+    "宮崎県": "宮崎県",
+    
+    # 政令指定都市
+    "大阪市": "大阪府",
+    "横浜市": "神奈川県", 
+    "福岡市": "福岡県",
+    "札幌市": "北海道",
+    "京都市": "京都府",
+    
+    # 政府機関・独立行政法人
+    "中小企業基盤整備機構本部": "全国",
+    "中小企業基盤整備機構関東": "関東地方",
+    "中小企業基盤整備機構九州": "九州地方", 
+    "中小企業基盤整備機構東北": "東北地方",
+    "中小企業基盤整備機構中部": "中部地方",
+    "中小企業基盤整備機構近畿": "近畿地方",
+    "国土地理院": "全国",
+    "産業技術総合研究所": "全国",
+    "厚生労働省": "全国",
+    "総務省": "全国"
+}
+REGION_PRIORITY = {key: index for index, key in enumerate(REGION_MAPPING)}
+
+# 取得済み・解析待ちのフィードを保持する上限（ピークメモリを抑える）
+PARSE_QUEUE_SIZE = 4
+
+
+def parse_feed_bytes(content: Union[bytes, BinaryIO]) -> Any:
+    """feedparserでフィードを解析"""
+    # HTML除去・URL結合は自前で行うため、feedparser側の相対URI解決とサニタイズは省略する
+    return feedparser.parse(content, resolve_relative_uris=False, sanitize_html=False)
+
+
+# 日付を参照するエントリのフィールド（文字列, feedparserの解析済み時間構造体）
+DATE_FIELDS = tuple((attr, f'{attr}_parsed') for attr in ('published', 'updated', 'pubdate'))
+
+
+@lru_cache(maxsize=1024)
+def parse_date_string(date_str: str) -> Optional[str]:
+    """日付文字列をYYYY-MM-DD形式に変換（RFC 822 / ISO 8601）
+    
+    同一フィード内では同じ日付文字列が繰り返し現れるため結果をキャッシュする。
+    タイムゾーン付きの日時はfeedparserの解析結果に合わせてUTCに揃える。
+    """
+    parsed = None
+    
+    # RFC 822（RSSのpubDate）
+    try:
+        parsed = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError, IndexError):
+        pass
+    
+    # ISO 8601（Atomのupdated/published）
+    if parsed is None:
+        try:
+            parsed = datetime.fromisoformat(date_str[:19])
+        except ValueError:
+            try:
+                parsed = datetime.strptime(date_str[:10], '%Y-%m-%d')
+            except ValueError:
+                return None
+    
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime('%Y-%m-%d')
+
+# 金額パターン（全候補を一度の走査で拾うため、各候補を先読みの名前付きグループにまとめる）
+BUDGET_PATTERN = re.compile(
+    r'(?=(?P<man>\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:万円|万))'
+    r'|(?=(?P<yen>\d{1,3}(?:,\d{3})*)\s*(?:円))'
+    r'|(?=予算[：:]\s*(?P<budget>\d{1,3}(?:,\d{3})*))'
+    r'|(?=契約金額[：:]\s*(?P<contract>\d{1,3}(?:,\d{3})*))'
+)
+
+# 金額グループの優先順（グループ名, 単位倍率）
+BUDGET_GROUPS = (
+    ('man', 10000),
+    ('yen', 1),
+    ('budget', 1),
+    ('contract', 1)
+)
+
+# 締切日パターン
+DEADLINE_PATTERNS = (
+    re.compile(r'締切[：:]?\s*(\d{4})[年/-](\d{1,2})[月/-](\d{1,2})'),
+    re.compile(r'期限[：:]?\s*(\d{4})[年/-](\d{1,2})[月/-](\d{1,2})'),
+    re.compile(r'まで[：:]?\s*(\d{4})[年/-](\d{1,2})[月/-](\d{1,2})'),
+    re.compile(r'(\d{4})[年/-](\d{1,2})[月/-](\d{1,2}).*まで')
+)
+
+# 対象キーワード（マッチ結果はこの順で返す）
+RSS_TARGET_KEYWORDS = (
+    "データ入力", "入力作業", "キッティング", "PC設定",
+    "コールセンター", "電話受付", "事務業務", "システム構築"
+)
+RSS_TARGET_KEYWORDS_LC = tuple((kw, kw.lower()) for kw in RSS_TARGET_KEYWORDS)
+
+# 適合度・キーワード判定に使う全語を一度の走査で検出する
+# （再収集時に同じタイトル・説明文が繰り返し現れるため、小文字化も含めて結果をメモ化）
+_scan_keyword_text = build_keyword_scanner(
+    [*RELEVANCE_KEYWORD_SCORES, *BONUS_KEYWORD_SCORES, *IT_BONUS_WORDS,
+     *(kw_lc for _, kw_lc in RSS_TARGET_KEYWORDS_LC)]
+)
+scan_regions = build_keyword_scanner(REGION_MAPPING)
+
+
+@lru_cache(maxsize=8192)
+def scan_keywords(text: str) -> FrozenSet[str]:
+    """テキストに含まれる適合度・キーワード判定用の語を検出（大文字小文字は区別しない）"""
+    return _scan_keyword_text(text.lower())
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 主要自治体・政府機関のRSS情報
+MUNICIPALITY_RSS_SOURCES = (
+    # 中小企業基盤整備機構（確認済み・実在）
+    {
+        "name": "中小企業基盤整備機構本部",
+        "rss_url": "https://www.smrj.go.jp/org/info/bid/info_bid.xml",
+        "website_url": "https://www.smrj.go.jp/",
+        "type": "agency"
+    },
+    {
+        "name": "中小企業基盤整備機構関東",
+        "rss_url": "https://www.smrj.go.jp/regional_hq/kanto/bid/info_bid.xml",
+        "website_url": "https://www.smrj.go.jp/",
+        "type": "agency"
+    },
+    {
+        "name": "中小企業基盤整備機構九州",
+        "rss_url": "https://www.smrj.go.jp/regional_hq/kyushu/bid/info_bid.xml",
+        "website_url": "https://www.smrj.go.jp/",
+        "type": "agency"
+    },
+    {
+        "name": "中小企業基盤整備機構東北",
+        "rss_url": "https://www.smrj.go.jp/regional_hq/tohoku/bid/info_bid.xml",
+        "website_url": "https://www.smrj.go.jp/",
+        "type": "agency"
+    },
+    {
+        "name": "中小企業基盤整備機構中部",
+        "rss_url": "https://www.smrj.go.jp/regional_hq/chubu/bid/info_bid.xml",
+        "website_url": "https://www.smrj.go.jp/",
+        "type": "agency"
+    },
+    {
+        "name": "中小企業基盤整備機構近畿",
+        "rss_url": "https://www.smrj.go.jp/regional_hq/kinki/bid/info_bid.xml",
+        "website_url": "https://www.smrj.go.jp/",
+        "type": "agency"
+    },
+    # 国土地理院（確認済み・実在）
+    {
+        "name": "国土地理院（物品・サービス）",
+        "rss_url": "https://www.gsi.go.jp/nyusatu1.rdf",
+        "website_url": "https://www.gsi.go.jp/",
+        "type": "government"
+    },
+    {
+        "name": "国土地理院（測量・調査）",
+        "rss_url": "https://www.gsi.go.jp/nyusatu2.rdf",
+        "website_url": "https://www.gsi.go.jp/",
+        "type": "government"
+    },
+    # 産業技術総合研究所（確認済み・実在）
+    {
+        "name": "産業技術総合研究所",
+        "rss_url": "https://www.aist.go.jp/aist_j/procure/supplyinfo/pub/feed/rss.xml",
+        "website_url": "https://www.aist.go.jp/",
+        "type": "research"
+    },
+    # その他政府機関（一般的な報道RSS）
+    {
+        "name": "厚生労働省報道発表",
+        "rss_url": "https://www.mhlw.go.jp/stf/news.rdf",
+        "website_url": "https://www.mhlw.go.jp/",
+        "type": "ministry"
+    },
+    {
+        "name": "総務省報道資料",
+        "rss_url": "https://www.soumu.go.jp/menu_news/news.xml",
+        "website_url": "https://www.soumu.go.jp/",
+        "type": "ministry"
+    },
+    # 地方自治体（都道府県レベル）
+    {
+        "name": "東京都報道発表",
+        "rss_url": "https://www.metro.tokyo.lg.jp/tosei/hodohappyo/press/rss.xml",
+        "website_url": "https://www.metro.tokyo.lg.jp/",
+        "type": "prefecture"
+    },
+    {
+        "name": "大阪府報道発表",
+        "rss_url": "https://www.pref.osaka.lg.jp/rss/event.xml",
+        "website_url": "https://www.pref.osaka.lg.jp/",
+        "type": "prefecture"
+    },
+    {
+        "name": "愛知県報道発表",
+        "rss_url": "https://www.pref.aichi.jp/uploaded/info.xml",
+        "website_url": "https://www.pref.aichi.jp/",
+        "type": "prefecture"
+    },
+    {
+        "name": "福岡県報道発表",
+        "rss_url": "https://www.pref.fukuoka.lg.jp/rss/jigyousya.xml",
+        "website_url": "https://www.pref.fukuoka.lg.jp/",
+        "type": "prefecture"
+    }
+)
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+def get_shared_session() -> requests.Session:
+    """コネクションプールを共有するHTTPセッションを取得"""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _shared_session = session
+        return _shared_session
+
+
 class RSSCollector:
     """自治体RSS収集クラス"""
     
+    # 対象キーワード
+    target_keywords = RSS_TARGET_KEYWORDS
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.headers = DEFAULT_HEADERS
+        # 同一ホスト（SMRJ・国土地理院等）へのTCP/TLS接続をインスタンス間でも使い回す
+        self.session = get_shared_session()
         self.timeout = 10
-        self.delay = 2  # RSS取得間隔（秒）
+        self.delay = 2  # RSS取得間隔（秒、逐次取得時）
+        self.max_connections = 20  # 並行取得時の総接続数
+        self.max_connections_per_host = 2  # 並行取得時の同一ホスト接続数（サーバー負荷軽減）
         
-        # 対象キーワード
-        self.target_keywords = [
-            "データ入力", "入力作業", "キッティング", "PC設定",
-            "コールセンター", "電話受付", "事務業務", "システム構築"
-        ]
+        # 条件付きGET用キャッシュ（URL → ETag/Last-Modified/解析済みエントリ）
+        self.feed_cache_path = 'data/rss_feed_cache.json'
+        self._feed_cache = self._load_feed_cache()
+        self._feed_cache_dirty = False
     
-    def get_major_municipalities_rss(self) -> List[Dict[str, str]]:
+    def get_major_municipalities_rss(self) -> Tuple[Dict[str, str], ...]:
         """主要自治体・政府機関のRSS情報を取得"""
-        return [
-            # 中小企業基盤整備機構（確認済み・実在）
-            {
-                "name": "中小企業基盤整備機構本部",
-                "rss_url": "https://www.smrj.go.jp/org/info/bid/info_bid.xml",
-                "website_url": "https://www.smrj.go.jp/",
-                "type": "agency"
-            },
-            {
-                "name": "中小企業基盤整備機構関東",
-                "rss_url": "https://www.smrj.go.jp/regional_hq/kanto/bid/info_bid.xml",
-                "website_url": "https://www.smrj.go.jp/",
-                "type": "agency"
-            },
-            {
-                "name": "中小企業基盤整備機構九州",
-                "rss_url": "https://www.smrj.go.jp/regional_hq/kyushu/bid/info_bid.xml",
-                "website_url": "https://www.smrj.go.jp/",
-                "type": "agency"
-            },
-            {
-                "name": "中小企業基盤整備機構東北",
-                "rss_url": "https://www.smrj.go.jp/regional_hq/tohoku/bid/info_bid.xml",
-                "website_url": "https://www.smrj.go.jp/",
-                "type": "agency"
-            },
-            {
-                "name": "中小企業基盤整備機構中部",
-                "rss_url": "https://www.smrj.go.jp/regional_hq/chubu/bid/info_bid.xml",
-                "website_url": "https://www.smrj.go.jp/",
-                "type": "agency"
-            },
-            {
-                "name": "中小企業基盤整備機構近畿",
-                "rss_url": "https://www.smrj.go.jp/regional_hq/kinki/bid/info_bid.xml",
-                "website_url": "https://www.smrj.go.jp/",
-                "type": "agency"
-            },
-            # 国土地理院（確認済み・実在）
-            {
-                "name": "国土地理院（物品・サービス）",
-                "rss_url": "https://www.gsi.go.jp/nyusatu1.rdf",
-                "website_url": "https://www.gsi.go.jp/",
-                "type": "government"
-            },
-            {
-                "name": "国土地理院（測量・調査）",
-                "rss_url": "https://www.gsi.go.jp/nyusatu2.rdf",
-                "website_url": "https://www.gsi.go.jp/",
-                "type": "government"
-            },
-            # 産業技術総合研究所（確認済み・実在）
-            {
-                "name": "産業技術総合研究所",
-                "rss_url": "https://www.aist.go.jp/aist_j/procure/supplyinfo/pub/feed/rss.xml",
-                "website_url": "https://www.aist.go.jp/",
-                "type": "research"
-            },
-            # その他政府機関（一般的な報道RSS）
-            {
-                "name": "厚生労働省報道発表",
-                "rss_url": "https://www.mhlw.go.jp/stf/news.rdf",
-                "website_url": "https://www.mhlw.go.jp/",
-                "type": "ministry"
-            },
-            {
-                "name": "総務省報道資料",
-                "rss_url": "https://www.soumu.go.jp/menu_news/news.xml",
-                "website_url": "https://www.soumu.go.jp/",
-                "type": "ministry"
-            },
-            # 地方自治体（都道府県レベル）
-            {
-                "name": "東京都報道発表",
-                "rss_url": "https://www.metro.tokyo.lg.jp/tosei/hodohappyo/press/rss.xml",
-                "website_url": "https://www.metro.tokyo.lg.jp/",
-                "type": "prefecture"
-            },
-            {
-                "name": "大阪府報道発表",
-                "rss_url": "https://www.pref.osaka.lg.jp/rss/event.xml",
-                "website_url": "https://www.pref.osaka.lg.jp/",
-                "type": "prefecture"
-            },
-            {
-                "name": "愛知県報道発表",
-                "rss_url": "https://www.pref.aichi.jp/uploaded/info.xml",
-                "website_url": "https://www.pref.aichi.jp/",
-                "type": "prefecture"
-            },
-            {
-                "name": "福岡県報道発表",
-                "rss_url": "https://www.pref.fukuoka.lg.jp/rss/jigyousya.xml",
-                "website_url": "https://www.pref.fukuoka.lg.jp/",
-                "type": "prefecture"
-            }
-        ]
+        return MUNICIPALITY_RSS_SOURCES
     
     def collect_from_rss(self, rss_info: Dict[str, str]) -> List[Dict[str, Any]]:
         """指定されたRSSから入札情報を収集"""
-        collected_entries = []
+        return list(self.iter_from_rss(rss_info))
+    
+    def iter_from_rss(self, rss_info: Dict[str, str], max_qualifying: int = 20) -> Iterator[Dict[str, Any]]:
+        """指定されたRSSから入札情報を逐次返す
         
+        条件を満たすエントリがmax_qualifying件に達した時点で処理を打ち切る。
+        """
         try:
             logger.info(f"RSS収集開始: {rss_info['name']} - {rss_info['rss_url']}")
             
-            # RSS取得
-            response = self.session.get(rss_info['rss_url'], timeout=self.timeout)
-            response.raise_for_status()
-            
-            # RSS解析
-            if HAS_FEEDPARSER:
-                feed = feedparser.parse(response.content)
-            else:
-                # フォールバック解析
-                logger.warning("feedparserが利用できません。基本的な解析を使用します。")
-                return []
-            
-            if not feed.entries:
-                logger.warning(f"RSSエントリが見つかりません: {rss_info['name']}")
-                return []
+            # RSS取得（本文をバッファせずストリームのまま解析に渡す）
+            with self.session.get(
+                rss_info['rss_url'],
+                headers=self._conditional_headers(rss_info['rss_url']),
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                # 未更新の場合は前回の解析結果を使用
+                if response.status_code == 304:
+                    yield from self._cached_entries(rss_info)[:max_qualifying]
+                    return
+                
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                if not HAS_FEEDPARSER:
+                    # フォールバック解析
+                    logger.warning("feedparserが利用できません。基本的な解析を使用します。")
+                    return
+                
+                # RSS解析
+                feed = parse_feed_bytes(response.raw)
+                response_headers = response.headers
             
-            # エントリ処理
-            for entry in feed.entries[:20]:  # 最新20件まで
-                processed_entry = self._process_rss_entry(entry, rss_info)
-                if processed_entry:
-                    collected_entries.append(processed_entry)
+            # エントリ処理（呼び出し側が途中で打ち切った場合はキャッシュを更新しない）
+            collected_entries = []
+            for processed_entry in islice(self._iter_feed_entries(feed, rss_info), max_qualifying):
+                collected_entries.append(processed_entry)
+                yield processed_entry
             
+            self._update_feed_cache(rss_info['rss_url'], response_headers, collected_entries)
             logger.info(f"RSS収集完了: {rss_info['name']} - {len(collected_entries)}件")
             
         except requests.RequestException as e:
             logger.error(f"RSS取得エラー: {rss_info['name']} - {e}")
         except Exception as e:
             logger.error(f"RSS処理エラー: {rss_info['name']} - {e}")
+    
+    async def _fetch_rss_async(self, session: "aiohttp.ClientSession", index: int, rss_info: Dict[str, str],
+                               parse_queue: "asyncio.Queue", results: List[Any]):
+        """指定されたRSSを取得し、解析キューへ渡す（非同期）
+        
+        未更新（304）や取得エラーの場合はキューを経由せずresultsに結果を格納する。
+        """
+        results[index] = []
         
+        try:
+            logger.info(f"RSS収集開始: {rss_info['name']} - {rss_info['rss_url']}")
+            
+            # RSS取得
+            async with session.get(
+                rss_info['rss_url'],
+                headers=self._conditional_headers(rss_info['rss_url'])
+            ) as response:
+                # 未更新の場合は前回の解析結果を使用
+                if response.status == 304:
+                    results[index] = self._cached_entries(rss_info)
+                    return
+                
+                response.raise_for_status()
+                content = await response.read()
+                response_headers = response.headers
+            
+            # 解析待ちが上限に達している間は待機（保持する本文の量を抑える）
+            await parse_queue.put((index, rss_info, content, response_headers))
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"RSS取得エラー: {rss_info['name']} - {e}")
+    
+    async def _parse_queued_feeds(self, parse_queue: "asyncio.Queue", results: List[Any]):
+        """解析キューのフィードを単一のタスクで順に解析する（Noneで終了）
+        
+        feedparserによる解析はイベントループの既定のスレッドプールで行い、他フィードのダウンロードと重ねる。
+        （プロセスプールでは不正なフィードのbozo_exceptionを返せずエントリが失われるため使わない）
+        """
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            item = await parse_queue.get()
+            if item is None:
+                break
+            
+            index, rss_info, content, response_headers = item
+            try:
+                # RSS解析
+                feed = await loop.run_in_executor(None, parse_feed_bytes, content)
+                results[index] = self._process_feed_entries(feed, rss_info)
+                self._update_feed_cache(rss_info['rss_url'], response_headers, results[index])
+            except Exception as e:
+                logger.error(f"RSS処理エラー: {rss_info['name']} - {e}")
+    
+    def _load_feed_cache(self) -> Dict[str, Dict[str, Any]]:
+        """条件付きGET用キャッシュを読み込む"""
+        try:
+            with open(self.feed_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_feed_cache(self):
+        """条件付きGET用キャッシュを保存（変更があった場合のみ）"""
+        if not self._feed_cache_dirty:
+            return
+        
+        try:
+            cache_dir = os.path.dirname(self.feed_cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            with open(self.feed_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._feed_cache, f, ensure_ascii=False)
+            self._feed_cache_dirty = False
+        except OSError as e:
+            logger.warning(f"RSSキャッシュ保存エラー: {e}")
+    
+    def _conditional_headers(self, rss_url: str) -> Dict[str, str]:
+        """前回取得時のETag/Last-Modifiedから条件付きGETヘッダーを作成"""
+        cached = self._feed_cache.get(rss_url)
+        if not cached:
+            return {}
+        
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def _cached_entries(self, rss_info: Dict[str, str]) -> List[Dict[str, Any]]:
+        """未更新フィードについて前回の解析結果を返す"""
+        entries = self._feed_cache.get(rss_info['rss_url'], {}).get('entries', [])
+        logger.info(f"RSS未更新（キャッシュ使用）: {rss_info['name']} - {len(entries)}件")
+        return [dict(entry) for entry in entries]
+    
+    def _update_feed_cache(self, rss_url: str, headers: Any, entries: List[Dict[str, Any]]):
+        """取得結果のETag/Last-Modifiedと解析結果をキャッシュに記録"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        
+        if etag or last_modified:
+            self._feed_cache[rss_url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'entries': entries
+            }
+            self._feed_cache_dirty = True
+        elif self._feed_cache.pop(rss_url, None) is not None:
+            self._feed_cache_dirty = True
+    
+    def _process_feed_entries(self, feed: Any, rss_info: Dict[str, str], max_qualifying: int = 20) -> List[Dict[str, Any]]:
+        """解析済みフィードのエントリを統一形式に変換"""
+        collected_entries = list(islice(self._iter_feed_entries(feed, rss_info), max_qualifying))
+        logger.info(f"RSS収集完了: {rss_info['name']} - {len(collected_entries)}件")
         return collected_entries
     
+    def _iter_feed_entries(self, feed: Any, rss_info: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+        """解析済みフィードのエントリを統一形式に変換して逐次返す"""
+        if not feed.entries:
+            logger.warning(f"RSSエントリが見つかりません: {rss_info['name']}")
+            return
+        
+        # エントリ処理
+        for entry in feed.entries[:20]:  # 最新20件まで
+            processed_entry = self._process_rss_entry(entry, rss_info)
+            if processed_entry:
+                yield processed_entry
+    
     def _process_rss_entry(self, entry: Any, rss_info: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """RSSエントリを処理して統一形式に変換"""
         try:
@@ -183,8 +550,9 @@ class RSSCollector:
             if not title:
                 return None
             
-            # キーワードフィルタリング
-            relevance_score = self._calculate_relevance_score(title)
+            # キーワードフィルタリング（タイトルのみで判定）
+            title_hits = scan_keywords(title)
+            relevance_score = self._score_keyword_hits(title_hits)
             if relevance_score < 30:  # 最低閾値
                 return None
             
@@ -195,8 +563,8 @@ class RSSCollector:
             elif hasattr(entry, 'description'):
                 description = entry.description
             
-            # HTML除去
-            description = self._clean_html(description)
+            # HTML除去（フィードの大きさに依らずコストを抑えるため先に切り詰める）
+            description = self._clean_html(description[:RAW_DESCRIPTION_MAX_LENGTH])
             
             # URL取得
             source_url = getattr(entry, 'link', '')
@@ -210,14 +578,19 @@ class RSSCollector:
             region = self._extract_region(rss_info['name'])
             
             # 予算情報抽出
-            budget_amount = self._extract_budget(title + " " + description)
+            full_text = title + " " + description
+            budget_amount = self._extract_budget(full_text)
             
             # 締切日抽出
             deadline_date = self._extract_deadline(description)
             
+            # マッチしたキーワード（タイトルの走査結果を再利用）
+            hits = title_hits | scan_keywords(description)
+            keywords_matched = self._matched_target_keywords(hits)
+            
             return {
                 "title": title[:500],  # 長さ制限
-                "description": description[:2000],  # 長さ制限
+                "description": description[:DESCRIPTION_MAX_LENGTH],  # 長さ制限
                 "organization": rss_info['name'],
                 "region": region,
                 "budget_amount": budget_amount,
@@ -226,7 +599,7 @@ class RSSCollector:
                 "source_url": source_url,
                 "source_type": "rss",
                 "relevance_score": relevance_score,
-                "keywords_matched": self._get_matched_keywords(title + " " + description),
+                "keywords_matched": keywords_matched,
                 "processed": False,
                 "notified": False
             }
@@ -237,96 +610,60 @@ class RSSCollector:
     
     def _calculate_relevance_score(self, text: str) -> int:
         """適合度スコアを計算"""
-        text_lower = text.lower()
-        score = 0
-        matched_keywords = []
-        
+        return self._score_keyword_hits(scan_keywords(text))
+    
+    def _score_keyword_hits(self, hits: FrozenSet[str]) -> int:
+        """検出済みの語集合から適合度スコアを計算"""
         # キーワードマッチング
-        keyword_scores = {
-            "データ入力": 25,
-            "入力作業": 25,
-            "キッティング": 30,
-            "pc設定": 25,
-            "コールセンター": 30,
-            "電話受付": 20,
-            "事務業務": 15,
-            "システム構築": 20,
-            "運用保守": 15,
-            "業務委託": 10,
-            "アウトソーシング": 10
-        }
-        
-        for keyword, points in keyword_scores.items():
-            if keyword in text_lower:
-                score += points
-                matched_keywords.append(keyword)
+        score = sum(RELEVANCE_KEYWORD_SCORES.get(word, 0) for word in hits)
         
         # ボーナス条件
-        if "委託" in text_lower:
-            score += 5
-        if "業務" in text_lower:
-            score += 5
-        if any(word in text_lower for word in ["it", "システム", "コンピュータ"]):
-            score += 10
+        score += sum(BONUS_KEYWORD_SCORES.get(word, 0) for word in hits)
+        if not IT_BONUS_WORDS.isdisjoint(hits):
+            score += IT_BONUS_SCORE
         
-        return min(score, 100)  # 最大100点
+        return min(score, MAX_RELEVANCE_SCORE)  # 最大100点
     
     def _get_matched_keywords(self, text: str) -> List[str]:
         """マッチしたキーワードのリストを取得"""
-        text_lower = text.lower()
-        matched = []
-        
-        for keyword in self.target_keywords:
-            if keyword.lower() in text_lower:
-                matched.append(keyword)
-        
-        return matched
+        return self._matched_target_keywords(scan_keywords(text))
+    
+    def _matched_target_keywords(self, hits: FrozenSet[str]) -> List[str]:
+        """検出済みの語集合から対象キーワードを定義順に抽出"""
+        return [keyword for keyword, keyword_lc in RSS_TARGET_KEYWORDS_LC if keyword_lc in hits]
     
     def _clean_html(self, text: str) -> str:
         """HTMLタグを除去"""
         if not text:
             return ""
         
-        # HTMLタグ除去
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # HTMLエンティティ変換
-        html_entities = {
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&#39;': "'",
-            '&nbsp;': ' '
-        }
-        
-        for entity, char in html_entities.items():
-            text = text.replace(entity, char)
+        # HTMLタグ除去・エンティティ変換
+        text = strip_html(text)
         
         # 余分な空白除去
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = WHITESPACE_PATTERN.sub(' ', text).strip()
         
         return text
     
     def _parse_date(self, entry: Any) -> str:
         """RSSエントリから日付を解析"""
         try:
+            # FeedParserDictはdictのサブクラスのため、属性アクセスを経由せずキーで参照する
+            get = entry.get if isinstance(entry, dict) else lambda key: getattr(entry, key, None)
+            
             # published, updated, pubDate等を確認
-            for attr in ['published', 'updated', 'pubdate']:
-                if hasattr(entry, attr):
-                    date_str = getattr(entry, attr)
-                    if date_str:
-                        # feedparserが解析した時間構造体を使用
-                        if hasattr(entry, f'{attr}_parsed') and getattr(entry, f'{attr}_parsed'):
-                            time_struct = getattr(entry, f'{attr}_parsed')
-                            return datetime(*time_struct[:6]).strftime('%Y-%m-%d')
-                        
-                        # 文字列から解析を試行
-                        try:
-                            parsed_date = datetime.strptime(date_str[:10], '%Y-%m-%d')
-                            return parsed_date.strftime('%Y-%m-%d')
-                        except:
-                            continue
+            for attr, parsed_attr in DATE_FIELDS:
+                date_str = get(attr)
+                if date_str:
+                    # feedparserが解析した時間構造体を使用
+                    time_struct = get(parsed_attr)
+                    if time_struct:
+                        return datetime(*time_struct[:6]).strftime('%Y-%m-%d')
+                    
+                    # 文字列から解析を試行
+                    parsed_date = parse_date_string(date_str)
+                    if parsed_date:
+                        return parsed_date
             
             # デフォルトは今日の日付
             return datetime.now().strftime('%Y-%m-%d')
@@ -336,64 +673,28 @@ class RSSCollector:
     
     def _extract_region(self, organization_name: str) -> str:
         """組織名から地域を抽出"""
-        region_mapping = {
-            # 都道府県レベル
-            "東京都": "東京都",
-            "大阪府": "大阪府", 
-            "愛知県": "愛知県",
-            "福岡県": "福岡県",
-            "神奈川県": "神奈川県",
-            "北海道": "北海道",
-            "京都府": "京都府",
-            "宮崎県": "宮崎県",
-            
-            # 政令指定都市
-            "大阪市": "大阪府",
-            "横浜市": "神奈川県", 
-            "福岡市": "福岡県",
-            "札幌市": "北海道",
-            "京都市": "京都府",
-            
-            # 政府機関・独立行政法人
-            "中小企業基盤整備機構本部": "全国",
-            "中小企業基盤整備機構関東": "関東地方",
-            "中小企業基盤整備機構九州": "九州地方", 
-            "中小企業基盤整備機構東北": "東北地方",
-            "中小企業基盤整備機構中部": "中部地方",
-            "中小企業基盤整備機構近畿": "近畿地方",
-            "国土地理院": "全国",
-            "産業技術総合研究所": "全国",
-            "厚生労働省": "全国",
-            "総務省": "全国"
-        }
-        
-        # 部分マッチング検索
-        for key, value in region_mapping.items():
-            if key in organization_name:
-                return value
+        # 部分マッチング検索（複数一致時は定義順で先のものを優先）
+        hits = scan_regions(organization_name)
+        if hits:
+            return REGION_MAPPING[min(hits, key=REGION_PRIORITY.__getitem__)]
         
         return "全国"
     
     def _extract_budget(self, text: str) -> Optional[int]:
         """テキストから予算金額を抽出"""
         try:
-            # 金額パターン検索
-            patterns = [
-                r'(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:万円|万)',
-                r'(\d{1,3}(?:,\d{3})*)\s*(?:円)',
-                r'予算[：:]\s*(\d{1,3}(?:,\d{3})*)',
-                r'契約金額[：:]\s*(\d{1,3}(?:,\d{3})*)'
-            ]
+            # 金額パターン検索（各パターンの最初の一致を一度の走査で収集）
+            first_matches = {}
+            for match in BUDGET_PATTERN.finditer(text):
+                first_matches.setdefault(match.lastgroup, match.group(match.lastgroup))
             
-            for pattern in patterns:
-                matches = re.findall(pattern, text)
-                if matches:
-                    amount_str = matches[0].replace(',', '')
-                    amount = int(amount_str)
+            for group, multiplier in BUDGET_GROUPS:
+                amount_str = first_matches.get(group)
+                if amount_str:
+                    amount = int(amount_str.replace(',', ''))
                     
                     # 万円単位の場合
-                    if '万' in pattern:
-                        amount *= 10000
+                    amount *= multiplier
                     
                     if 1000 <= amount <= 1000000000:  # 妥当な範囲
                         return amount
@@ -407,17 +708,10 @@ class RSSCollector:
         """テキストから締切日を抽出"""
         try:
             # 日付パターン検索
-            patterns = [
-                r'締切[：:]?\s*(\d{4})[年/-](\d{1,2})[月/-](\d{1,2})',
-                r'期限[：:]?\s*(\d{4})[年/-](\d{1,2})[月/-](\d{1,2})',
-                r'まで[：:]?\s*(\d{4})[年/-](\d{1,2})[月/-](\d{1,2})',
-                r'(\d{4})[年/-](\d{1,2})[月/-](\d{1,2}).*まで'
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, text)
-                if matches:
-                    year, month, day = matches[0]
+            for pattern in DEADLINE_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    year, month, day = match.groups()
                     try:
                         date = datetime(int(year), int(month), int(day))
                         # 未来の日付のみ有効
@@ -444,6 +738,21 @@ class RSSCollector:
         
         logger.info(f"RSS収集開始: {len(rss_sources)}の自治体")
         
+        if HAS_AIOHTTP:
+            # 全フィードを並行取得（同一ホストへの同時接続数で負荷を制御）
+            results = asyncio.run(self._collect_all_async(rss_sources))
+            
+            for i, (rss_info, entries) in enumerate(zip(rss_sources, results)):
+                if isinstance(entries, BaseException):
+                    logger.error(f"RSS収集エラー: {rss_info['name']} - {entries}")
+                    continue
+                all_entries.extend(entries)
+                logger.info(f"進捗: {i+1}/{len(rss_sources)} - {rss_info['name']}: {len(entries)}件")
+            
+            self._save_feed_cache()
+            logger.info(f"RSS収集完了: 総計{len(all_entries)}件")
+            return all_entries
+        
         for i, rss_info in enumerate(rss_sources):
             try:
                 # 収集実行
@@ -461,8 +770,36 @@ class RSSCollector:
                 logger.error(f"RSS収集エラー: {rss_info['name']} - {e}")
                 continue
         
+        self._save_feed_cache()
         logger.info(f"RSS収集完了: 総計{len(all_entries)}件")
         return all_entries
+    
+    async def _collect_all_async(self, rss_sources: List[Dict[str, str]]) -> List[Any]:
+        """単一の aiohttp.ClientSession で全RSSを並行収集"""
+        # requestsのtimeoutと同じく接続・読み込みごとの制限とする（全体の制限では
+        # 同一ホストの接続数制限による接続待ちも含まれ、後続のフィードが開始前にタイムアウトする）
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host
+        )
+        results: List[Any] = [[] for _ in rss_sources]
+        parse_queue: asyncio.Queue = asyncio.Queue(maxsize=PARSE_QUEUE_SIZE)
+        
+        async with aiohttp.ClientSession(headers=self.headers, timeout=timeout, connector=connector) as session:
+            consumer = asyncio.create_task(self._parse_queued_feeds(parse_queue, results))
+            outcomes = await asyncio.gather(
+                *[self._fetch_rss_async(session, index, rss_info, parse_queue, results)
+                  for index, rss_info in enumerate(rss_sources)],
+                return_exceptions=True
+            )
+            await parse_queue.put(None)
+            await consumer
+        
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                results[index] = outcome
+        return results
 
 
 class RSSCollectorTester:
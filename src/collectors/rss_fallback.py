@@ -6,13 +6,51 @@ feedparserが利用できない環境での代替実装
 import urllib.request
 import urllib.parse
 import re
+import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 import time
+from html import unescape
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, BinaryIO
 import logging
 
 logger = logging.getLogger(__name__)
 
+# フィード要素（名前空間除去後のローカル名）
+ENTRY_TAGS = frozenset(('item', 'entry'))
+FEED_INFO_TAGS = frozenset(('title', 'description'))
+SUMMARY_TAGS = ('description', 'summary', 'content')
+DATE_TAGS = ('pubDate', 'published', 'updated')
+
+# テキストクリーニング用パターン
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+CDATA_PATTERN = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def strip_html(text: str) -> str:
+    """HTMLタグを除去してエンティティを変換
+    
+    lxmlが利用可能な場合はlibxml2のHTMLパーサーでテキストを取り出す。
+    マークアップを含まないテキストや解析に失敗した場合は正規表現で処理する。
+    """
+    if HAS_LXML and ('<' in text or '&' in text):
+        try:
+            return lxml_html.fragment_fromstring(text, create_parent='div').text_content()
+        except (lxml_etree.ParserError, ValueError):
+            pass
+    
+    return unescape(HTML_TAG_PATTERN.sub('', text))
+
+
+# 日付抽出パターン
+SIMPLE_DATE_PATTERN = re.compile(r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})')
+
 class SimpleFeedParser:
     """シンプルなフィードパーサー（feedparser代替）"""
     
@@ -24,114 +62,95 @@ class SimpleFeedParser:
     
     def parse_feed(self, url: str) -> Dict[str, Any]:
         """フィードを解析してエントリを返す"""
+        feed_info: Dict[str, str] = {}
         try:
-            # RSS取得
+            # RSS取得（レスポンスを直接ストリーム解析）
             req = urllib.request.Request(url, headers=self.session_headers)
             with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                content = response.read().decode('utf-8', errors='ignore')
+                entries = list(self._iter_feed(response, feed_info))
             
-            # 基本的なフィード情報
-            feed_info = {
-                'feed': self._extract_feed_info(content),
-                'entries': self._extract_entries(content)
-            }
-            
-            return feed_info
+            return {'feed': feed_info, 'entries': entries}
             
         except Exception as e:
             logger.error(f"フィード取得エラー: {url} - {e}")
             return {'feed': {}, 'entries': []}
     
-    def _extract_feed_info(self, content: str) -> Dict[str, str]:
-        """フィード基本情報を抽出"""
-        info = {}
-        
-        # タイトル抽出
-        title_match = re.search(r'<title[^>]*>(.*?)</title>', content, re.DOTALL | re.IGNORECASE)
-        if title_match:
-            info['title'] = self._clean_text(title_match.group(1))
-        
-        # 説明抽出
-        desc_match = re.search(r'<description[^>]*>(.*?)</description>', content, re.DOTALL | re.IGNORECASE)
-        if desc_match:
-            info['description'] = self._clean_text(desc_match.group(1))
+    def iter_entries(self, url: str) -> Iterator[Dict[str, Any]]:
+        """フィードのエントリを逐次返す（必要件数で打ち切り可能）"""
+        try:
+            req = urllib.request.Request(url, headers=self.session_headers)
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                yield from self._iter_feed(response, {})
         
-        return info
+        except Exception as e:
+            logger.error(f"フィード取得エラー: {url} - {e}")
     
-    def _extract_entries(self, content: str) -> List[Dict[str, Any]]:
-        """エントリを抽出"""
-        entries = []
+    def _iter_feed(self, source: BinaryIO, feed_info: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+        """iterparseでフィードを走査し、エントリを逐次返す
+        
+        チャンネルのタイトル・説明はfeed_infoに格納する。
+        解析済みのエントリ要素はclear()してメモリを解放する。
+        """
+        entry_depth = 0
         
         try:
-            # <item>または<entry>タグを検索
-            item_patterns = [
-                r'<item[^>]*>(.*?)</item>',
-                r'<entry[^>]*>(.*?)</entry>'
-            ]
-            
-            for pattern in item_patterns:
-                matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                tag = elem.tag.rpartition('}')[2]
                 
-                for match in matches:
-                    entry = self._parse_entry(match)
+                if event == 'start':
+                    if tag in ENTRY_TAGS:
+                        entry_depth += 1
+                    continue
+                
+                if tag in ENTRY_TAGS:
+                    entry_depth -= 1
+                    entry = self._parse_entry(elem)
+                    elem.clear()
                     if entry:
-                        entries.append(entry)
+                        yield entry
                 
-                if matches:
-                    break  # 最初にマッチしたパターンを使用
+                elif not entry_depth and tag in FEED_INFO_TAGS and tag not in feed_info:
+                    # フィード基本情報（最初に出現したもの）
+                    feed_info[tag] = self._clean_text(''.join(elem.itertext()))
         
-        except Exception as e:
-            logger.error(f"エントリ抽出エラー: {e}")
-        
-        return entries
+        except ET.ParseError as e:
+            logger.warning(f"フィード解析を中断しました（不正なXML）: {e}")
     
-    def _parse_entry(self, entry_content: str) -> Optional[Dict[str, Any]]:
-        """個別エントリを解析"""
+    def _parse_entry(self, elem: ET.Element) -> Optional[Dict[str, Any]]:
+        """個別エントリ要素を解析"""
         try:
             entry = {}
+            fields: Dict[str, ET.Element] = {}
             
-            # タイトル
-            title_match = re.search(r'<title[^>]*>(.*?)</title>', entry_content, re.DOTALL | re.IGNORECASE)
-            if title_match:
-                entry['title'] = self._clean_text(title_match.group(1))
+            # 子要素をローカル名ごとに一度だけ記録（最初の要素を優先）
+            for child in elem:
+                fields.setdefault(child.tag.rpartition('}')[2], child)
             
-            # リンク
-            link_patterns = [
-                r'<link[^>]*href=["\']([^"\']*)["\']',
-                r'<link[^>]*>(.*?)</link>',
-                r'<guid[^>]*>(.*?)</guid>'
-            ]
+            # タイトル
+            title = fields.get('title')
+            if title is not None:
+                entry['title'] = self._clean_text(''.join(title.itertext()))
             
-            for pattern in link_patterns:
-                link_match = re.search(pattern, entry_content, re.DOTALL | re.IGNORECASE)
-                if link_match:
-                    entry['link'] = link_match.group(1).strip()
-                    break
+            # リンク（Atomはhref属性、RSSは要素テキスト、なければguid）
+            link = fields.get('link')
+            link_text = None
+            if link is not None:
+                link_text = link.get('href') or link.text
+            if not link_text and 'guid' in fields:
+                link_text = fields['guid'].text
+            if link_text:
+                entry['link'] = link_text.strip()
             
             # 説明
-            desc_patterns = [
-                r'<description[^>]*>(.*?)</description>',
-                r'<summary[^>]*>(.*?)</summary>',
-                r'<content[^>]*>(.*?)</content>'
-            ]
-            
-            for pattern in desc_patterns:
-                desc_match = re.search(pattern, entry_content, re.DOTALL | re.IGNORECASE)
-                if desc_match:
-                    entry['summary'] = self._clean_text(desc_match.group(1))
+            for tag in SUMMARY_TAGS:
+                if tag in fields:
+                    entry['summary'] = self._clean_text(''.join(fields[tag].itertext()))
                     break
             
             # 公開日
-            date_patterns = [
-                r'<pubDate[^>]*>(.*?)</pubDate>',
-                r'<published[^>]*>(.*?)</published>',
-                r'<updated[^>]*>(.*?)</updated>'
-            ]
-            
-            for pattern in date_patterns:
-                date_match = re.search(pattern, entry_content, re.DOTALL | re.IGNORECASE)
-                if date_match:
-                    entry['published'] = date_match.group(1).strip()
+            for tag in DATE_TAGS:
+                if tag in fields and fields[tag].text:
+                    entry['published'] = fields[tag].text.strip()
                     break
             
             return entry if entry.get('title') else None
@@ -145,28 +164,14 @@ class SimpleFeedParser:
         if not text:
             return ""
         
-        # HTMLタグ除去
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # HTMLエンティティ変換
-        replacements = {
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&#39;': "'",
-            '&nbsp;': ' ',
-            '&apos;': "'"
-        }
-        
-        for entity, char in replacements.items():
-            text = text.replace(entity, char)
+        # HTMLタグ除去・エンティティ変換
+        text = strip_html(text)
         
         # CDATA除去
-        text = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', text, flags=re.DOTALL)
+        text = CDATA_PATTERN.sub(r'\1', text)
         
         # 余分な空白除去
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = WHITESPACE_PATTERN.sub(' ', text).strip()
         
         return text
 
@@ -210,16 +215,17 @@ class FallbackRSSCollector:
             try:
                 logger.info(f"収集中: {source['name']}")
                 
-                # フィード解析
-                feed_data = self.parser.parse_feed(source['rss_url'])
-                
-                # エントリ処理
-                for entry in feed_data.get('entries', [])[:10]:  # 最大10件
+                # フィードを逐次解析し、最大10件で打ち切る
+                entry_count = 0
+                for entry in self.parser.iter_entries(source['rss_url']):
+                    entry_count += 1
                     processed_entry = self._process_fallback_entry(entry, source)
                     if processed_entry:
                         all_entries.append(processed_entry)
-                
-                logger.info(f"収集完了: {source['name']} - {len(feed_data.get('entries', []))}件")
+                    if entry_count >= 10:
+                        break
+
+                logger.info(f"収集完了: {source['name']} - {entry_count}件")
                 
                 # 間隔をあける
                 time.sleep(self.delay)
@@ -301,7 +307,7 @@ class FallbackRSSCollector:
                 return datetime.now().strftime('%Y-%m-%d')
             
             # 簡単な日付抽出
-            date_match = re.search(r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})', date_str)
+            date_match = SIMPLE_DATE_PATTERN.search(date_str)
             if date_match:
                 year, month, day = date_match.groups()
                 try:
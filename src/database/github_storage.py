@@ -7,8 +7,88 @@ import os
 import json
 import sqlite3
 import base64
+import gzip
+import shutil
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+try:
+    import zstandard
+    HAS_ZSTANDARD = True
+except ImportError:
+    HAS_ZSTANDARD = False
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, BinaryIO
+
+# インポート時に一度のexecutemanyで挿入する行数
+IMPORT_BATCH_SIZE = 10000
+
+# エクスポート時に一度に取得する行数
+EXPORT_FETCH_SIZE = 5000
+
+# オンラインバックアップAPIで一度にコピーするページ数
+BACKUP_PAGES_PER_STEP = 1024
+
+# バックアップの圧縮（zstandardがなければgzip）
+ZSTD_LEVEL = 3
+COMPRESSION_SUFFIX = '.zst' if HAS_ZSTANDARD else '.gz'
+COMPRESSION_SUFFIXES = ('.zst', '.gz')
+
+# バックアップファイルの拡張子（.dbはSQLiteファイル、.jsonは人が確認するための形式。圧縮版を含む）
+BACKUP_FORMATS = ('.db', '.json')
+BACKUP_EXTENSIONS = BACKUP_FORMATS + tuple(
+    backup_format + suffix for backup_format in BACKUP_FORMATS for suffix in COMPRESSION_SUFFIXES
+)
+
+# 圧縮・展開時のコピー単位
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# 実行中のデータベースを置くtmpfs（永続化はバックアップで行うためfsyncは不要）
+TMPFS_DIR = "/dev/shm"
+
+
+def dumps_json(obj: Any) -> bytes:
+    """JSONをUTF-8バイト列へシリアライズ（orjsonがあれば使用）"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(data: bytes) -> Any:
+    """UTF-8バイト列のJSONを読み込む（orjsonがあれば使用）"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def open_backup_file(path: str, mode: str) -> BinaryIO:
+    """拡張子に応じて圧縮ストリームとしてバックアップファイルを開く（mode は 'rb' または 'wb'）"""
+    if path.endswith('.zst'):
+        if not HAS_ZSTANDARD:
+            raise RuntimeError(f"zstandardがインストールされていないため展開できません: {path}")
+        if mode == 'wb':
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, 'wb'))
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'))
+    
+    if path.endswith('.gz'):
+        return gzip.open(path, mode)
+    
+    return open(path, mode)
+
+
+def quote_identifier(name: str) -> str:
+    """SQLの識別子（テーブル名・列名）を二重引用符で囲む"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def strip_compression_suffix(filename: str) -> str:
+    """圧縮拡張子を除いたファイル名を返す"""
+    for suffix in COMPRESSION_SUFFIXES:
+        if filename.endswith(suffix):
+            return filename[:-len(suffix)]
+    return filename
 
 class GitHubStorageManager:
     """GitHub Actions環境でのデータ永続化管理"""
@@ -18,6 +98,9 @@ class GitHubStorageManager:
         self.backup_dir = "database_backups"
         self.max_backups = 30  # 30日分のバックアップを保持
         
+        # テーブル名と列名のキャッシュ（実行中にスキーマは変わらないため一度だけ取得し、復元時に破棄する）
+        self._table_columns: Optional[Dict[str, List[str]]] = None
+        
     def create_backup_directory(self):
         """バックアップディレクトリを作成"""
         if not os.path.exists(self.backup_dir):
@@ -30,7 +113,6 @@ class GitHubStorageManager:
         
         try:
             conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
             # エクスポートデータ構造
@@ -43,20 +125,10 @@ class GitHubStorageManager:
             }
             
             # 全テーブルの取得
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = cursor.fetchall()
-            
-            for table in tables:
-                table_name = table["name"]
-                
+            for table_name in self.get_table_columns(conn):
                 # テーブルデータの取得
-                cursor.execute(f"SELECT * FROM {table_name}")
-                rows = cursor.fetchall()
-                
-                # 辞書形式に変換
-                export_data["tables"][table_name] = [
-                    dict(row) for row in rows
-                ]
+                rows = list(self._iter_table_rows(conn, table_name))
+                export_data["tables"][table_name] = rows
                 
                 print(f"エクスポート: {table_name} テーブル ({len(rows)}件)")
             
@@ -67,38 +139,127 @@ class GitHubStorageManager:
             print(f"データベースエクスポートエラー: {e}")
             return {"tables": {}, "metadata": {"export_date": datetime.now().isoformat(), "error": str(e)}}
     
+    def get_table_columns(self, conn: sqlite3.Connection) -> Dict[str, List[str]]:
+        """テーブル名ごとの列名リストを返す（初回のみsqlite_masterとPRAGMA table_infoを参照）"""
+        if self._table_columns is None:
+            tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+            self._table_columns = {
+                table_name: [row[1] for row in conn.execute(f"PRAGMA table_info({quote_identifier(table_name)})")]
+                for table_name in tables
+            }
+        return self._table_columns
+    
+    def invalidate_table_cache(self):
+        """テーブル名・列名のキャッシュを破棄（復元などでスキーマが変わった後に呼ぶ）"""
+        self._table_columns = None
+    
+    def _iter_table_rows(self, conn: sqlite3.Connection, table_name: str):
+        """テーブルの行を辞書として逐次返す（キャッシュ済みの列名で明示的にSELECTし、fetchmanyで分割取得）"""
+        columns = self.get_table_columns(conn)[table_name]
+        column_list = ', '.join(quote_identifier(column) for column in columns)
+        cursor = conn.execute(f"SELECT {column_list} FROM {quote_identifier(table_name)}")
+        
+        while True:
+            rows = cursor.fetchmany(EXPORT_FETCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
+    
+    def write_database_json(self, f) -> Dict[str, int]:
+        """データベースをJSONとしてバイナリファイルへ逐次書き出し、テーブルごとの件数を返す
+        
+        全行をメモリに展開せず、行単位でシリアライズして書き込む。
+        """
+        metadata = {
+            "export_date": datetime.now().isoformat(),
+            "version": "1.0"
+        }
+        f.write(b'{\n"metadata": ' + dumps_json(metadata) + b',\n"tables": {')
+        
+        counts = {}
+        if os.path.exists(self.db_path):
+            conn = sqlite3.connect(self.db_path)
+            try:
+                # 全テーブルの取得
+                for index, table_name in enumerate(self.get_table_columns(conn)):
+                    f.write((b',' if index else b'') + b'\n' + dumps_json(table_name) + b': [')
+                    
+                    count = 0
+                    for row in self._iter_table_rows(conn, table_name):
+                        f.write((b',\n' if count else b'\n') + dumps_json(row))
+                        count += 1
+                    f.write(b'\n]' if count else b']')
+                    
+                    counts[table_name] = count
+                    print(f"エクスポート: {table_name} テーブル ({count}件)")
+            finally:
+                conn.close()
+        
+        f.write(b'\n}\n}\n')
+        return counts
+    
     def import_database_from_json(self, import_data: Dict[str, Any]) -> bool:
         """JSONファイルからデータベースをインポート"""
         try:
-            # データベース初期化
-            from scripts.init_sqlite import create_database
-            create_database(self.db_path)
-            
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
+            # スキーマが未作成の場合のみデータベース初期化
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' LIMIT 1")
+            if cursor.fetchone() is None:
+                conn.close()
+                from scripts.init_sqlite import create_database
+                create_database(self.db_path)
+                
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+            
+            # 復元先に存在するテーブルのみ受け付ける
+            self.invalidate_table_cache()
+            allowed_tables = self.get_table_columns(conn)
+            
             # データの復元
             for table_name, rows in import_data.get("tables", {}).items():
                 if not rows:
                     continue
                 
-                # 既存データの削除
-                cursor.execute(f"DELETE FROM {table_name}")
+                if table_name not in allowed_tables:
+                    print(f"インポートをスキップ: {table_name} テーブルは存在しません")
+                    continue
                 
-                # データの挿入
-                for row in rows:
-                    columns = list(row.keys())
-                    placeholders = ["?" for _ in columns]
-                    values = [row[col] for col in columns]
-                    
-                    sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(placeholders)})"
-                    cursor.execute(sql, values)
+                # 既存データの削除（WHERE句なしのDELETEはSQLiteが行走査せずに消去し、挿入と同じトランザクションでコミットされる）
+                cursor.execute(f"DELETE FROM {quote_identifier(table_name)}")
+                
+                # 挿入中は行ごとのインデックス更新を避けるため一旦削除し、挿入後にまとめて再作成する
+                cursor.execute(
+                    "SELECT name, sql FROM sqlite_master WHERE type='index' AND tbl_name=? AND sql IS NOT NULL",
+                    (table_name,)
+                )
+                indexes = cursor.fetchall()
+                for index_name, _ in indexes:
+                    cursor.execute(f"DROP INDEX {quote_identifier(index_name)}")
+                
+                # データの挿入（テーブル内の行は同じ列構成のため、SQLは一度だけ組み立てる）
+                columns = list(rows[0].keys())
+                column_list = ", ".join(quote_identifier(column) for column in columns)
+                placeholders = ", ".join("?" for _ in columns)
+                sql = f"INSERT INTO {quote_identifier(table_name)} ({column_list}) VALUES ({placeholders})"
+                
+                for start in range(0, len(rows), IMPORT_BATCH_SIZE):
+                    batch = rows[start:start + IMPORT_BATCH_SIZE]
+                    cursor.executemany(sql, [tuple(row[col] for col in columns) for row in batch])
+                
+                for _, index_sql in indexes:
+                    cursor.execute(index_sql)
                 
                 print(f"インポート: {table_name} テーブル ({len(rows)}件)")
             
             conn.commit()
             conn.close()
             
+            self.invalidate_table_cache()
+            
             metadata = import_data.get("metadata", {})
             print(f"データベース復元完了: {metadata.get('export_date', '不明')}")
             return True
@@ -107,21 +268,60 @@ class GitHubStorageManager:
             print(f"データベースインポートエラー: {e}")
             return False
     
-    def save_backup(self) -> bool:
-        """現在のデータベースをバックアップとして保存"""
+    def copy_database(self, source_path: str, target_path: str):
+        """SQLiteのオンラインバックアップAPIでデータベースファイルをページ単位でコピー"""
+        source = sqlite3.connect(source_path)
+        target = sqlite3.connect(target_path)
+        try:
+            source.backup(target, pages=BACKUP_PAGES_PER_STEP)
+        finally:
+            target.close()
+            source.close()
+    
+    def scan_backup_files(self) -> List[os.DirEntry]:
+        """バックアップファイルのエントリを返す（順序は不定。ファイル名の日時で比較する）"""
+        if not os.path.exists(self.backup_dir):
+            return []
+        
+        with os.scandir(self.backup_dir) as entries:
+            return [
+                entry for entry in entries
+                if entry.name.startswith("backup_") and entry.name.endswith(BACKUP_EXTENSIONS)
+            ]
+    
+    def save_backup(self, backup_format: str = "db", compress: bool = True) -> bool:
+        """現在のデータベースをバックアップとして保存
+        
+        通常はSQLiteファイルとしてコピーする。backup_format="json"の場合は内容確認用にJSONで書き出す。
+        compress=Trueの場合はzstandard（なければgzip）で圧縮する。
+        """
         try:
             self.create_backup_directory()
             
             # バックアップファイル名（日付付き）
-            backup_filename = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            backup_filename = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{backup_format}"
+            if compress:
+                backup_filename += COMPRESSION_SUFFIX
             backup_path = os.path.join(self.backup_dir, backup_filename)
             
-            # データベースをJSONにエクスポート
-            export_data = self.export_database_to_json()
-            
-            # JSONファイルとして保存
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            # 一時ファイルへ書き出してから置き換える（途中で失敗しても不完全なファイルを残さない）
+            temp_path = os.path.join(self.backup_dir, "tmp_" + backup_filename)
+            raw_path = temp_path + ".sqlite"
+            try:
+                if backup_format == "json":
+                    with open_backup_file(temp_path, 'wb') as f:
+                        self.write_database_json(f)
+                elif compress:
+                    self.copy_database(self.db_path, raw_path)
+                    with open(raw_path, 'rb') as src, open_backup_file(temp_path, 'wb') as dst:
+                        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+                else:
+                    self.copy_database(self.db_path, temp_path)
+                os.replace(temp_path, backup_path)
+            finally:
+                for path in (temp_path, raw_path):
+                    if os.path.exists(path):
+                        os.remove(path)
             
             print(f"バックアップ保存: {backup_path}")
             
@@ -142,22 +342,37 @@ class GitHubStorageManager:
                 return False
             
             # 最新のバックアップファイルを検索
-            backup_files = [f for f in os.listdir(self.backup_dir) if f.startswith("backup_") and f.endswith(".json")]
+            backup_files = self.scan_backup_files()
             
             if not backup_files:
                 print("バックアップファイルが見つかりません")
                 return False
             
             # 最新ファイルを選択
-            latest_backup = sorted(backup_files)[-1]
-            backup_path = os.path.join(self.backup_dir, latest_backup)
-            
-            # バックアップファイルの読み込み
-            with open(backup_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
-            
-            # データベースの復元
-            result = self.import_database_from_json(import_data)
+            latest_entry = max(backup_files, key=lambda entry: entry.name)
+            latest_backup = latest_entry.name
+            backup_path = latest_entry.path
+            
+            if strip_compression_suffix(latest_backup).endswith(".db"):
+                # SQLiteファイルからページ単位で復元（圧縮されている場合は一時ファイルへ展開）
+                if latest_backup.endswith(".db"):
+                    self.copy_database(backup_path, self.db_path)
+                else:
+                    raw_path = os.path.join(self.backup_dir, "tmp_" + latest_backup + ".sqlite")
+                    try:
+                        with open_backup_file(backup_path, 'rb') as src, open(raw_path, 'wb') as dst:
+                            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+                        self.copy_database(raw_path, self.db_path)
+                    finally:
+                        if os.path.exists(raw_path):
+                            os.remove(raw_path)
+                self.invalidate_table_cache()
+                result = True
+            else:
+                # JSONバックアップの読み込みと復元
+                with open_backup_file(backup_path, 'rb') as f:
+                    import_data = loads_json(f.read())
+                result = self.import_database_from_json(import_data)
             
             if result:
                 print(f"データベース復元成功: {latest_backup}")
@@ -173,20 +388,15 @@ class GitHubStorageManager:
     def cleanup_old_backups(self):
         """古いバックアップファイルを削除"""
         try:
-            if not os.path.exists(self.backup_dir):
-                return
-            
-            backup_files = [f for f in os.listdir(self.backup_dir) if f.startswith("backup_") and f.endswith(".json")]
-            backup_files.sort()
+            backup_files = self.scan_backup_files()
             
             # 保持する件数を超えた場合、古いファイルを削除
             if len(backup_files) > self.max_backups:
-                files_to_delete = backup_files[:-self.max_backups]
+                backup_files.sort(key=lambda entry: entry.name)
                 
-                for filename in files_to_delete:
-                    file_path = os.path.join(self.backup_dir, filename)
-                    os.remove(file_path)
-                    print(f"古いバックアップを削除: {filename}")
+                for entry in backup_files[:-self.max_backups]:
+                    os.remove(entry.path)
+                    print(f"古いバックアップを削除: {entry.name}")
             
         except Exception as e:
             print(f"バックアップ清理エラー: {e}")
@@ -203,12 +413,8 @@ class GitHubStorageManager:
             stats = {"tables": {}, "total_records": 0}
             
             # 全テーブルの統計
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = cursor.fetchall()
-            
-            for table in tables:
-                table_name = table[0]
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            for table_name in self.get_table_columns(conn):
+                cursor.execute(f"SELECT COUNT(*) FROM {quote_identifier(table_name)}")
                 count = cursor.fetchone()[0]
                 
                 stats["tables"][table_name] = count
@@ -222,11 +428,20 @@ class GitHubStorageManager:
             return {"total_records": 0, "tables": {}, "error": str(e)}
 
 
-def initialize_persistent_database():
-    """GitHub Actions用の永続化データベースを初期化"""
+def initialize_persistent_database(db_path: str = "bidding_system.db", use_tmpfs: bool = True) -> GitHubStorageManager:
+    """GitHub Actions用の永続化データベースを初期化
+    
+    use_tmpfs=TrueかつGitHub Actions上（GITHUB_ACTIONS=true）でtmpfsが利用可能な場合のみtmpfs上に復元する。
+    （ローカル等では通常のファイルを使い、実行中のデータベースがRAM上だけに置かれないようにする）
+    実行中は返り値のdb_pathを使用し、終了時は同じマネージャーをfinalize_persistent_databaseに渡す。
+    """
     print("=== GitHub Actions 永続化データベース初期化 ===")
     
-    storage_manager = GitHubStorageManager()
+    if use_tmpfs and os.environ.get('GITHUB_ACTIONS') == 'true' and os.path.isdir(TMPFS_DIR):
+        db_path = os.path.join(TMPFS_DIR, os.path.basename(db_path))
+    
+    storage_manager = GitHubStorageManager(db_path)
+    print(f"データベースパス: {storage_manager.db_path}")
     
     # 既存のバックアップから復元を試行
     print("既存バックアップからの復元を試行中...")
@@ -236,7 +451,7 @@ def initialize_persistent_database():
         print("バックアップが見つからないため、新規データベースを作成...")
         # 新規データベース作成
         from scripts.init_sqlite import create_database
-        create_database("bidding_system.db")
+        create_database(storage_manager.db_path)
     
     # 統計情報を表示
     stats = storage_manager.get_database_stats()
@@ -247,11 +462,12 @@ def initialize_persistent_database():
     return storage_manager
 
 
-def finalize_persistent_database():
-    """GitHub Actions実行終了時のデータベース永続化"""
+def finalize_persistent_database(storage_manager: Optional[GitHubStorageManager] = None) -> bool:
+    """GitHub Actions実行終了時のデータベース永続化（tmpfs上のデータベースもバックアップへ書き出す）"""
     print("=== GitHub Actions データベース永続化処理 ===")
     
-    storage_manager = GitHubStorageManager()
+    if storage_manager is None:
+        storage_manager = GitHubStorageManager()
     
     # 現在の状態をバックアップ
     backup_success = storage_manager.save_backup()
@@ -6,8 +6,245 @@ SQLiteを直接使用してSQLAlchemyに依存しない実装
 import sqlite3
 import json
 import os
-from datetime import datetime, date
-from typing import List, Dict, Optional, Any
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+import queue
+import threading
+from contextlib import contextmanager
+from operator import itemgetter
+from datetime import datetime, date, timezone
+from typing import List, Dict, Optional, Any, Iterable, Iterator
+
+# テーブルと通常のインデックス（一意インデックスは既存データの重複を整理する必要があるため別途作成）
+SCHEMA_SQL = """
+-- procurement_entries テーブル
+CREATE TABLE IF NOT EXISTS procurement_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT,
+    organization TEXT,
+    region TEXT,
+    budget_amount INTEGER,
+    published_date DATE,
+    deadline_date DATE,
+    source_url TEXT,
+    source_type TEXT,
+    relevance_score INTEGER DEFAULT 0,
+    keywords_matched TEXT DEFAULT '[]',
+    processed BOOLEAN DEFAULT FALSE,
+    notified BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 一覧・スコア順の取得と古いデータの削除用インデックス
+CREATE INDEX IF NOT EXISTS idx_pe_created_at ON procurement_entries (created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_pe_score_created ON procurement_entries (relevance_score DESC, created_at DESC);
+
+-- 日付単位の集計用の式インデックス（ダッシュボードの date(created_at) 条件・GROUP BYで使用）
+CREATE INDEX IF NOT EXISTS idx_pe_created_day ON procurement_entries (date(created_at));
+
+-- entry_keywords テーブル（案件とマッチしたキーワードの対応表。SQLでキーワード別に絞り込める）
+CREATE TABLE IF NOT EXISTS entry_keywords (
+    entry_id INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    PRIMARY KEY (entry_id, keyword),
+    FOREIGN KEY (entry_id) REFERENCES procurement_entries (id)
+);
+CREATE INDEX IF NOT EXISTS idx_ek_keyword ON entry_keywords (keyword);
+
+-- filter_keywords テーブル
+CREATE TABLE IF NOT EXISTS filter_keywords (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT NOT NULL,
+    category TEXT DEFAULT 'include',
+    weight INTEGER DEFAULT 1,
+    active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- notification_history テーブル
+CREATE TABLE IF NOT EXISTS notification_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    entry_id INTEGER,
+    notification_type TEXT,
+    recipient TEXT,
+    success BOOLEAN DEFAULT TRUE,
+    error_message TEXT,
+    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (entry_id) REFERENCES procurement_entries (id)
+);
+
+-- system_logs テーブル
+CREATE TABLE IF NOT EXISTS system_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    level TEXT,
+    message TEXT,
+    module TEXT,
+    additional_data TEXT,
+    execution_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 有効キーワードの取得と古いログの削除用インデックス
+CREATE INDEX IF NOT EXISTS idx_fk_cat_active ON filter_keywords (category, active);
+CREATE INDEX IF NOT EXISTS idx_sl_execution_time ON system_logs (execution_time);
+"""
+
+# procurement_entries の挿入列と未指定時の既定値
+PROCUREMENT_ENTRY_COLUMNS = (
+    ('title', ''),
+    ('description', ''),
+    ('organization', ''),
+    ('region', ''),
+    ('budget_amount', None),
+    ('published_date', None),
+    ('deadline_date', None),
+    ('source_url', ''),
+    ('source_type', ''),
+    ('relevance_score', 0),
+    ('keywords_matched', '[]'),
+    ('processed', False),
+    ('notified', False)
+)
+
+INSERT_PROCUREMENT_ENTRY_SQL = """
+INSERT OR IGNORE INTO procurement_entries (
+    {columns}
+) VALUES ({placeholders})
+""".format(
+    columns=', '.join(column for column, _ in PROCUREMENT_ENTRY_COLUMNS),
+    placeholders=', '.join('?' for _ in PROCUREMENT_ENTRY_COLUMNS)
+)
+
+
+# 接続ごとに設定するPRAGMA（synchronous=NORMALはWALモードでは安全かつコミット時のfsyncを削減する）
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456"
+)
+
+# IN句に一度に渡すパラメータ数（SQLiteの変数上限 999 未満に抑える）
+MAX_IN_PARAMS = 900
+
+# iter_queryで一度に取得する行数
+QUERY_FETCH_SIZE = 1000
+
+# 接続ごとにコンパイル済みステートメントを保持する件数
+STATEMENT_CACHE_SIZE = 256
+
+# 頻繁に実行するクエリ（同じSQL文字列を使い回し、ステートメントキャッシュに当てる）
+CHECK_DUPLICATE_ENTRY_SQL = """
+SELECT 1 FROM procurement_entries 
+WHERE title = ? AND organization = ? 
+LIMIT 1
+"""
+
+INSERT_NOTIFICATION_HISTORY_SQL = """
+INSERT INTO notification_history (entry_id, notification_type, recipient, success, error_message)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+# 記録時刻は呼び出し時点のUTC（CURRENT_TIMESTAMPと同じ形式）を渡す（まとめて挿入しても時刻がずれない）
+INSERT_SYSTEM_LOG_SQL = """
+INSERT INTO system_logs (level, message, module, additional_data, execution_time)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+# データベース統計を一度のクエリで取得する（結果の列名が統計のキーになる。案件テーブルは一度の走査で集計する）
+DATABASE_STATS_SQL = """
+SELECT
+    entries.procurement_entries,
+    (SELECT COUNT(*) FROM filter_keywords) AS filter_keywords,
+    (SELECT COUNT(*) FROM notification_history) AS notification_history,
+    (SELECT COUNT(*) FROM system_logs) AS system_logs,
+    entries.high_priority_count,
+    entries.medium_priority_count
+FROM (
+    SELECT
+        COUNT(*) AS procurement_entries,
+        COUNT(CASE WHEN relevance_score >= 80 THEN 1 END) AS high_priority_count,
+        COUNT(CASE WHEN relevance_score >= 60 AND relevance_score < 80 THEN 1 END) AS medium_priority_count
+    FROM procurement_entries
+) AS entries
+"""
+
+# 案件とマッチしたキーワードの対応付け（一意インデックスで案件のidを引く。機関がNULLの案件もISで一致させる）
+INSERT_ENTRY_KEYWORD_SQL = """
+INSERT OR IGNORE INTO entry_keywords (entry_id, keyword) 
+SELECT id, ? FROM procurement_entries 
+WHERE title = ? AND organization IS ?
+"""
+
+# 挿入した案件のidが分かっている場合の対応付け
+INSERT_ENTRY_KEYWORD_BY_ID_SQL = """
+INSERT OR IGNORE INTO entry_keywords (entry_id, keyword) 
+VALUES (?, ?)
+"""
+
+# 既存案件のkeywords_matched（JSON配列）から対応表を作成
+BACKFILL_ENTRY_KEYWORDS_SQL = """
+INSERT OR IGNORE INTO entry_keywords (entry_id, keyword) 
+SELECT procurement_entries.id, keywords.value 
+FROM procurement_entries, json_each(procurement_entries.keywords_matched) AS keywords 
+WHERE json_valid(procurement_entries.keywords_matched) 
+AND json_type(procurement_entries.keywords_matched) = 'array'
+"""
+
+# 古いデータの削除（保持期間は '-N days' 形式の修飾子をパラメータで渡す）
+CLEANUP_PROCUREMENT_ENTRIES_SQL = """
+DELETE FROM procurement_entries 
+WHERE created_at < datetime('now', ?)
+"""
+
+CLEANUP_ENTRY_KEYWORDS_SQL = """
+DELETE FROM entry_keywords 
+WHERE entry_id NOT IN (SELECT id FROM procurement_entries)
+"""
+
+CLEANUP_SYSTEM_LOGS_SQL = """
+DELETE FROM system_logs 
+WHERE execution_time < datetime('now', '-7 days')
+"""
+
+
+# 既定値の辞書と、列順に値を取り出すitemgetter（既定値とのマージと取り出しをC実装で行う）
+PROCUREMENT_ENTRY_DEFAULTS = dict(PROCUREMENT_ENTRY_COLUMNS)
+_procurement_entry_values = itemgetter(*PROCUREMENT_ENTRY_DEFAULTS)
+
+
+def procurement_entry_params(entry_data: Dict) -> tuple:
+    """入札案件の辞書をINSERT用のパラメータに変換（keywords_matchedのリストはここでJSON文字列にする）"""
+    values = {**PROCUREMENT_ENTRY_DEFAULTS, **entry_data}
+    keywords = values['keywords_matched']
+    if not isinstance(keywords, str):
+        values['keywords_matched'] = json.dumps(list(keywords or []), ensure_ascii=False)
+    return _procurement_entry_values(values)
+
+
+def matched_keywords(entry_data: Dict) -> List[str]:
+    """keywords_matched（JSON文字列またはリスト）をキーワードのリストに変換"""
+    value = entry_data.get('keywords_matched') or []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    return [keyword for keyword in value if isinstance(keyword, str)] if isinstance(value, list) else []
+
+
+def entry_keyword_params(entries: Iterable[Dict]) -> List[tuple]:
+    """案件ごとのマッチキーワードをentry_keywords挿入用のパラメータに変換"""
+    return [
+        (keyword, entry_data.get('title', ''), entry_data.get('organization', ''))
+        for entry_data in entries
+        for keyword in matched_keywords(entry_data)
+    ]
+
 
 class SimpleDatabaseManager:
     """シンプルなデータベース管理クラス"""
@@ -15,6 +252,33 @@ class SimpleDatabaseManager:
     def __init__(self, db_path: str = "bidding_system.db"):
         self.db_path = db_path
         self.ensure_database_exists()
+        
+        # インスタンスで共有する接続（スレッド間の同時利用はロックで直列化する）
+        # transaction()内から各メソッドを呼べるよう、同一スレッドでは再入可能なロックを使う
+        self._conn = self.get_connection()
+        self._lock = threading.RLock()
+        
+        # カテゴリごとのフィルタキーワード
+        self._filter_keywords_cache: Dict[Optional[str], List[Dict]] = {}
+        
+        # 未書き込みのシステムログ（flush_system_logsでまとめて挿入する）
+        self._pending_system_logs: queue.SimpleQueue = queue.SimpleQueue()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """未書き込みのシステムログを書き出してから共有接続を閉じる"""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self.flush_system_logs()
+                finally:
+                    self._conn.close()
+                    self._conn = None
     
     def ensure_database_exists(self):
         """データベースファイルとテーブルが存在しない場合は作成"""
@@ -22,6 +286,9 @@ class SimpleDatabaseManager:
         try:
             cursor = conn.cursor()
             
+            # WALモード（データベースファイルに永続化される）
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # 必要なテーブルを作成
             self.create_tables(cursor)
             self.insert_default_data(cursor)
@@ -30,68 +297,45 @@ class SimpleDatabaseManager:
         finally:
             conn.close()
     
+    def create_unique_index(self, cursor, index_name: str, table_name: str, columns: tuple):
+        """一意インデックスを作成
+        
+        既存データに重複がある場合は、最も古い行（idが最小の行）を残して削除してから作成する。
+        """
+        column_list = ', '.join(columns)
+        create_sql = f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table_name} ({column_list})"
+        try:
+            cursor.execute(create_sql)
+        except sqlite3.IntegrityError:
+            cursor.execute(f"""
+            DELETE FROM {table_name} 
+            WHERE id NOT IN (
+                SELECT MIN(id) FROM {table_name} GROUP BY {column_list}
+            )
+            """)
+            cursor.execute(create_sql)
+    
     def create_tables(self, cursor):
         """必要なテーブルを作成"""
         
-        # procurement_entries テーブル
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS procurement_entries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT,
-            organization TEXT,
-            region TEXT,
-            budget_amount INTEGER,
-            published_date DATE,
-            deadline_date DATE,
-            source_url TEXT,
-            source_type TEXT,
-            relevance_score INTEGER DEFAULT 0,
-            keywords_matched TEXT DEFAULT '[]',
-            processed BOOLEAN DEFAULT FALSE,
-            notified BOOLEAN DEFAULT FALSE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
+        # 対応表を新規作成する場合は既存案件から移行する
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='entry_keywords'")
+        is_new_entry_keywords = cursor.fetchone() is None
         
-        # filter_keywords テーブル
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS filter_keywords (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            keyword TEXT NOT NULL,
-            category TEXT DEFAULT 'include',
-            weight INTEGER DEFAULT 1,
-            active BOOLEAN DEFAULT TRUE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
+        # テーブルと通常のインデックスを一括作成（executescriptは保留中のトランザクションを先にコミットする）
+        cursor.executescript(SCHEMA_SQL)
         
-        # notification_history テーブル
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS notification_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            entry_id INTEGER,
-            notification_type TEXT,
-            recipient TEXT,
-            success BOOLEAN DEFAULT TRUE,
-            error_message TEXT,
-            sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (entry_id) REFERENCES procurement_entries (id)
-        )
-        """)
+        # 重複防止用の一意インデックス（INSERT OR IGNOREで重複を挿入時に除外する。旧バージョンの非一意インデックスは削除）
+        cursor.execute("DROP INDEX IF EXISTS idx_procurement_title_org")
+        self.create_unique_index(cursor, "idx_procurement_title_org_unique", "procurement_entries", ("title", "organization"))
+        self.create_unique_index(cursor, "idx_fk_keyword_cat", "filter_keywords", ("keyword", "category"))
         
-        # system_logs テーブル
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS system_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            level TEXT,
-            message TEXT,
-            module TEXT,
-            additional_data TEXT,
-            execution_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
+        if is_new_entry_keywords:
+            try:
+                cursor.execute(BACKFILL_ENTRY_KEYWORDS_SQL)
+            except sqlite3.OperationalError:
+                # JSON1が利用できないSQLiteでは既存案件の移行を行わない
+                pass
     
     def insert_default_data(self, cursor):
         """デフォルトデータを挿入"""
@@ -114,79 +358,137 @@ class SimpleDatabaseManager:
             ('保守', 'exclude', -3)
         ]
         
-        # 既存のキーワードをチェックして重複を避ける
-        for keyword, category, weight in default_keywords:
-            cursor.execute(
-                "SELECT COUNT(*) FROM filter_keywords WHERE keyword = ? AND category = ?",
-                (keyword, category)
-            )
-            if cursor.fetchone()[0] == 0:
-                cursor.execute(
-                    "INSERT INTO filter_keywords (keyword, category, weight) VALUES (?, ?, ?)",
-                    (keyword, category, weight)
-                )
+        # 既存のキーワードは一意インデックスにより挿入されない
+        cursor.executemany(
+            "INSERT OR IGNORE INTO filter_keywords (keyword, category, weight) VALUES (?, ?, ?)",
+            default_keywords
+        )
     
     def get_connection(self):
         """データベース接続を取得"""
-        conn = sqlite3.connect(self.db_path)
+        # 暗黙のトランザクションは開始せず、複数文をまとめる場合は明示的にBEGINする
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
         conn.row_factory = sqlite3.Row  # 辞書形式でアクセス可能
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
     
+    @contextmanager
+    def transaction(self, mode: str = "") -> Iterator[sqlite3.Connection]:
+        """共有接続で明示的なトランザクションを実行（正常終了でコミット、例外でロールバック）
+        
+        ブロック内で呼んだinsert_procurement_entryなどの書き込みは、終了時にまとめてコミットされる。
+        """
+        with self._lock:
+            self._conn.execute(f"BEGIN {mode}")
+            with self._conn:
+                yield self._conn
+    
+    def fetch_all(self, query: str, params: tuple = ()) -> List[Dict]:
+        """SELECTクエリを実行して結果を辞書のリストで返す"""
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            columns = tuple(description[0] for description in cursor.description)
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    def execute_dml(self, query: str, params: tuple = ()) -> int:
+        """INSERT/UPDATE/DELETEなどを実行し、変更行数を返す（トランザクション外では自動コミット）"""
+        with self._lock:
+            return self._conn.execute(query, params).rowcount
+    
     def execute_query(self, query: str, params: tuple = ()) -> List[Dict]:
-        """クエリを実行して結果を返す"""
-        conn = self.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            
-            # SELECT文の場合は結果を返す
-            if query.strip().upper().startswith('SELECT'):
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
-            else:
-                conn.commit()
-                return []
-                
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+        """クエリを実行して結果を返す（互換用。クラス内ではfetch_all/execute_dmlを使う）"""
+        if query.strip().upper().startswith('SELECT'):
+            return self.fetch_all(query, params)
+        self.execute_dml(query, params)
+        return []
+    
+    def iter_query(self, query: str, params: tuple = ()) -> Iterator[Dict]:
+        """SELECTクエリの結果を辞書として逐次返す
+        
+        全行をリストに展開せず、QUERY_FETCH_SIZE件ずつ取得する。
+        ロックは取得のたびに確保するため、反復中に他のメソッドを呼び出してもよい。
+        """
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            columns = tuple(description[0] for description in cursor.description)
+        
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(QUERY_FETCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
     
     def insert_procurement_entry(self, entry_data: Dict) -> int:
-        """入札案件を挿入"""
-        query = """
-        INSERT INTO procurement_entries (
-            title, description, organization, region, budget_amount,
-            published_date, deadline_date, source_url, source_type,
-            relevance_score, keywords_matched, processed, notified
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """入札案件を挿入（同じタイトル・機関の案件が既にある場合は挿入せず0を返す）"""
+        with self._lock:
+            cursor = self._conn.execute(INSERT_PROCUREMENT_ENTRY_SQL, procurement_entry_params(entry_data))
+            if not cursor.rowcount:
+                return 0
+            entry_id = cursor.lastrowid
+            self._conn.executemany(
+                INSERT_ENTRY_KEYWORD_BY_ID_SQL,
+                [(entry_id, keyword) for keyword in matched_keywords(entry_data)]
+            )
+            return entry_id
+    
+    def insert_procurement_entries(self, entries: Iterable[Dict]) -> int:
+        """複数の入札案件を一つのトランザクションでまとめて挿入し、挿入件数を返す（重複は除外）
+        
+        重複を挿入前に除外するinsert_procurement_entries_bulkを使い、
+        挿入しなかった案件のキーワードが既存の案件に対応付けられないようにする。
         """
+        entries = list(entries)
+        if not entries:
+            return 0
+        return len(self.insert_procurement_entries_bulk(entries))
+    
+    def _existing_entry_keys(self, conn: sqlite3.Connection, titles: Iterable[str]) -> set:
+        """指定タイトルを持つ既存案件の (title, organization) の集合を取得"""
+        titles = list(titles)
+        cursor = conn.cursor()
+        cursor.row_factory = None
         
-        params = (
-            entry_data.get('title', ''),
-            entry_data.get('description', ''),
-            entry_data.get('organization', ''),
-            entry_data.get('region', ''),
-            entry_data.get('budget_amount'),
-            entry_data.get('published_date'),
-            entry_data.get('deadline_date'),
-            entry_data.get('source_url', ''),
-            entry_data.get('source_type', ''),
-            entry_data.get('relevance_score', 0),
-            entry_data.get('keywords_matched', '[]'),
-            entry_data.get('processed', False),
-            entry_data.get('notified', False)
-        )
+        keys = set()
+        for start in range(0, len(titles), MAX_IN_PARAMS):
+            chunk = titles[start:start + MAX_IN_PARAMS]
+            placeholders = ', '.join('?' for _ in chunk)
+            cursor.execute(
+                f"SELECT title, organization FROM procurement_entries WHERE title IN ({placeholders})",
+                chunk
+            )
+            keys.update(cursor)
+        return keys
+    
+    def insert_procurement_entries_bulk(self, entries: List[Dict]) -> List[int]:
+        """入札案件を一つのトランザクションとexecutemanyで一括挿入し、挿入されたentriesの位置を返す
         
-        conn = self.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
-            return cursor.lastrowid
-        finally:
-            conn.close()
+        既存案件およびentries内で先に出現した案件と重複するものは挿入しない。
+        """
+        with self.transaction("IMMEDIATE") as conn:
+            seen_keys = self._existing_entry_keys(conn, {entry_data.get('title', '') for entry_data in entries})
+            
+            inserted_positions = []
+            params = []
+            for position, entry_data in enumerate(entries):
+                entry_key = (entry_data.get('title', ''), entry_data.get('organization', ''))
+                if entry_key in seen_keys:
+                    continue
+                seen_keys.add(entry_key)
+                inserted_positions.append(position)
+                params.append(procurement_entry_params(entry_data))
+            
+            if params:
+                conn.executemany(INSERT_PROCUREMENT_ENTRY_SQL, params)
+                conn.executemany(
+                    INSERT_ENTRY_KEYWORD_SQL,
+                    entry_keyword_params(entries[position] for position in inserted_positions)
+                )
+        
+        return inserted_positions
     
     def get_procurement_entries(self, limit: int = 100, offset: int = 0) -> List[Dict]:
         """入札案件を取得"""
@@ -195,7 +497,15 @@ class SimpleDatabaseManager:
         ORDER BY created_at DESC 
         LIMIT ? OFFSET ?
         """
-        return self.execute_query(query, (limit, offset))
+        return self.fetch_all(query, (limit, offset))
+    
+    def iter_procurement_entries(self) -> Iterator[Dict]:
+        """全ての入札案件を新しい順に逐次返す（全件を走査するレポート処理向け）"""
+        query = """
+        SELECT * FROM procurement_entries 
+        ORDER BY created_at DESC
+        """
+        return self.iter_query(query)
     
     def get_entries_by_score(self, min_score: int) -> List[Dict]:
         """適合度スコアでフィルタリング"""
@@ -204,80 +514,98 @@ class SimpleDatabaseManager:
         WHERE relevance_score >= ? 
         ORDER BY relevance_score DESC, created_at DESC
         """
-        return self.execute_query(query, (min_score,))
+        return self.fetch_all(query, (min_score,))
     
-    def check_duplicate_entry(self, title: str, organization: str) -> bool:
-        """重複チェック"""
+    def get_high_priority_digest(self, min_score: int = 80) -> List[Dict]:
+        """適合度スコア以上の案件を通知・一覧表示に必要な列のみで取得"""
         query = """
-        SELECT COUNT(*) as count FROM procurement_entries 
-        WHERE title = ? AND organization = ?
+        SELECT id, title, organization, relevance_score, deadline_date FROM procurement_entries 
+        WHERE relevance_score >= ? 
+        ORDER BY relevance_score DESC, created_at DESC
         """
-        result = self.execute_query(query, (title, organization))
-        return result[0]['count'] > 0
+        return self.fetch_all(query, (min_score,))
     
-    def insert_notification_history(self, entry_id: int, notification_type: str, recipient: str, success: bool = True, error_message: str = None):
-        """通知履歴を挿入"""
+    def get_entries_by_keyword(self, keyword: str, min_score: int = 0) -> List[Dict]:
+        """マッチしたキーワードで案件を取得（entry_keywordsの索引で絞り込む）"""
         query = """
-        INSERT INTO notification_history (entry_id, notification_type, recipient, success, error_message)
-        VALUES (?, ?, ?, ?, ?)
+        SELECT procurement_entries.* FROM entry_keywords 
+        JOIN procurement_entries ON procurement_entries.id = entry_keywords.entry_id 
+        WHERE entry_keywords.keyword = ? AND procurement_entries.relevance_score >= ? 
+        ORDER BY procurement_entries.relevance_score DESC, procurement_entries.created_at DESC
         """
+        return self.fetch_all(query, (keyword, min_score))
+    
+    def check_duplicate_entry(self, title: str, organization: str) -> bool:
+        """重複チェック"""
+        return bool(self.fetch_all(CHECK_DUPLICATE_ENTRY_SQL, (title, organization)))
+    
+    def insert_notification_history(self, entry_id: int, notification_type: str, recipient: str, success: bool = True, error_message: str = None):
+        """通知履歴を挿入"""
         params = (entry_id, notification_type, recipient, success, error_message)
-        self.execute_query(query, params)
+        self.execute_dml(INSERT_NOTIFICATION_HISTORY_SQL, params)
     
     def insert_system_log(self, level: str, message: str, module: str, additional_data: Dict = None):
-        """システムログを挿入"""
-        query = """
-        INSERT INTO system_logs (level, message, module, additional_data)
-        VALUES (?, ?, ?, ?)
-        """
-        additional_data_json = json.dumps(additional_data) if additional_data else None
-        params = (level, message, module, additional_data_json)
-        self.execute_query(query, params)
+        """システムログを追加（書き込みはflush_system_logs・close時にまとめて行う）"""
+        additional_data_json = None
+        if additional_data:
+            # orjsonが利用可能ならCで直接シリアライズ
+            additional_data_json = orjson.dumps(additional_data).decode('utf-8') if HAS_ORJSON else json.dumps(additional_data)
+        execution_time = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        self._pending_system_logs.put((level, message, module, additional_data_json, execution_time))
+    
+    def flush_system_logs(self) -> int:
+        """未書き込みのシステムログを一つのトランザクションとexecutemanyで挿入し、件数を返す"""
+        params = []
+        while True:
+            try:
+                params.append(self._pending_system_logs.get_nowait())
+            except queue.Empty:
+                break
+        
+        if params:
+            with self.transaction() as conn:
+                conn.executemany(INSERT_SYSTEM_LOG_SQL, params)
+        return len(params)
     
     def get_database_stats(self) -> Dict:
         """データベース統計情報を取得"""
-        stats = {}
-        
-        # 各テーブルの行数
-        tables = ['procurement_entries', 'filter_keywords', 'notification_history', 'system_logs']
-        for table in tables:
-            result = self.execute_query(f"SELECT COUNT(*) as count FROM {table}")
-            stats[table] = result[0]['count']
-        
-        # 適合度別統計
-        high_priority = self.execute_query("SELECT COUNT(*) as count FROM procurement_entries WHERE relevance_score >= 80")
-        medium_priority = self.execute_query("SELECT COUNT(*) as count FROM procurement_entries WHERE relevance_score >= 60 AND relevance_score < 80")
+        # 未書き込みのシステムログも件数に含める
+        self.flush_system_logs()
         
-        stats['high_priority_count'] = high_priority[0]['count']
-        stats['medium_priority_count'] = medium_priority[0]['count']
+        # 各テーブルの行数と適合度別統計
+        stats = self.fetch_all(DATABASE_STATS_SQL)[0]
         stats['total_entries'] = stats['procurement_entries']
         
         return stats
     
     def cleanup_old_data(self, days: int = 30):
         """古いデータを削除"""
-        # 古い案件を削除
-        query = """
-        DELETE FROM procurement_entries 
-        WHERE created_at < datetime('now', '-{} days')
-        """.format(days)
-        self.execute_query(query)
+        with self.transaction() as conn:
+            # 古い案件を削除
+            conn.execute(CLEANUP_PROCUREMENT_ENTRIES_SQL, (f'-{int(days)} days',))
+            conn.execute(CLEANUP_ENTRY_KEYWORDS_SQL)
+            
+            # 古いログを削除
+            conn.execute(CLEANUP_SYSTEM_LOGS_SQL)
         
-        # 古いログを削除
-        query = """
-        DELETE FROM system_logs 
-        WHERE execution_time < datetime('now', '-7 days')
-        """
-        self.execute_query(query)
+        # 大量削除後に統計情報を更新
+        self.execute_dml("PRAGMA optimize")
     
     def get_filter_keywords(self, category: str = None) -> List[Dict]:
-        """フィルタキーワードを取得"""
-        if category:
-            query = "SELECT * FROM filter_keywords WHERE category = ? AND active = 1"
-            return self.execute_query(query, (category,))
-        else:
-            query = "SELECT * FROM filter_keywords WHERE active = 1"
-            return self.execute_query(query)
+        """フィルタキーワードを取得（実行中は変わらないため、カテゴリごとに一度だけ問い合わせる）"""
+        if category not in self._filter_keywords_cache:
+            if category:
+                query = "SELECT * FROM filter_keywords WHERE category = ? AND active = 1"
+                self._filter_keywords_cache[category] = self.fetch_all(query, (category,))
+            else:
+                query = "SELECT * FROM filter_keywords WHERE active = 1"
+                self._filter_keywords_cache[category] = self.fetch_all(query)
+        
+        return list(self._filter_keywords_cache[category])
+    
+    def clear_filter_keywords_cache(self):
+        """フィルタキーワードのキャッシュを破棄（filter_keywordsを変更した後に呼ぶ）"""
+        self._filter_keywords_cache.clear()
 
 # 使用例とテスト
 def test_simple_database():
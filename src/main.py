@@ -6,6 +6,8 @@
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from datetime import datetime
 from typing import List, Dict
 
@@ -83,40 +85,52 @@ class BidCollectionSystem:
             raise
     
     def _collect_data(self) -> List[Dict]:
-        """データ収集"""
+        """データ収集（政府APIと自治体RSSを並行して収集）"""
         logger.info("データ収集開始")
         
         all_entries = []
         
+        # 処理時間制限の残り時間まで収集を待つ
+        remaining_time = max(0, settings.max_processing_time - (time.time() - self.start_time))
+        
+        executor = ThreadPoolExecutor(max_workers=2)
         try:
-            # 政府APIからデータ収集
-            logger.info("政府APIからデータ収集中...")
-            api_entries = self.api_client.search_bids(
+            logger.info("政府APIと自治体RSSからデータ収集中...")
+            api_future = executor.submit(
+                self.api_client.search_bids,
                 keywords=settings.target_keywords,
                 date_from=None,  # 今日から
                 date_to=None
             )
-            all_entries.extend(api_entries)
-            logger.info(f"政府APIから {len(api_entries)} 件収集")
+            rss_future = executor.submit(self.rss_collector.collect_all_rss_sources)
             
-            # 処理時間制限チェック
-            if time.time() - self.start_time > settings.max_processing_time:
+            done, not_done = wait((api_future, rss_future), timeout=remaining_time)
+            if not_done:
                 logger.warning("処理時間制限に達しました")
-                return all_entries
             
-            # RSS収集（追加データソース）
-            logger.info("自治体RSSからデータ収集中...")
-            try:
-                rss_entries = self.rss_collector.collect_all_rss_sources()
-                all_entries.extend(rss_entries)
-                logger.info(f"RSSから {len(rss_entries)} 件収集")
-            except Exception as e:
-                logger.error(f"RSS収集エラー: {e}")
-                # RSS収集エラーは致命的ではないので続行
+            # 政府APIの結果
+            if api_future in done:
+                try:
+                    api_entries = api_future.result()
+                    all_entries.extend(api_entries)
+                    logger.info(f"政府APIから {len(api_entries)} 件収集")
+                except Exception as e:
+                    logger.error(f"データ収集エラー: {e}")
+                    # エラーが発生しても他のデータソースの結果は処理を続行
             
-        except Exception as e:
-            logger.error(f"データ収集エラー: {e}")
-            # エラーが発生しても既に収集したデータは処理を続行
+            # RSS収集（追加データソース）の結果
+            if rss_future in done:
+                try:
+                    rss_entries = rss_future.result()
+                    all_entries.extend(rss_entries)
+                    logger.info(f"RSSから {len(rss_entries)} 件収集")
+                except Exception as e:
+                    logger.error(f"RSS収集エラー: {e}")
+                    # RSS収集エラーは致命的ではないので続行
+        
+        finally:
+            # 制限時間を超えた収集処理は待たずに進める
+            executor.shutdown(wait=False)
         
         logger.info(f"データ収集完了: 合計 {len(all_entries)} 件")
         return all_entries
@@ -151,6 +165,8 @@ class BidCollectionSystem:
         saved_entries = []
         
         try:
+            valid_entries = []
+            normalized_entries = []
             for entry_data in processed_entries:
                 try:
                     # データ検証
@@ -158,26 +174,18 @@ class BidCollectionSystem:
                         continue
                     
                     # データ正規化
-                    normalized_data = self.processor.normalize_entry_data(entry_data)
-                    
-                    # 重複チェック
-                    if self.db_manager.check_duplicate_entry(
-                        normalized_data['title'],
-                        normalized_data['organization']
-                    ):
-                        logger.debug(f"重複データをスキップ: {normalized_data['title']}")
-                        continue
-                    
-                    # エントリー保存
-                    entry_id = self.db_manager.insert_procurement_entry(normalized_data)
-                    if entry_id:
-                        saved_entries.append(entry_data)
-                        logger.debug(f"エントリー保存成功: {entry_id}")
+                    normalized_entries.append(self.processor.normalize_entry_data(entry_data))
+                    valid_entries.append(entry_data)
                     
                 except Exception as e:
                     logger.warning(f"エントリー保存エラー: {e}")
                     continue
             
+            # 一つのトランザクションで一括保存（重複は挿入されない）
+            inserted_positions = self.db_manager.insert_procurement_entries_bulk(normalized_entries)
+            saved_entries = [valid_entries[position] for position in inserted_positions]
+            logger.debug(f"重複データをスキップ: {len(normalized_entries) - len(saved_entries)} 件")
+            
             logger.info(f"データベース保存完了: {len(saved_entries)} 件")
             
         except Exception as e:
@@ -195,7 +203,10 @@ class BidCollectionSystem:
             
             # 高優先度案件の即座通知
             if high_priority:
-                success = self.notifier.send_high_priority_alert(high_priority)
+                # 保留がALERT_BATCH_MAX件に達した場合はここで送信され、その結果が返る
+                sent = self.notifier.send_high_priority_alert(high_priority)
+                # 保留バッファを待たずに送信して結果を確認
+                success = self.notifier.flush_pending_alerts() and sent
                 if success:
                     logger.info(f"高優先度案件アラート送信完了: {len(high_priority)} 件")
                 else:
@@ -248,11 +259,17 @@ class BidCollectionSystem:
         logger.info("クリーンアップ開始")
         
         try:
-            # 古いデータの削除
-            self.db_manager.cleanup_old_data(days=settings.data_retention_days)
-            
-            # 古いログファイルの削除（7日以上前）
-            self._cleanup_old_logs()
+            with ExitStack() as stack:
+                # 削除処理が失敗しても接続は必ず閉じる（登録と逆順に、データベース→通知サービスの順で閉じる）
+                # 通知サービスは保留中のアラートを送信してからSMTP接続・HTTPプールを閉じる
+                stack.callback(self.notifier.close)
+                stack.callback(self.db_manager.close)
+                
+                # 古いデータの削除
+                self.db_manager.cleanup_old_data(days=settings.data_retention_days)
+                
+                # 古いログファイルの削除（7日以上前）
+                self._cleanup_old_logs()
             
             logger.info("クリーンアップ完了")
             
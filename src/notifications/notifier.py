@@ -1,46 +1,578 @@
 import smtplib
-import requests
+import urllib3
+from urllib3.util.retry import Retry
 import json
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Optional
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+try:
+    import aiosmtplib
+    HAS_AIOSMTPLIB = True
+except ImportError:
+    HAS_AIOSMTPLIB = False
+try:
+    import h2  # noqa: F401  httpxのHTTP/2対応に必要
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+import asyncio
+import gzip
+import hashlib
+import os
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from email.message import EmailMessage
+from html import escape
+from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
+from types import MappingProxyType
 import logging
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# メールとTeamsの送信を並行実行するスレッドプール
+_EXECUTOR = ThreadPoolExecutor(max_workers=5)
+DISPATCH_TIMEOUT = 30  # 各チャネルの送信完了待ち（秒）
+
+# Webhook送信時のヘッダー（本文は自前でシリアライズする）
+JSON_HEADERS = {'Content-Type': 'application/json'}
+GZIP_JSON_HEADERS = {'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}
+
+# これを超えるレポート本文はgzip圧縮して送信（バイト、settings.teams_webhook_gzipが有効な場合のみ）
+WEBHOOK_GZIP_MIN_SIZE = 1024
+
+# 通知済み案件キーの保持上限（古いものから破棄）
+SEEN_CACHE_SIZE = 10000
+
+# 1通のアラートにまとめる最大件数（到達したら待ち時間を待たずに送信）
+ALERT_BATCH_MAX = 50
+
+# Teamsカードに詳細を載せる最大件数（カードサイズの上限対策）
+ALERT_CARD_MAX_ENTRIES = 3
+REPORT_CARD_MAX_ENTRIES = 5
+
+# 送信中に発生したら接続を張り直して一度だけ再送する例外
+SMTP_RETRY_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionResetError, TimeoutError)
+
+# 保持するSMTP接続数と、1接続あたりの最大送信数（超えたら接続を張り直す）
+SMTP_POOL_SIZE = 5
+SMTP_MAX_LINE_BYTES = 998  # RFC 5321の1行あたりの上限（CRLFを除く）
+SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+
+# プッシュ数を数える移動ウィンドウ（秒）
+RATE_LIMIT_WINDOW = 60
+
+# Teams Webhookのリトライ対象ステータスとタイムアウト
+WEBHOOK_RETRY_STATUSES = (429, 500, 502, 503, 504)
+WEBHOOK_TIMEOUT = urllib3.Timeout(connect=3.0, read=10.0)
+
+class WebhookError(Exception):
+    """Webhookが成功以外のステータスを返した"""
+
+def dump_json_bytes(message: Dict) -> bytes:
+    """メッセージをUTF-8のJSONバイト列に変換（orjsonが利用可能ならCで直接シリアライズ）"""
+    if HAS_ORJSON:
+        return orjson.dumps(message)
+    return json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# 日次レポートHTML（Teamsカードにはこのページへのリンクのみ載せる）
+REPORT_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="ja">
+<head>
+<meta charset="utf-8">
+<title>入札案件 日次レポート {date}</title>
+</head>
+<body>
+<h1>入札案件 日次レポート {date}</h1>
+<h2>高優先度案件 {count}件</h2>
+<table>
+<tr><th>#</th><th>案件名</th><th>発注機関</th><th>適合度</th><th>締切</th></tr>
+{rows}
+</table>
+<p>レポート生成時刻: {stamp}</p>
+</body>
+</html>
+"""
+REPORT_HTML_ROW_TEMPLATE = '<tr><td>{index}</td><td>{title}</td><td>{organization}</td><td>{score}点</td><td>{deadline}</td></tr>'
+
+# メールアラートの案件ごとの本文（予算・締切・URL行は事前に組み立てて埋め込む）
+EMAIL_ENTRY_TEMPLATE = (
+    "【案件 {index}】\n"
+    "タイトル: {title}\n"
+    "発注機関: {organization}\n"
+    "地域: {region}\n"
+    "適合度: {relevance_score}点\n"
+    "{budget_line}{deadline_line}{url_line}"
+    "説明: {description:.200}...\n"
+    "\n" + "="*50 + "\n\n"
+)
+
+# SMTP DATA本文の改行正規化・行頭ピリオドのエスケープ（RFC 5321）
+SMTP_BARE_EOL_PATTERN = re.compile(br'(?:\r\n|\n|\r(?!\n))')
+SMTP_LEADING_PERIOD_PATTERN = re.compile(br'(?m)^\.')
+
+class _PipelinedSMTP(smtplib.SMTP):
+    """ESMTP PIPELINING（RFC 2920）対応のSMTPクライアント
+    
+    サーバーがPIPELININGを広告している場合、MAIL・RCPT・DATAを一度に書き込み、
+    応答をまとめて読み取る。非対応サーバーやSMTPUTF8指定時は標準の対話で送信する。
+    """
+    
+    # この接続で送信したメール数（接続の張り直し判定に使用）
+    sent_count = 0
+    
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        self.ehlo_or_helo_if_needed()
+        if (not self.does_esmtp or not self.has_extn('pipelining')
+                or any(option.lower() == 'smtputf8' for option in mail_options)):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+        
+        if isinstance(msg, str):
+            msg = msg.encode('ascii')
+        msg = SMTP_BARE_EOL_PATTERN.sub(b'\r\n', msg)
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+        
+        esmtp_opts = list(mail_options)
+        if self.has_extn('size'):
+            esmtp_opts.insert(0, "size=%d" % len(msg))
+        mail_opts = ' ' + ' '.join(esmtp_opts) if esmtp_opts else ''
+        rcpt_opts = ' ' + ' '.join(rcpt_options) if rcpt_options else ''
+        
+        # MAIL・RCPT・DATAを応答を待たずに送信
+        commands = [f"MAIL FROM:{smtplib.quoteaddr(from_addr)}{mail_opts}"]
+        commands.extend(f"RCPT TO:{smtplib.quoteaddr(each)}{rcpt_opts}" for each in to_addrs)
+        commands.append("DATA")
+        self.send(''.join(f"{command}\r\n" for command in commands))
+        
+        # 応答を送信順に読み取る
+        code, resp = self.getreply()
+        sender_error = None if code == 250 else (code, resp)
+        senderrs = {}
+        for each in to_addrs:
+            rcpt_code, rcpt_resp = self.getreply()
+            if rcpt_code not in (250, 251):
+                senderrs[each] = (rcpt_code, rcpt_resp)
+        data_code, data_resp = self.getreply()
+        
+        if data_code == 354 and (sender_error or len(senderrs) == len(to_addrs)):
+            # DATAだけ受理された場合は空の本文を終端して取り消す
+            self.send(b".\r\n")
+            self.getreply()
+            data_code = None
+        
+        if sender_error:
+            self._rset()
+            raise smtplib.SMTPSenderRefused(sender_error[0], sender_error[1], from_addr)
+        if len(senderrs) == len(to_addrs):
+            self._rset()
+            raise smtplib.SMTPRecipientsRefused(senderrs)
+        if data_code != 354:
+            self._rset()
+            raise smtplib.SMTPDataError(data_code, data_resp)
+        
+        body = SMTP_LEADING_PERIOD_PATTERN.sub(b'..', msg)
+        if not body.endswith(b"\r\n"):
+            body += b"\r\n"
+        self.send(body + b".\r\n")
+        code, resp = self.getreply()
+        if code != 250:
+            self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+        
+        return senderrs
+
+def encode_webhook_body(message: Dict, compress: bool = False) -> Tuple[bytes, Dict[str, str]]:
+    """Webhook送信用の本文とヘッダーを作成（compress=Trueで一定サイズを超える場合はgzip圧縮）"""
+    data = dump_json_bytes(message)
+    if compress and len(data) > WEBHOOK_GZIP_MIN_SIZE:
+        return gzip.compress(data, compresslevel=1), GZIP_JSON_HEADERS
+    return data, JSON_HEADERS
+
+# Teams Workflows向けAdaptive Cardの固定部分
+ADAPTIVE_CARD_CONTENT_TYPE = "application/vnd.microsoft.card.adaptive"
+ADAPTIVE_CARD_SKELETON = MappingProxyType({
+    "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
+    "type": "AdaptiveCard",
+    "version": "1.4"
+})
+
+def build_adaptive_card_message(body: List[Dict]) -> Dict:
+    """Adaptive Cardの本文要素をTeams Workflows形式のメッセージに包む"""
+    return {
+        "type": "message",
+        "attachments": [
+            {
+                "contentType": ADAPTIVE_CARD_CONTENT_TYPE,
+                "content": {**ADAPTIVE_CARD_SKELETON, "body": body}
+            }
+        ]
+    }
+
+# 案件ごとのカード要素はアラートとレポートで同じ案件が繰り返し現れるためキャッシュする。
+# 返す要素は共有されるため、呼び出し側で変更しないこと。
+@lru_cache(maxsize=1024)
+def render_alert_entry_nodes(title: str, organization: str, score: Any,
+                             deadline: Optional[str], url: Optional[str]) -> Tuple[Dict, ...]:
+    """アラートカードの案件要素（FactSetと詳細リンク）を作成"""
+    fact_set = {
+        "type": "FactSet",
+        "facts": [
+            {
+                "title": "タイトル:",
+                "value": title[:100]
+            },
+            {
+                "title": "発注機関:",
+                "value": organization
+            },
+            {
+                "title": "適合度:",
+                "value": f"{score}点"
+            }
+        ]
+    }
+    
+    if deadline:
+        fact_set["facts"].append({
+            "title": "締切:",
+            "value": deadline
+        })
+    
+    if not url:
+        return (fact_set,)
+    
+    return (fact_set, {
+        "type": "ActionSet",
+        "actions": [
+            {
+                "type": "Action.OpenUrl",
+                "title": "詳細を見る",
+                "url": url
+            }
+        ]
+    })
+
+@lru_cache(maxsize=1024)
+def render_report_entry_nodes(index: int, title: str, organization: str, score: Any,
+                              url: Optional[str]) -> Tuple[Dict, ...]:
+    """日次レポートカードの高優先度案件要素（FactSetと詳細リンク）を作成"""
+    fact_set = {
+        "type": "FactSet",
+        "facts": [
+            {
+                "title": f"案件 {index}:",
+                "value": title[:80]
+            },
+            {
+                "title": "発注機関:",
+                "value": organization
+            },
+            {
+                "title": "適合度:",
+                "value": f"{score}点"
+            }
+        ]
+    }
+    
+    if not url:
+        return (fact_set,)
+    
+    return (fact_set, {
+        "type": "ActionSet",
+        "actions": [
+            {
+                "type": "Action.OpenUrl",
+                "title": f"案件 {index} 詳細を見る",
+                "url": url
+            }
+        ]
+    })
+
 class NotificationService:
     """通知サービスクラス"""
     
-    def __init__(self):
+    def __init__(self, dry_run: bool = False):
+        # dry_runではメール・Teams本文を作成するだけで送信しない（最後の本文は_last_payloadに保持）
+        self._dry_run = dry_run
+        self._last_payload: Any = None
         self.email_user = settings.email_user
         self.email_password = settings.email_password
         self.email_to = settings.email_to
         self.smtp_server = settings.smtp_server
         self.smtp_port = settings.smtp_port
         self.teams_webhook_url = settings.teams_webhook_url
+        self.teams_webhook_gzip = settings.teams_webhook_gzip
         self.max_daily_notifications = settings.max_daily_notifications
         self.notification_count = 0
+        self.rate_limit_per_min = settings.notification_rate_limit_per_min
+        self.dedup_window = settings.notification_dedup_window
+        self.score_threshold = settings.notification_score_threshold
+        self._count_lock = threading.Lock()
+        
+        # 1日の上限数を容量とし、1日かけて満杯に戻るトークンバケット
+        self._tokens = float(self.max_daily_notifications)
+        self._last_refill = time.monotonic()
+        self._refill_rate = self.max_daily_notifications / 86400.0
+        self._seen: "OrderedDict[bytes, None]" = OrderedDict()
+        self._push_times: deque = deque()
+        self._thread_last: Dict[str, float] = {}
+        
+        # 短時間に続いたアラートを一通にまとめるための保留バッファ
+        self.coalesce_window = settings.notification_coalesce_window
+        self._pending: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._smtp_pool: "queue.Queue[_PipelinedSMTP]" = queue.Queue(maxsize=SMTP_POOL_SIZE)
+        
+        # Teams Webhook用にTLS接続を使い回すコネクションプール（宛先は固定URLのみ）
+        self._http = urllib3.PoolManager(
+            num_pools=1,
+            maxsize=4,
+            retries=Retry(
+                total=2,
+                backoff_factor=0.5,
+                status_forcelist=WEBHOOK_RETRY_STATUSES,
+                allowed_methods=frozenset(['POST']),
+                raise_on_status=False
+            ),
+            timeout=WEBHOOK_TIMEOUT
+        )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def close(self):
+        """保留中のアラートを送信し、SMTP接続とHTTPセッションを閉じる
+        
+        送信に失敗しても接続は必ず閉じる。複数回呼び出しても安全。
+        """
+        try:
+            self.flush_pending_alerts()
+        finally:
+            # 流量制限で保留に戻った案件の再送タイマーは止める（閉じた後には送信しない）
+            with self._pending_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if self._pending:
+                    logger.warning(f"{len(self._pending)} pending alerts were not sent")
+            self._http.clear()
+            self._close_smtp()
+    
+    def _close_smtp(self):
+        """プール内のSMTP接続をすべて閉じる"""
+        while True:
+            try:
+                server = self._smtp_pool.get_nowait()
+            except queue.Empty:
+                return
+            self._quit_smtp(server)
+    
+    @staticmethod
+    def _quit_smtp(server: smtplib.SMTP):
+        """SMTP接続を閉じる（QUITに失敗した場合はソケットのみ閉じる）"""
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError) as e:
+            logger.debug(f"SMTP quit failed: {e}")
+            server.close()
+    
+    def _connect_smtp(self) -> "_PipelinedSMTP":
+        """SMTPサーバーに接続してSTARTTLS・ログインを行う"""
+        server = _PipelinedSMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.email_user, self.email_password)
+            server.ehlo_or_helo_if_needed()
+            logger.debug(f"SMTP PIPELINING supported: {server.has_extn('pipelining')}")
+        except Exception:
+            server.close()
+            raise
+        
+        return server
+    
+    def _borrow_smtp(self) -> "_PipelinedSMTP":
+        """プールからSMTP接続を借りる（空き・生存中の接続がなければ新規接続）"""
+        while True:
+            try:
+                server = self._smtp_pool.get_nowait()
+            except queue.Empty:
+                return self._connect_smtp()
+            
+            # アイドル中にサーバー側で切断されていないかNOOPで確認
+            try:
+                code, _ = server.noop()
+                if code == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            logger.info("SMTP connection lost, reconnecting")
+            server.close()
+    
+    def _return_smtp(self, server: "_PipelinedSMTP"):
+        """SMTP接続をプールへ返す（送信数の上限到達時・プール満杯時は閉じる）"""
+        if server.sent_count >= SMTP_MAX_MESSAGES_PER_CONNECTION:
+            self._quit_smtp(server)
+            return
+        
+        try:
+            self._smtp_pool.put_nowait(server)
+        except queue.Full:
+            self._quit_smtp(server)
+    
+    @staticmethod
+    def _mail_options_for(msg: EmailMessage, supports_8bitmime: bool) -> Tuple[str, ...]:
+        """サーバーの8BITMIME対応に合わせてMAILオプションを決め、非対応ならbase64に変換"""
+        if supports_8bitmime:
+            return ('BODY=8BITMIME',)
+        
+        if msg['Content-Transfer-Encoding'] == '8bit':
+            msg.set_content(msg.get_content(), subtype='plain', charset='utf-8', cte='base64')
+        return ()
+    
+    def _send_mail(self, msg: EmailMessage):
+        """プールのSMTP接続でメールを送信
+        
+        送信時に切断されていた場合は一度だけ再接続して再送する。
+        一定数を送信した接続は閉じ、次回の送信で張り直す。
+        """
+        if self._dry_run:
+            self._last_payload = msg
+            return
+        
+        server = self._borrow_smtp()
+        try:
+            try:
+                server.ehlo_or_helo_if_needed()
+                mail_options = self._mail_options_for(msg, server.has_extn('8bitmime'))
+                server.send_message(msg, mail_options=mail_options)
+            except SMTP_RETRY_ERRORS:
+                logger.info("SMTP connection lost while sending, retrying once")
+                server.close()
+                server = self._connect_smtp()
+                server.ehlo_or_helo_if_needed()
+                mail_options = self._mail_options_for(msg, server.has_extn('8bitmime'))
+                server.send_message(msg, mail_options=mail_options)
+        except Exception:
+            server.close()
+            raise
+        
+        server.sent_count += 1
+        self._return_smtp(server)
         
     def send_high_priority_alert(self, entries: List[Dict]) -> bool:
-        """高優先度案件のアラート送信"""
+        """高優先度案件のアラート送信
+        
+        coalesce_windowが正の場合は保留バッファに追加して即座にTrueを返し、
+        最初の追加から一定時間後（またはflush_pending_alerts()/close()時）に
+        まとめて一通の通知として送信する。保留がALERT_BATCH_MAX件に達した
+        場合は待ち時間を待たずに呼び出し元のスレッドで送信し、その結果を返す。
+        """
+        entries = self._dedup_entries(entries)
+        if self.coalesce_window <= 0:
+            result = self._dispatch_alert(entries)
+            if result is None:
+                # 流量制限で送信できなかった案件はflush_pending_alerts()/close()時に再送する
+                self._requeue_alerts(entries)
+                return False
+            return result
+        
+        with self._pending_lock:
+            for entry in entries:
+                self._pending.setdefault(self._entry_key(entry), entry)
+            
+            # 最初の保留分から一定時間後に送信（呼び出しごとに延長はしない）
+            if self._pending and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.coalesce_window, self.flush_pending_alerts)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            
+            batch_full = len(self._pending) >= ALERT_BATCH_MAX
+        
+        # 送信スレッドプール（各チャネルの送信にも使う）には投入せず、ここで送信する
+        if batch_full:
+            return self.flush_pending_alerts()
+        
+        return True
+    
+    def flush_pending_alerts(self) -> bool:
+        """保留中のアラートをまとめて送信（ALERT_BATCH_MAX件ごとに一通）
+        
+        流量制限で送信できなかった案件は破棄せず保留バッファに戻し、
+        coalesce_window後に再送する。
+        """
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            entries = list(self._pending.values())
+            self._pending.clear()
+        
+        results = []
+        for start in range(0, len(entries), ALERT_BATCH_MAX):
+            result = self._dispatch_alert(entries[start:start + ALERT_BATCH_MAX])
+            if result is None:
+                # 以降のまとまりも制限にかかるため、まとめて保留に戻す
+                self._requeue_alerts(entries[start:])
+                return False
+            results.append(result)
+        return all(results)
+    
+    def _requeue_alerts(self, entries: List[Dict]):
+        """送信できなかったアラートを保留バッファの先頭に戻し、再送用のタイマーを開始"""
+        with self._pending_lock:
+            pending: "OrderedDict[bytes, Dict]" = OrderedDict(
+                (self._entry_key(entry), entry) for entry in entries
+            )
+            for key, entry in self._pending.items():
+                pending.setdefault(key, entry)
+            self._pending = pending
+            
+            if self._pending and self._flush_timer is None and self.coalesce_window > 0:
+                self._flush_timer = threading.Timer(self.coalesce_window, self.flush_pending_alerts)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        
+        logger.warning(f"High priority alert deferred for {len(entries)} entries")
+    
+    def _dispatch_alert(self, entries: List[Dict]) -> Optional[bool]:
+        """アラートをメール・Teamsへ送信（流量制限で送信しなかった場合はNone）"""
+        # 通知済み・再通知抑制期間内・閾値未満の案件を除外
+        now = time.monotonic()
+        entries = [entry for entry in entries if self._should_push(entry, now)]
         if not entries:
             return True
             
-        if self.notification_count >= self.max_daily_notifications:
-            logger.warning("Daily notification limit reached")
-            return False
+        if not self._within_limits(now):
+            return None
         
         try:
-            # メール送信
-            email_sent = self._send_email_alert(entries, "高優先度案件アラート")
-            
-            # Teams送信
-            teams_sent = self._send_teams_alert(entries, "🚨 高優先度案件発見")
+            # メール・Teamsを並行送信
+            sent_at = datetime.now()
+            email_future = _EXECUTOR.submit(self._send_email_alert, entries, "高優先度案件アラート", sent_at)
+            teams_future = _EXECUTOR.submit(self._send_teams_alert, entries, "🚨 高優先度案件発見", sent_at)
+            email_sent = email_future.result(timeout=DISPATCH_TIMEOUT)
+            teams_sent = teams_future.result(timeout=DISPATCH_TIMEOUT)
             
             if email_sent or teams_sent:
-                self.notification_count += 1
+                self._record_push(entries, now)
                 logger.info(f"High priority alert sent for {len(entries)} entries")
                 return True
                 
@@ -49,18 +581,110 @@ class NotificationService:
             
         return False
     
+    def _within_limits(self, now: float) -> bool:
+        """直近60秒のプッシュ数と日次のトークンバケットによる流量制限を確認"""
+        with self._count_lock:
+            while self._push_times and now - self._push_times[0] >= RATE_LIMIT_WINDOW:
+                self._push_times.popleft()
+            if len(self._push_times) >= self.rate_limit_per_min:
+                logger.warning("Notification rate limit reached")
+                return False
+            
+            if not self._take_token(now):
+                logger.warning("Daily notification limit reached")
+                return False
+        
+        return True
+    
+    def _take_token(self, now: float) -> bool:
+        """トークンを補充して1つ消費（_count_lockを保持して呼び出す）"""
+        self._tokens = min(
+            float(self.max_daily_notifications),
+            self._tokens + max(0.0, now - self._last_refill) * self._refill_rate
+        )
+        self._last_refill = now
+        
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+    
+    def _record_push(self, entries: List[Dict], now: float):
+        """送信成功したアラートを通知数・流量制限・再通知抑制に反映"""
+        with self._count_lock:
+            self.notification_count += 1
+            self._push_times.append(now)
+            for entry in entries:
+                self._thread_last[self._thread_key(entry)] = now
+        self._mark_seen(entries)
+    
+    @staticmethod
+    def _dedup_entries(entries: List[Dict]) -> List[Dict]:
+        """URL（なければタイトル・発注機関）が重複する案件を除外（順序は保持）"""
+        seen = set()
+        unique = []
+        for entry in entries:
+            key = entry.get('source_url') or (entry.get('title'), entry.get('organization'))
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(entry)
+        return unique
+    
+    def _should_push(self, entry: Dict, now: float) -> bool:
+        """案件をプッシュ通知すべきか判定
+        
+        通知済みの案件と再通知抑制期間内の案件は除外する。
+        適合度が閾値未満の案件はhigh_impactが指定されている場合のみ通知する。
+        """
+        if self._entry_key(entry) in self._seen:
+            return False
+        
+        last_pushed = self._thread_last.get(self._thread_key(entry))
+        if last_pushed is not None and now - last_pushed < self.dedup_window:
+            return False
+        
+        return entry.get('relevance_score', 0) >= self.score_threshold or bool(entry.get('high_impact'))
+    
+    @staticmethod
+    def _thread_key(entry: Dict) -> str:
+        """再通知抑制の単位（URL、なければタイトル）"""
+        return entry.get('source_url') or entry.get('title', '')
+    
+    @staticmethod
+    def _entry_key(entry: Dict) -> bytes:
+        """案件の重複判定キー（URL・タイトル・発注機関の64bitハッシュ）"""
+        text = f"{entry.get('source_url', '')}|{entry.get('title', '')}|{entry.get('organization', '')}"
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    
+    def _mark_seen(self, entries: List[Dict]):
+        """通知済みとして記録（上限を超えたら最も古いキーから破棄）"""
+        for entry in entries:
+            key = self._entry_key(entry)
+            self._seen[key] = None
+            self._seen.move_to_end(key)
+        
+        while len(self._seen) > SEEN_CACHE_SIZE:
+            self._seen.popitem(last=False)
+    
     def send_daily_report(self, 
                          all_entries: List[Dict], 
                          high_priority: List[Dict],
                          medium_priority: List[Dict],
                          statistics: Dict) -> bool:
         """日次レポート送信"""
+        # 複数の検索条件で重複して収集された案件を除外
+        all_entries = self._dedup_entries(all_entries)
+        high_priority = self._dedup_entries(high_priority)
+        medium_priority = self._dedup_entries(medium_priority)
+        
         try:
-            # メールレポート送信
-            email_sent = self._send_email_report(all_entries, high_priority, medium_priority, statistics)
-            
-            # Teamsレポート送信
-            teams_sent = self._send_teams_report(all_entries, high_priority, medium_priority, statistics)
+            # メール・Teamsレポートを並行送信
+            report_args = (all_entries, high_priority, medium_priority, statistics, datetime.now())
+            email_future = _EXECUTOR.submit(self._send_email_report, *report_args)
+            teams_future = _EXECUTOR.submit(self._send_teams_report, *report_args)
+            email_sent = email_future.result(timeout=DISPATCH_TIMEOUT)
+            teams_sent = teams_future.result(timeout=DISPATCH_TIMEOUT)
             
             if email_sent or teams_sent:
                 logger.info("Daily report sent successfully")
@@ -71,29 +695,18 @@ class NotificationService:
             
         return False
     
-    def _send_email_alert(self, entries: List[Dict], subject: str) -> bool:
+    def _send_email_alert(self, entries: List[Dict], subject: str, now: Optional[datetime] = None) -> bool:
         """メールアラート送信"""
         if not self.email_user or not self.email_password or not self.email_to:
             logger.warning("Email configuration not complete")
             return False
         
         try:
-            # メール内容作成
-            body = self._create_email_body(entries)
-            
             # メール作成
-            msg = MIMEMultipart()
-            msg['From'] = self.email_user
-            msg['To'] = self.email_to
-            msg['Subject'] = f"[入札案件アラート] {subject} - {len(entries)}件"
+            msg = self._create_alert_email(entries, subject, now)
             
-            msg.attach(MIMEText(body, 'plain', 'utf-8'))
-            
-            # SMTP送信
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_user, self.email_password)
-                server.send_message(msg)
+            # SMTP送信（接続を再利用）
+            self._send_mail(msg)
             
             logger.info(f"Email alert sent to {self.email_to}")
             return True
@@ -102,23 +715,18 @@ class NotificationService:
             logger.error(f"Failed to send email alert: {e}")
             return False
     
-    def _send_teams_alert(self, entries: List[Dict], title: str) -> bool:
+    def _send_teams_alert(self, entries: List[Dict], title: str, now: Optional[datetime] = None) -> bool:
         """Teamsアラート送信"""
-        if not self.teams_webhook_url:
+        if not self.teams_webhook_url and not self._dry_run:
             logger.warning("Teams webhook URL not configured")
             return False
         
         try:
             # Teams メッセージ作成
-            message = self._create_teams_message(entries, title)
+            message = self._create_teams_message(entries, title, now)
             
             # Webhook送信
-            response = requests.post(
-                self.teams_webhook_url,
-                json=message,
-                timeout=10
-            )
-            response.raise_for_status()
+            self._post_webhook(dump_json_bytes(message), JSON_HEADERS)
             
             logger.info("Teams alert sent successfully")
             return True
@@ -127,32 +735,32 @@ class NotificationService:
             logger.error(f"Failed to send Teams alert: {e}")
             return False
     
+    def _post_webhook(self, body: bytes, headers: Dict[str, str]):
+        """Teams WebhookへPOST（2xx以外はWebhookErrorを送出）"""
+        if self._dry_run:
+            self._last_payload = body
+            return
+        
+        response = self._http.request('POST', self.teams_webhook_url, body=body, headers=headers)
+        if not 200 <= response.status < 300:
+            raise WebhookError(f"HTTP {response.status}: {response.data[:200]!r}")
+    
     def _send_email_report(self, 
                           all_entries: List[Dict], 
                           high_priority: List[Dict],
                           medium_priority: List[Dict],
-                          statistics: Dict) -> bool:
+                          statistics: Dict,
+                          now: Optional[datetime] = None) -> bool:
         """メール日次レポート送信"""
         if not self.email_user or not self.email_password or not self.email_to:
             return False
         
         try:
-            # レポート内容作成
-            body = self._create_email_report_body(all_entries, high_priority, medium_priority, statistics)
-            
             # メール作成
-            msg = MIMEMultipart()
-            msg['From'] = self.email_user
-            msg['To'] = self.email_to
-            msg['Subject'] = f"[入札案件] 日次レポート - {datetime.now().strftime('%Y/%m/%d')}"
-            
-            msg.attach(MIMEText(body, 'plain', 'utf-8'))
+            msg = self._create_report_email(all_entries, high_priority, medium_priority, statistics, now)
             
-            # SMTP送信
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_user, self.email_password)
-                server.send_message(msg)
+            # SMTP送信（接続を再利用）
+            self._send_mail(msg)
             
             logger.info("Email report sent successfully")
             return True
@@ -165,22 +773,18 @@ class NotificationService:
                           all_entries: List[Dict], 
                           high_priority: List[Dict],
                           medium_priority: List[Dict],
-                          statistics: Dict) -> bool:
+                          statistics: Dict,
+                          now: Optional[datetime] = None) -> bool:
         """Teams日次レポート送信"""
-        if not self.teams_webhook_url:
+        if not self.teams_webhook_url and not self._dry_run:
             return False
         
         try:
             # レポートメッセージ作成
-            message = self._create_teams_report_message(all_entries, high_priority, medium_priority, statistics)
+            message = self._create_teams_report_message(all_entries, high_priority, medium_priority, statistics, now)
             
-            # Webhook送信
-            response = requests.post(
-                self.teams_webhook_url,
-                json=message,
-                timeout=10
-            )
-            response.raise_for_status()
+            # Webhook送信（設定で有効な場合は大きいレポートを圧縮）
+            self._post_webhook(*encode_webhook_body(message, self.teams_webhook_gzip))
             
             logger.info("Teams report sent successfully")
             return True
@@ -189,256 +793,278 @@ class NotificationService:
             logger.error(f"Failed to send Teams report: {e}")
             return False
     
-    def _create_email_body(self, entries: List[Dict]) -> str:
+    def _create_email_message(self, subject: str, body: str) -> EmailMessage:
+        """テキスト1パートのメールを作成"""
+        msg = EmailMessage()
+        msg['From'] = self.email_user
+        msg['To'] = self.email_to
+        msg['Subject'] = subject
+        # 8bitのまま送り、8BITMIME非対応のサーバーへ送る場合のみ送信時にbase64へ変換する。
+        # 1行が上限を超える本文は8bitにできないため最初からbase64にする。
+        longest_line = max((len(line.encode('utf-8')) for line in body.splitlines()), default=0)
+        cte = '8bit' if longest_line <= SMTP_MAX_LINE_BYTES else 'base64'
+        msg.set_content(body, subtype='plain', charset='utf-8', cte=cte)
+        return msg
+    
+    def _create_alert_email(self, entries: List[Dict], subject: str, now: Optional[datetime] = None) -> EmailMessage:
+        """アラートメールを作成"""
+        body = self._create_email_body(entries, now)
+        return self._create_email_message(f"[入札案件アラート] {subject} - {len(entries)}件", body)
+    
+    def _create_report_email(self, 
+                             all_entries: List[Dict], 
+                             high_priority: List[Dict],
+                             medium_priority: List[Dict],
+                             statistics: Dict,
+                             now: Optional[datetime] = None) -> EmailMessage:
+        """日次レポートメールを作成"""
+        now = now or datetime.now()
+        body = self._create_email_report_body(all_entries, high_priority, medium_priority, statistics, now)
+        return self._create_email_message(f"[入札案件] 日次レポート - {now.strftime('%Y/%m/%d')}", body)
+    
+    def _create_email_body(self, entries: List[Dict], now: Optional[datetime] = None) -> str:
         """メール本文作成"""
-        body = f"新しい入札案件 {len(entries)}件が見つかりました。\n\n"
+        stamp = (now or datetime.now()).strftime('%Y/%m/%d %H:%M:%S')
+        parts = [f"新しい入札案件 {len(entries)}件が見つかりました。\n\n"]
+        append = parts.append
         
         for i, entry in enumerate(entries, 1):
-            body += f"【案件 {i}】\n"
-            body += f"タイトル: {entry.get('title', '')}\n"
-            body += f"発注機関: {entry.get('organization', '')}\n"
-            body += f"地域: {entry.get('region', '')}\n"
-            body += f"適合度: {entry.get('relevance_score', 0)}点\n"
-            
-            if entry.get('budget_amount'):
-                body += f"予算: {entry['budget_amount']:,}円\n"
-            
-            if entry.get('deadline_date'):
-                body += f"締切: {entry['deadline_date']}\n"
-            
-            if entry.get('source_url'):
-                body += f"URL: {entry['source_url']}\n"
-            
-            body += f"説明: {entry.get('description', '')[:200]}...\n"
-            body += "\n" + "="*50 + "\n\n"
+            get = entry.get
+            budget = get('budget_amount')
+            deadline = get('deadline_date')
+            url = get('source_url')
+            fields = defaultdict(str, entry)
+            fields['index'] = i
+            fields.setdefault('relevance_score', 0)
+            fields['description'] = get('description') or ""
+            fields['budget_line'] = f"予算: {budget:,}円\n" if budget else ""
+            fields['deadline_line'] = f"締切: {deadline}\n" if deadline else ""
+            fields['url_line'] = f"URL: {url}\n" if url else ""
+            append(EMAIL_ENTRY_TEMPLATE.format_map(fields))
         
-        body += f"送信時刻: {datetime.now().strftime('%Y/%m/%d %H:%M:%S')}\n"
+        append(f"送信時刻: {stamp}\n")
         
-        return body
+        return "".join(parts)
     
-    def _create_teams_message(self, entries: List[Dict], title: str) -> Dict:
+    def _create_teams_message(self, entries: List[Dict], title: str, now: Optional[datetime] = None) -> Dict:
         """Teamsメッセージ作成（Workflows対応）"""
-        
-        # 案件詳細テキスト作成
-        details_text = f"**{title}**\n\n新しい入札案件 {len(entries)}件が見つかりました。\n\n"
-        
-        for i, entry in enumerate(entries[:3], 1):
-            details_text += f"**案件 {i}:** {entry.get('title', '')}\n"
-            details_text += f"**発注機関:** {entry.get('organization', '')}\n"
-            details_text += f"**適合度:** {entry.get('relevance_score', 0)}点\n"
-            if entry.get('source_url'):
-                details_text += f"**詳細:** [{entry.get('source_url')}]({entry.get('source_url')})\n"
-            details_text += "\n---\n\n"
-        
-        if len(entries) > 3:
-            details_text += f"その他 {len(entries) - 3}件の案件があります。\n\n"
-        
-        details_text += f"**収集時刻:** {datetime.now().strftime('%Y/%m/%d %H:%M')}"
+        collected_at = (now or datetime.now()).strftime('%Y/%m/%d %H:%M')
+        count = len(entries)
+        shown = entries[:ALERT_CARD_MAX_ENTRIES]
+        extra = count - len(shown)
         
         # Teams Workflows対応形式
-        message = {
-            "type": "message",
-            "attachments": [
-                {
-                    "contentType": "application/vnd.microsoft.card.adaptive",
-                    "content": {
-                        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-                        "type": "AdaptiveCard",
-                        "version": "1.4",
-                        "body": [
-                            {
-                                "type": "TextBlock",
-                                "text": title,
-                                "weight": "Bolder",
-                                "size": "Large",
-                                "color": "Attention"
-                            },
-                            {
-                                "type": "TextBlock",
-                                "text": f"新しい入札案件 **{len(entries)}件** が見つかりました",
-                                "wrap": True,
-                                "spacing": "Medium"
-                            }
-                        ]
-                    }
-                }
-            ]
-        }
+        body = [
+            {
+                "type": "TextBlock",
+                "text": title,
+                "weight": "Bolder",
+                "size": "Large",
+                "color": "Attention"
+            },
+            {
+                "type": "TextBlock",
+                "text": f"新しい入札案件 **{count}件** が見つかりました",
+                "wrap": True,
+                "spacing": "Medium"
+            }
+        ]
         
         # 案件詳細を追加
-        for i, entry in enumerate(entries[:3], 1):
-            fact_set = {
-                "type": "FactSet",
-                "facts": [
-                    {
-                        "title": "タイトル:",
-                        "value": entry.get('title', '')[:100]
-                    },
-                    {
-                        "title": "発注機関:",
-                        "value": entry.get('organization', '')
-                    },
-                    {
-                        "title": "適合度:",
-                        "value": f"{entry.get('relevance_score', 0)}点"
-                    }
-                ]
-            }
-            
-            if entry.get('deadline_date'):
-                fact_set["facts"].append({
-                    "title": "締切:",
-                    "value": entry.get('deadline_date')
-                })
-            
-            message["attachments"][0]["content"]["body"].append({
+        for i, entry in enumerate(shown, 1):
+            get = entry.get
+            body.append({
                 "type": "TextBlock",
                 "text": f"**案件 {i}**",
                 "weight": "Bolder",
                 "spacing": "Large"
             })
-            
-            message["attachments"][0]["content"]["body"].append(fact_set)
-            
-            if entry.get('source_url'):
-                message["attachments"][0]["content"]["body"].append({
-                    "type": "ActionSet",
-                    "actions": [
-                        {
-                            "type": "Action.OpenUrl",
-                            "title": "詳細を見る",
-                            "url": entry.get('source_url')
-                        }
-                    ]
-                })
+            body.extend(render_alert_entry_nodes(
+                get('title', ''), get('organization', ''), get('relevance_score', 0),
+                get('deadline_date'), get('source_url')
+            ))
         
-        if len(entries) > 3:
-            message["attachments"][0]["content"]["body"].append({
+        if extra:
+            body.append({
                 "type": "TextBlock",
-                "text": f"その他 **{len(entries) - 3}件** の案件があります",
+                "text": f"その他 **{extra}件** の案件があります",
                 "wrap": True,
                 "spacing": "Large",
                 "color": "Good"
             })
         
         # 収集時刻を追加
-        message["attachments"][0]["content"]["body"].append({
+        body.append({
             "type": "TextBlock",
-            "text": f"収集時刻: {datetime.now().strftime('%Y/%m/%d %H:%M')}",
+            "text": f"収集時刻: {collected_at}",
             "size": "Small",
             "color": "Dark",
             "spacing": "Large"
         })
         
-        return message
+        return build_adaptive_card_message(body)
     
     def _create_email_report_body(self, 
                                  all_entries: List[Dict], 
                                  high_priority: List[Dict],
                                  medium_priority: List[Dict],
-                                 statistics: Dict) -> str:
+                                 statistics: Dict,
+                                 now: Optional[datetime] = None) -> str:
         """メール日次レポート本文作成"""
-        body = f"【入札案件 日次レポート】 {datetime.now().strftime('%Y/%m/%d')}\n\n"
+        now = now or datetime.now()
+        today = now.strftime('%Y/%m/%d')
+        stamp = now.strftime('%Y/%m/%d %H:%M:%S')
+        parts = [f"【入札案件 日次レポート】 {today}\n\n"]
+        append = parts.append
         
         # 統計情報
-        body += "【統計情報】\n"
-        body += f"総収集件数: {statistics.get('total_collected', 0)}件\n"
-        body += f"処理完了件数: {statistics.get('total_processed', 0)}件\n"
-        body += f"高優先度案件: {len(high_priority)}件\n"
-        body += f"中優先度案件: {len(medium_priority)}件\n"
-        body += f"処理時間: {statistics.get('processing_time', 0):.2f}秒\n\n"
+        append(
+            "【統計情報】\n"
+            f"総収集件数: {statistics.get('total_collected', 0)}件\n"
+            f"処理完了件数: {statistics.get('total_processed', 0)}件\n"
+            f"高優先度案件: {len(high_priority)}件\n"
+            f"中優先度案件: {len(medium_priority)}件\n"
+            f"処理時間: {statistics.get('processing_time', 0):.2f}秒\n\n"
+        )
         
         # 高優先度案件
         if high_priority:
-            body += "【高優先度案件】\n"
+            append("【高優先度案件】\n")
             for entry in high_priority:
-                body += f"・{entry.get('title', '')} ({entry.get('relevance_score', 0)}点)\n"
-                body += f"  {entry.get('organization', '')} - {entry.get('region', '')}\n"
+                get = entry.get
+                append(
+                    f"・{get('title', '')} ({get('relevance_score', 0)}点)\n"
+                    f"  {get('organization', '')} - {get('region', '')}\n"
+                )
         else:
-            body += "【高優先度案件】\n該当なし\n"
+            append("【高優先度案件】\n該当なし\n")
         
-        body += "\n"
+        append("\n")
         
         # 中優先度案件
         if medium_priority:
-            body += "【中優先度案件】\n"
+            append("【中優先度案件】\n")
             for entry in medium_priority[:10]:  # 最大10件
-                body += f"・{entry.get('title', '')} ({entry.get('relevance_score', 0)}点)\n"
+                get = entry.get
+                append(f"・{get('title', '')} ({get('relevance_score', 0)}点)\n")
             if len(medium_priority) > 10:
-                body += f"...他 {len(medium_priority) - 10}件\n"
+                append(f"...他 {len(medium_priority) - 10}件\n")
         else:
-            body += "【中優先度案件】\n該当なし\n"
+            append("【中優先度案件】\n該当なし\n")
+        
+        append(f"\n生成時刻: {stamp}\n")
+        
+        return "".join(parts)
+    
+    def _write_report_html(self, entries: List[Dict], now: datetime) -> Optional[str]:
+        """高優先度案件の一覧をHTMLに書き出し、公開URLを返す（公開URL未設定・書き込み失敗時はNone）"""
+        if not settings.report_base_url:
+            return None
         
-        body += f"\n生成時刻: {datetime.now().strftime('%Y/%m/%d %H:%M:%S')}\n"
+        filename = f"report-{now.strftime('%Y%m%d')}.html"
+        rows = []
+        for i, entry in enumerate(entries, 1):
+            get = entry.get
+            title = escape(get('title', ''))
+            url = get('source_url')
+            rows.append(REPORT_HTML_ROW_TEMPLATE.format(
+                index=i,
+                title=f'<a href="{escape(url)}">{title}</a>' if url else title,
+                organization=escape(get('organization', '')),
+                score=get('relevance_score', 0),
+                deadline=escape(str(get('deadline_date') or '-'))
+            ))
+        
+        html = REPORT_HTML_TEMPLATE.format(
+            date=now.strftime('%Y/%m/%d'),
+            count=len(entries),
+            rows="\n".join(rows),
+            stamp=now.strftime('%Y/%m/%d %H:%M')
+        )
+        
+        if not self._dry_run:
+            try:
+                os.makedirs(settings.report_output_dir, exist_ok=True)
+                with open(os.path.join(settings.report_output_dir, filename), 'w', encoding='utf-8') as f:
+                    f.write(html)
+            except OSError as e:
+                logger.error(f"Failed to write report HTML: {e}")
+                return None
         
-        return body
+        return f"{settings.report_base_url.rstrip('/')}/{filename}"
     
     def _create_teams_report_message(self, 
                                    all_entries: List[Dict], 
                                    high_priority: List[Dict],
                                    medium_priority: List[Dict],
-                                   statistics: Dict) -> Dict:
-        """Teams日次レポートメッセージ作成（Workflows対応）"""
+                                   statistics: Dict,
+                                   now: Optional[datetime] = None) -> Dict:
+        """Teams日次レポートメッセージ作成（Workflows対応）
+        
+        レポートの公開URLが設定されている場合、高優先度案件はHTMLに書き出し、
+        カードには件数とレポートへのリンクのみを載せる。
+        """
+        now = now or datetime.now()
         
         # Teams Workflows対応形式
-        message = {
-            "type": "message",
-            "attachments": [
-                {
-                    "contentType": "application/vnd.microsoft.card.adaptive",
-                    "content": {
-                        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-                        "type": "AdaptiveCard",
-                        "version": "1.4",
-                        "body": [
-                            {
-                                "type": "TextBlock",
-                                "text": "📊 入札案件 日次レポート",
-                                "weight": "Bolder",
-                                "size": "Large",
-                                "color": "Good"
-                            },
-                            {
-                                "type": "TextBlock",
-                                "text": datetime.now().strftime('%Y年%m月%d日'),
-                                "weight": "Lighter",
-                                "spacing": "None"
-                            },
-                            {
-                                "type": "FactSet",
-                                "spacing": "Medium",
-                                "facts": [
-                                    {
-                                        "title": "総収集件数:",
-                                        "value": f"{statistics.get('total_collected', 0)}件"
-                                    },
-                                    {
-                                        "title": "処理完了件数:",
-                                        "value": f"{statistics.get('total_processed', 0)}件"
-                                    },
-                                    {
-                                        "title": "高優先度案件:",
-                                        "value": f"{len(high_priority)}件"
-                                    },
-                                    {
-                                        "title": "中優先度案件:",
-                                        "value": f"{len(medium_priority)}件"
-                                    },
-                                    {
-                                        "title": "処理時間:",
-                                        "value": f"{statistics.get('processing_time', 0):.1f}秒"
-                                    }
-                                ]
-                            }
-                        ]
+        body = [
+            {
+                "type": "TextBlock",
+                "text": "📊 入札案件 日次レポート",
+                "weight": "Bolder",
+                "size": "Large",
+                "color": "Good"
+            },
+            {
+                "type": "TextBlock",
+                "text": now.strftime('%Y年%m月%d日'),
+                "weight": "Lighter",
+                "spacing": "None"
+            },
+            {
+                "type": "FactSet",
+                "spacing": "Medium",
+                "facts": [
+                    {
+                        "title": "総収集件数:",
+                        "value": f"{statistics.get('total_collected', 0)}件"
+                    },
+                    {
+                        "title": "処理完了件数:",
+                        "value": f"{statistics.get('total_processed', 0)}件"
+                    },
+                    {
+                        "title": "高優先度案件:",
+                        "value": f"{len(high_priority)}件"
+                    },
+                    {
+                        "title": "中優先度案件:",
+                        "value": f"{len(medium_priority)}件"
+                    },
+                    {
+                        "title": "処理時間:",
+                        "value": f"{statistics.get('processing_time', 0):.1f}秒"
                     }
-                }
-            ]
-        }
+                ]
+            }
+        ]
         
         # 高優先度案件の詳細
-        if high_priority:
-            message["attachments"][0]["content"]["body"].append({
+        report_url = self._write_report_html(high_priority, now) if high_priority else None
+        if report_url:
+            body.append({
+                "type": "ActionSet",
+                "spacing": "Large",
+                "actions": [
+                    {
+                        "type": "Action.OpenUrl",
+                        "title": f"🚨 高優先度案件 {len(high_priority)}件のレポートを見る",
+                        "url": report_url
+                    }
+                ]
+            })
+        elif high_priority:
+            body.append({
                 "type": "TextBlock",
                 "text": "🚨 高優先度案件",
                 "weight": "Bolder",
@@ -446,46 +1072,23 @@ class NotificationService:
                 "color": "Attention"
             })
             
-            for i, entry in enumerate(high_priority[:5], 1):  # 最大5件
-                message["attachments"][0]["content"]["body"].append({
-                    "type": "FactSet",
-                    "facts": [
-                        {
-                            "title": f"案件 {i}:",
-                            "value": entry.get('title', '')[:80]
-                        },
-                        {
-                            "title": "発注機関:",
-                            "value": entry.get('organization', '')
-                        },
-                        {
-                            "title": "適合度:",
-                            "value": f"{entry.get('relevance_score', 0)}点"
-                        }
-                    ]
-                })
-                
-                if entry.get('source_url'):
-                    message["attachments"][0]["content"]["body"].append({
-                        "type": "ActionSet",
-                        "actions": [
-                            {
-                                "type": "Action.OpenUrl",
-                                "title": f"案件 {i} 詳細を見る",
-                                "url": entry.get('source_url')
-                            }
-                        ]
-                    })
-            
-            if len(high_priority) > 5:
-                message["attachments"][0]["content"]["body"].append({
+            shown = high_priority[:REPORT_CARD_MAX_ENTRIES]
+            extra = len(high_priority) - len(shown)
+            for i, entry in enumerate(shown, 1):
+                get = entry.get
+                body.extend(render_report_entry_nodes(
+                    i, get('title', ''), get('organization', ''), get('relevance_score', 0), get('source_url')
+                ))
+            
+            if extra:
+                body.append({
                     "type": "TextBlock",
-                    "text": f"その他 **{len(high_priority) - 5}件** の高優先度案件があります",
+                    "text": f"その他 **{extra}件** の高優先度案件があります",
                     "wrap": True,
                     "spacing": "Medium"
                 })
         else:
-            message["attachments"][0]["content"]["body"].append({
+            body.append({
                 "type": "TextBlock",
                 "text": "🚨 高優先度案件: 該当なし",
                 "weight": "Bolder",
@@ -493,53 +1096,291 @@ class NotificationService:
             })
         
         # 生成時刻を追加
-        message["attachments"][0]["content"]["body"].append({
+        body.append({
             "type": "TextBlock",
-            "text": f"レポート生成時刻: {datetime.now().strftime('%Y/%m/%d %H:%M')}",
+            "text": f"レポート生成時刻: {now.strftime('%Y/%m/%d %H:%M')}",
             "size": "Small",
             "color": "Dark",
             "spacing": "Large"
         })
         
-        return message
+        return build_adaptive_card_message(body)
+
+class AsyncNotificationService(NotificationService):
+    """非同期通知サービスクラス
+    
+    Teams Webhookはhttpx.AsyncClient（h2があればHTTP/2）で、メールは
+    aiosmtplibの持続接続で送信し、両者を同じイベントループ上で並行させる。
+    httpx・aiosmtplibが利用できない場合は同期版の送信をスレッドで実行する。
+    """
+    
+    def __init__(self, dry_run: bool = False):
+        super().__init__(dry_run)
+        self._client = None
+        self._smtp_async = None
+        self._smtp_async_lock: Optional[asyncio.Lock] = None
+        if HAS_HTTPX:
+            self._client = httpx.AsyncClient(
+                http2=HAS_HTTP2,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=4),
+                headers=JSON_HEADERS
+            )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """非同期HTTPクライアントと同期側の接続を閉じる"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._smtp_async is not None:
+            try:
+                await self._smtp_async.quit()
+            except (aiosmtplib.SMTPException, OSError) as e:
+                logger.debug(f"SMTP quit failed: {e}")
+                self._smtp_async.close()
+            self._smtp_async = None
+        await asyncio.to_thread(self.close)
+    
+    async def send_high_priority_alert_async(self, entries: List[Dict]) -> bool:
+        """高優先度案件のアラート送信（非同期・保留バッファを使わず即時送信）"""
+        now = time.monotonic()
+        entries = [entry for entry in self._dedup_entries(entries) if self._should_push(entry, now)]
+        if not entries:
+            return True
+        
+        if not self._within_limits(now):
+            return False
+        
+        try:
+            sent_at = datetime.now()
+            email_sent, teams_sent = await asyncio.wait_for(
+                asyncio.gather(
+                    self._send_email_alert_async(entries, "高優先度案件アラート", sent_at),
+                    self._post_teams_async(self._create_teams_message(entries, "🚨 高優先度案件発見", sent_at), "alert")
+                ),
+                timeout=DISPATCH_TIMEOUT
+            )
+            
+            if email_sent or teams_sent:
+                self._record_push(entries, now)
+                logger.info(f"High priority alert sent for {len(entries)} entries")
+                return True
+                
+        except Exception as e:
+            logger.error(f"Failed to send high priority alert: {e}")
+            
+        return False
+    
+    async def send_daily_report_async(self, 
+                                      all_entries: List[Dict], 
+                                      high_priority: List[Dict],
+                                      medium_priority: List[Dict],
+                                      statistics: Dict) -> bool:
+        """日次レポート送信（非同期）"""
+        report_args = (
+            self._dedup_entries(all_entries),
+            self._dedup_entries(high_priority),
+            self._dedup_entries(medium_priority),
+            statistics,
+            datetime.now()
+        )
+        
+        try:
+            email_sent, teams_sent = await asyncio.wait_for(
+                asyncio.gather(
+                    self._send_email_report_async(*report_args),
+                    self._post_teams_async(self._create_teams_report_message(*report_args), "report")
+                ),
+                timeout=DISPATCH_TIMEOUT
+            )
+            
+            if email_sent or teams_sent:
+                logger.info("Daily report sent successfully")
+                return True
+                
+        except Exception as e:
+            logger.error(f"Failed to send daily report: {e}")
+            
+        return False
+    
+    async def _send_email_alert_async(self, entries: List[Dict], subject: str, now: datetime) -> bool:
+        """メールアラート送信（非同期）"""
+        if not HAS_AIOSMTPLIB:
+            return await asyncio.to_thread(self._send_email_alert, entries, subject, now)
+        
+        if not self.email_user or not self.email_password or not self.email_to:
+            logger.warning("Email configuration not complete")
+            return False
+        
+        try:
+            await self._send_mail_async(self._create_alert_email(entries, subject, now))
+            logger.info(f"Email alert sent to {self.email_to}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to send email alert: {e}")
+            return False
+    
+    async def _send_email_report_async(self, 
+                                       all_entries: List[Dict], 
+                                       high_priority: List[Dict],
+                                       medium_priority: List[Dict],
+                                       statistics: Dict,
+                                       now: datetime) -> bool:
+        """メール日次レポート送信（非同期）"""
+        report_args = (all_entries, high_priority, medium_priority, statistics, now)
+        if not HAS_AIOSMTPLIB:
+            return await asyncio.to_thread(self._send_email_report, *report_args)
+        
+        if not self.email_user or not self.email_password or not self.email_to:
+            return False
+        
+        try:
+            await self._send_mail_async(self._create_report_email(*report_args))
+            logger.info("Email report sent successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to send email report: {e}")
+            return False
+    
+    async def _send_mail_async(self, msg: EmailMessage):
+        """持続SMTP接続でメールを送信（切断されていれば一度だけ再接続して再送）"""
+        if self._dry_run:
+            self._last_payload = msg
+            return
+        
+        # ロックは実行中のイベントループで生成する
+        if self._smtp_async_lock is None:
+            self._smtp_async_lock = asyncio.Lock()
+        
+        async with self._smtp_async_lock:
+            smtp = await self._get_smtp_async()
+            try:
+                mail_options = self._mail_options_for(msg, smtp.supports_extension('8bitmime'))
+                await smtp.send_message(msg, mail_options=list(mail_options))
+            except (aiosmtplib.SMTPServerDisconnected, ConnectionResetError, TimeoutError):
+                logger.info("SMTP connection lost while sending, retrying once")
+                smtp.close()
+                self._smtp_async = None
+                smtp = await self._get_smtp_async()
+                mail_options = self._mail_options_for(msg, smtp.supports_extension('8bitmime'))
+                await smtp.send_message(msg, mail_options=list(mail_options))
+    
+    async def _get_smtp_async(self) -> "aiosmtplib.SMTP":
+        """非同期SMTP接続を取得（未接続・切断時のみ接続してログイン）"""
+        if self._smtp_async is not None:
+            try:
+                response = await self._smtp_async.noop()
+                if response.code == 250:
+                    return self._smtp_async
+            except (aiosmtplib.SMTPException, OSError):
+                pass
+            logger.info("SMTP connection lost, reconnecting")
+            self._smtp_async.close()
+            self._smtp_async = None
+        
+        smtp = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port, start_tls=False)
+        await smtp.connect()
+        try:
+            await smtp.starttls()
+            await smtp.login(self.email_user, self.email_password)
+        except Exception:
+            smtp.close()
+            raise
+        
+        self._smtp_async = smtp
+        return smtp
+    
+    async def _post_teams_async(self, message: Dict, kind: str) -> bool:
+        """TeamsへWebhook送信（非同期）"""
+        if not self.teams_webhook_url and not self._dry_run:
+            logger.warning("Teams webhook URL not configured")
+            return False
+        
+        try:
+            # 日次レポートは大きくなりやすいため圧縮対象にする（設定で有効な場合のみ）
+            if kind == "report":
+                body, headers = encode_webhook_body(message, self.teams_webhook_gzip)
+            else:
+                body, headers = dump_json_bytes(message), JSON_HEADERS
+            if self._dry_run:
+                self._last_payload = body
+            elif self._client is not None:
+                response = await self._client.post(self.teams_webhook_url, content=body, headers=headers)
+                response.raise_for_status()
+            else:
+                await asyncio.to_thread(self._post_webhook, body, headers)
+            
+            logger.info(f"Teams {kind} sent successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to send Teams {kind}: {e}")
+            return False
+
+# テスト用サンプルデータ（読み取り専用）
+SAMPLE_ENTRIES = (
+    MappingProxyType({
+        "title": "コールセンター業務委託",
+        "organization": "○○市",
+        "region": "東京都",
+        "relevance_score": 85,
+        "budget_amount": 5000000,
+        "deadline_date": "2025-08-01",
+        "source_url": "https://example.com/bid/1",
+        "description": "市民からの問い合わせ対応業務"
+    }),
+)
+
+SAMPLE_STATS = MappingProxyType({
+    "total_collected": 150,
+    "total_processed": 10,
+    "processing_time": 45.2
+})
 
 # テスト用クラス
 class NotificationTester:
     """通知テスト用クラス"""
     
     @staticmethod
-    def test_notifications():
-        """通知テスト実行"""
-        # テスト用設定
-        notifier = NotificationService()
+    def test_notifications(dry_run: bool = True):
+        """通知テスト実行（dry_runでは送信せず、本文作成の所要時間を表示）"""
+        sample_entries = list(SAMPLE_ENTRIES)
         
-        # サンプルデータ
-        sample_entries = [
-            {
-                "title": "コールセンター業務委託",
-                "organization": "○○市",
-                "region": "東京都",
-                "relevance_score": 85,
-                "budget_amount": 5000000,
-                "deadline_date": "2025-08-01",
-                "source_url": "https://example.com/bid/1",
-                "description": "市民からの問い合わせ対応業務"
-            }
-        ]
+        # テスト用設定
+        with NotificationService(dry_run=dry_run) as notifier:
+            # アラートテスト
+            print("Testing high priority alert...")
+            notifier.send_high_priority_alert(sample_entries)
         
-        statistics = {
-            "total_collected": 150,
-            "total_processed": 10,
-            "processing_time": 45.2
+            # レポートテスト
+            print("Testing daily report...")
+            notifier.send_daily_report(sample_entries, sample_entries, [], SAMPLE_STATS)
+            
+            if dry_run:
+                NotificationTester._print_builder_timings(notifier, sample_entries)
+    
+    @staticmethod
+    def _print_builder_timings(notifier: NotificationService, sample_entries: List[Dict]):
+        """各本文作成処理の所要時間を表示"""
+        builders = {
+            "email body": lambda: notifier._create_email_body(sample_entries),
+            "teams message": lambda: notifier._create_teams_message(sample_entries, "テスト"),
+            "email report": lambda: notifier._create_email_report_body(sample_entries, sample_entries, [], SAMPLE_STATS),
+            "teams report": lambda: notifier._create_teams_report_message(sample_entries, sample_entries, [], SAMPLE_STATS)
         }
         
-        # アラートテスト
-        print("Testing high priority alert...")
-        notifier.send_high_priority_alert(sample_entries)
-        
-        # レポートテスト
-        print("Testing daily report...")
-        notifier.send_daily_report(sample_entries, sample_entries, [], statistics)
+        for name, build in builders.items():
+            start = time.perf_counter()
+            build()
+            print(f"{name}: {(time.perf_counter() - start) * 1000:.3f} ms")
 
 if __name__ == "__main__":
     NotificationTester.test_notifications()
@@ -1,168 +1,303 @@
 import re
-import json
-from typing import List, Dict, Set, Tuple
+from bisect import bisect_right
+try:
+    from datasketch import MinHash, MinHashLSH
+    HAS_DATASKETCH = True
+except ImportError:
+    HAS_DATASKETCH = False
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import List, Dict, Set, Tuple, FrozenSet, Iterable, NamedTuple, Optional
 from datetime import datetime, date
 import logging
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# タイトル類似度（Jaccard係数）がこの値を超えると重複とみなす
+TITLE_SIMILARITY_THRESHOLD = 0.8
+
+# MinHash LSHの設定（候補の取りこぼしを抑えるため、LSHの閾値は判定閾値より低くし、候補は厳密に比較する）
+MINHASH_NUM_PERM = 64
+MINHASH_LSH_THRESHOLD = 0.6
+
+# 単語分割用パターン
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# 段階的な加点表（閾値の昇順、bisect_rightの結果で加点を引く）
+BUDGET_THRESHOLDS = (1000000, 5000000, 10000000)  # 100万円・500万円・1000万円以上
+BUDGET_BONUSES = (0, 10, 15, 20)
+DEADLINE_THRESHOLDS = (7, 14)  # 1週間・2週間以上
+DEADLINE_BONUSES = (0, 5, 10)
+
+# 地域による加点（上から順に判定し、最初に該当したものを加点）
+REGION_BONUS_TIERS = (
+    (re.compile('東京|神奈川|千葉|埼玉'), 15),  # 本社近郊
+    (re.compile('大阪|京都|兵庫'), 10)
+)
+MUNICIPALITY_PATTERN = re.compile('[市区町村]')  # 基礎自治体
+MUNICIPALITY_BONUS = 5
+MAX_RELEVANCE_SCORE = 100
+
+
+@lru_cache(maxsize=1024)
+def parse_date(date_str: str) -> date:
+    """YYYY-MM-DD形式の日付文字列を変換（同じ日付が繰り返し現れるため結果をキャッシュ）
+    
+    ゼロ埋めされた10文字の形式は文字列の切り出しで変換し、それ以外はstrptimeに任せる。
+    不正な日付はValueErrorを送出する。
+    """
+    if len(date_str) == 10 and date_str[4] == date_str[7] == '-' and date_str[:4].isdigit() \
+            and date_str[5:7].isdigit() and date_str[8:].isdigit():
+        return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+
+@lru_cache(maxsize=4096)
+def title_tokens(text: str) -> FrozenSet[str]:
+    """テキストを小文字化して単語集合に分割（同じタイトルは一度だけ分割する）"""
+    return frozenset(TOKEN_PATTERN.findall(text.lower()))
+
+
+def jaccard(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+    """Jaccard係数（和集合は作らず要素数から計算）"""
+    if not words1 or not words2:
+        return 0.0
+    
+    intersection = len(words1 & words2)
+    return intersection / (len(words1) + len(words2) - intersection)
+
+
+class KeywordScan(NamedTuple):
+    """エントリのキーワード走査結果"""
+    excluded_by: Optional[str]  # 最初に見つかった除外キーワード
+    matched: Tuple[str, ...]  # タイトル・説明文に含まれる対象キーワード（対象キーワードの定義順）
+    in_title: FrozenSet[str]  # そのうちタイトルに含まれるもの
+
+
+class DuplicateIndex:
+    """受理済みエントリの重複判定用索引
+    
+    URLは集合で完全一致を判定し、タイトルは単語集合のJaccard係数で判定する。
+    datasketchが利用可能な場合はMinHash LSHで類似候補を絞り込み、候補のみ厳密に比較する。
+    利用できない場合は単語数ごとに分けて保持し、Jaccard係数が閾値を超えうる単語数の組のみ比較する
+    （Jaccard係数は 小さい集合の要素数/大きい集合の要素数 を超えない）。
+    """
+    
+    def __init__(self):
+        self._urls: Set[str] = set()
+        self._token_sets: List[FrozenSet[str]] = []
+        self._token_sets_by_size: Dict[int, List[FrozenSet[str]]] = defaultdict(list)
+        self._lsh = MinHashLSH(threshold=MINHASH_LSH_THRESHOLD, num_perm=MINHASH_NUM_PERM) if HAS_DATASKETCH else None
+    
+    def is_duplicate(self, entry: Dict) -> bool:
+        """受理済みエントリと重複しているか"""
+        url = entry.get('source_url')
+        if url and url in self._urls:
+            return True
+        
+        tokens = title_tokens(entry.get('title', ''))
+        if not tokens:
+            return False
+        
+        return any(
+            jaccard(tokens, other) > TITLE_SIMILARITY_THRESHOLD
+            for other in self._candidates(tokens)
+        )
+    
+    def add(self, entry: Dict):
+        """受理したエントリを索引に追加"""
+        url = entry.get('source_url')
+        if url:
+            self._urls.add(url)
+        
+        tokens = title_tokens(entry.get('title', ''))
+        if self._lsh is not None:
+            if tokens:
+                self._lsh.insert(len(self._token_sets), self._minhash(tokens))
+            self._token_sets.append(tokens)
+        elif tokens:
+            self._token_sets_by_size[len(tokens)].append(tokens)
+    
+    def _candidates(self, tokens: FrozenSet[str]) -> Iterable[FrozenSet[str]]:
+        """類似している可能性のある受理済みエントリの単語集合"""
+        if self._lsh is not None:
+            return (self._token_sets[i] for i in self._lsh.query(self._minhash(tokens)))
+        
+        size = len(tokens)
+        return chain.from_iterable(
+            token_sets for other_size, token_sets in self._token_sets_by_size.items()
+            if min(size, other_size) / max(size, other_size) > TITLE_SIMILARITY_THRESHOLD
+        )
+    
+    @staticmethod
+    def _minhash(tokens: FrozenSet[str]) -> 'MinHash':
+        minhash = MinHash(num_perm=MINHASH_NUM_PERM)
+        minhash.update_batch([token.encode('utf-8') for token in tokens])
+        return minhash
+
+
+@lru_cache(maxsize=8)
+def build_keyword_tables(target_keywords: Tuple[str, ...],
+                         exclude_keywords: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...], Optional['ahocorasick.Automaton']]:
+    """小文字化した対象・除外キーワードと、両者をまとめたAho-Corasickオートマトンを作成
+    
+    キーワードの組ごとに一度だけ作成し、BidDataProcessorのインスタンス間で共有する
+    （設定のキーワードが変われば別の組として作り直される）。
+    オートマトンの値は(除外か, 対象か, 語)。pyahocorasickが利用できない場合はNone。
+    """
+    target = tuple(kw.lower() for kw in target_keywords)
+    exclude = tuple(kw.lower() for kw in exclude_keywords)
+    if not HAS_AHOCORASICK:
+        return target, exclude, None
+    
+    automaton = ahocorasick.Automaton()
+    exclude_set = set(exclude)
+    target_set = set(target)
+    for keyword in exclude_set | target_set:
+        automaton.add_word(keyword, (keyword in exclude_set, keyword in target_set, keyword))
+    automaton.make_automaton()
+    return target, exclude, automaton
+
+
 class BidDataProcessor:
     """入札データ処理クラス"""
     
     def __init__(self):
-        self.target_keywords = [kw.lower() for kw in settings.target_keywords]
-        self.exclude_keywords = [kw.lower() for kw in settings.exclude_keywords]
+        self.target_keywords, self.exclude_keywords, self._automaton = build_keyword_tables(
+            tuple(settings.target_keywords), tuple(settings.exclude_keywords)
+        )
+    
+    def _scan_keywords(self, entry: Dict) -> KeywordScan:
+        """タイトル・説明文を一度だけ走査して除外キーワードと対象キーワードを検出"""
+        title = entry.get('title', '').lower()
+        description = entry.get('description', '').lower()
+        text_to_check = f"{title} {description}"
+        
+        if self._automaton is None:
+            excluded_by = next((kw for kw in self.exclude_keywords if kw in text_to_check), None)
+            matched = tuple(kw for kw in self.target_keywords if kw in text_to_check)
+            return KeywordScan(excluded_by, matched, frozenset(kw for kw in matched if kw in title))
+        
+        # 終了位置がタイトル長未満のヒットはタイトル内に収まっている
+        title_length = len(title)
+        matched = set()
+        in_title = set()
+        for end, (is_exclude, is_target, keyword) in self._automaton.iter(text_to_check):
+            if is_exclude:
+                return KeywordScan(keyword, (), frozenset())
+            if is_target:
+                matched.add(keyword)
+                if end < title_length:
+                    in_title.add(keyword)
+        
+        return KeywordScan(None, tuple(kw for kw in self.target_keywords if kw in matched), frozenset(in_title))
         
     def process_entries(self, entries: List[Dict]) -> List[Dict]:
         """入札データの処理"""
         processed_entries = []
+        duplicates = DuplicateIndex()
+        today = date.today()
         
         for entry in entries:
             try:
                 # 重複チェック
-                if self._is_duplicate(entry, processed_entries):
+                if duplicates.is_duplicate(entry):
                     continue
                 
+                # キーワード走査（フィルタ・スコア・キーワード記録で共有）
+                scan = self._scan_keywords(entry)
+                
                 # フィルタリング
-                if not self._passes_filters(entry):
+                if not self._passes_filters(entry, scan):
                     continue
                 
                 # 適合度スコア計算
-                entry['relevance_score'] = self._calculate_relevance_score(entry)
+                entry['relevance_score'] = self._calculate_relevance_score(entry, scan, today)
                 
                 # マッチしたキーワードを記録
-                entry['keywords_matched'] = self._get_matched_keywords(entry)
+                entry['keywords_matched'] = list(scan.matched)
                 
                 processed_entries.append(entry)
+                duplicates.add(entry)
                 
             except Exception as e:
                 logger.warning(f"Failed to process entry: {e}")
                 continue
         
         # 適合度でソート
-        processed_entries.sort(key=lambda x: x['relevance_score'], reverse=True)
+        processed_entries.sort(key=itemgetter('relevance_score'), reverse=True)
         
         logger.info(f"Processed {len(processed_entries)} entries from {len(entries)} raw entries")
         return processed_entries
     
-    def _is_duplicate(self, entry: Dict, existing_entries: List[Dict]) -> bool:
-        """重複チェック"""
-        for existing in existing_entries:
-            # タイトルの類似度チェック
-            if self._calculate_similarity(entry.get('title', ''), existing.get('title', '')) > 0.8:
-                return True
-            
-            # URL完全一致チェック
-            if entry.get('source_url') and entry['source_url'] == existing.get('source_url'):
-                return True
-        
-        return False
-    
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """テキスト類似度計算（簡易版）"""
         if not text1 or not text2:
             return 0.0
         
-        # 単語に分割
-        words1 = set(re.findall(r'\w+', text1.lower()))
-        words2 = set(re.findall(r'\w+', text2.lower()))
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        # Jaccard係数
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        return intersection / union if union > 0 else 0.0
+        return jaccard(title_tokens(text1), title_tokens(text2))
     
-    def _passes_filters(self, entry: Dict) -> bool:
+    def _passes_filters(self, entry: Dict, scan: Optional[KeywordScan] = None) -> bool:
         """フィルタリング条件チェック"""
-        title = entry.get('title', '').lower()
-        description = entry.get('description', '').lower()
-        text_to_check = f"{title} {description}"
+        scan = scan or self._scan_keywords(entry)
         
         # 除外キーワードチェック
-        for exclude_keyword in self.exclude_keywords:
-            if exclude_keyword in text_to_check:
-                logger.debug(f"Entry excluded by keyword '{exclude_keyword}': {entry.get('title', '')}")
-                return False
+        if scan.excluded_by:
+            logger.debug(f"Entry excluded by keyword '{scan.excluded_by}': {entry.get('title', '')}")
+            return False
         
         # 対象キーワードチェック
-        for target_keyword in self.target_keywords:
-            if target_keyword in text_to_check:
-                return True
-        
-        return False
+        return bool(scan.matched)
     
-    def _calculate_relevance_score(self, entry: Dict) -> int:
+    def _calculate_relevance_score(self, entry: Dict, scan: Optional[KeywordScan] = None,
+                                   today: Optional[date] = None) -> int:
         """適合度スコア計算"""
         score = 0
-        title = entry.get('title', '').lower()
-        description = entry.get('description', '').lower()
-        text_to_check = f"{title} {description}"
+        scan = scan or self._scan_keywords(entry)
         
         # キーワードマッチによる加点
-        for keyword in self.target_keywords:
-            if keyword in text_to_check:
-                # タイトルにあるキーワードは高得点
-                if keyword in title:
-                    score += 30
-                else:
-                    score += 10
+        for keyword in scan.matched:
+            # タイトルにあるキーワードは高得点
+            if keyword in scan.in_title:
+                score += 30
+            else:
+                score += 10
         
         # 予算規模による加点
         budget = entry.get('budget_amount')
         if budget:
-            if budget >= 10000000:  # 1000万円以上
-                score += 20
-            elif budget >= 5000000:  # 500万円以上
-                score += 15
-            elif budget >= 1000000:  # 100万円以上
-                score += 10
+            score += BUDGET_BONUSES[bisect_right(BUDGET_THRESHOLDS, budget)]
         
         # 地域による加点（本社近郊優遇）
         region = entry.get('region', '').lower()
-        if any(pref in region for pref in ['東京', '神奈川', '千葉', '埼玉']):
-            score += 15
-        elif any(pref in region for pref in ['大阪', '京都', '兵庫']):
-            score += 10
+        score += next((bonus for pattern, bonus in REGION_BONUS_TIERS if pattern.search(region)), 0)
         
         # 発注機関による加点
         organization = entry.get('organization', '').lower()
-        if any(org in organization for org in ['市', '区', '町', '村']):
-            score += 5  # 基礎自治体
+        if MUNICIPALITY_PATTERN.search(organization):
+            score += MUNICIPALITY_BONUS
         
         # 締切日による加点（余裕がある案件を優遇）
         deadline = entry.get('deadline_date')
         if deadline:
             try:
                 if isinstance(deadline, str):
-                    deadline = datetime.strptime(deadline, '%Y-%m-%d').date()
+                    deadline = parse_date(deadline)
                 
-                days_until_deadline = (deadline - date.today()).days
-                if days_until_deadline >= 14:  # 2週間以上
-                    score += 10
-                elif days_until_deadline >= 7:  # 1週間以上
-                    score += 5
+                days_until_deadline = (deadline - (today or date.today())).days
+                score += DEADLINE_BONUSES[bisect_right(DEADLINE_THRESHOLDS, days_until_deadline)]
             except Exception:
                 pass
         
-        return min(score, 100)  # 最大100点
-    
-    def _get_matched_keywords(self, entry: Dict) -> str:
-        """マッチしたキーワードを取得"""
-        matched = []
-        title = entry.get('title', '').lower()
-        description = entry.get('description', '').lower()
-        text_to_check = f"{title} {description}"
-        
-        for keyword in self.target_keywords:
-            if keyword in text_to_check:
-                matched.append(keyword)
-        
-        return json.dumps(matched, ensure_ascii=False)
+        return min(score, MAX_RELEVANCE_SCORE)
     
     def filter_by_score(self, entries: List[Dict], min_score: int = 0) -> List[Dict]:
         """スコアによるフィルタリング"""
@@ -187,7 +322,7 @@ class BidDataProcessor:
             if published_date:
                 try:
                     if isinstance(published_date, str):
-                        published_date = datetime.strptime(published_date, '%Y-%m-%d').date()
+                        published_date = parse_date(published_date)
                     
                     if published_date >= cutoff_date:
                         filtered_entries.append(entry)
@@ -233,7 +368,7 @@ class BidDataProcessor:
         normalized['published_date'] = entry.get('published_date')
         normalized['deadline_date'] = entry.get('deadline_date')
         normalized['relevance_score'] = entry.get('relevance_score', 0)
-        normalized['keywords_matched'] = entry.get('keywords_matched', '[]')
+        normalized['keywords_matched'] = entry.get('keywords_matched', [])
         
         return normalized
 
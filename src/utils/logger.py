@@ -1,17 +1,47 @@
+import atexit
 import logging
 import os
-from datetime import datetime
-from typing import Optional
+import queue
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import Dict, Optional
+
+# ロガー名ごとの書き込みスレッド（ファイル・コンソールへの出力は呼び出し元のスレッドで行わない）
+_listeners: Dict[str, QueueListener] = {}
+
+def _dated_log_name(default_name: str) -> str:
+    """ローテーション後のファイル名を {name}_{YYYYMMDD}.log 形式にする（logs/*.logの掃除対象に含める）"""
+    base, _, stamp = default_name.rpartition('.')
+    root, ext = os.path.splitext(base)
+    return f"{root}_{stamp}{ext}"
+
+def _stop_listener(listener: QueueListener):
+    """書き込みスレッドを停止し（キューに残ったログは書き出してから終了する）、ハンドラーを閉じる"""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+def _stop_listeners():
+    """全ての書き込みスレッドを停止（プロセス終了時）"""
+    for listener in _listeners.values():
+        _stop_listener(listener)
+    _listeners.clear()
+
+atexit.register(_stop_listeners)
 
 def setup_logger(name: str = "bid_collector", level: str = "INFO") -> logging.Logger:
-    """ログ設定"""
+    """ログ設定
+    
+    ログは {name}.log に書き込み、日付が変わると {name}_{YYYYMMDD}.log に切り替える
+    （古いファイルの削除はmain側のクリーンアップで行う）。
+    ハンドラーへの出力はQueueListenerのスレッドで行い、処理中のスレッドをファイルI/Oで止めない。
+    """
     
     # ログディレクトリ作成
     log_dir = "logs"
     os.makedirs(log_dir, exist_ok=True)
     
     # ログファイル名
-    log_file = os.path.join(log_dir, f"{name}_{datetime.now().strftime('%Y%m%d')}.log")
+    log_file = os.path.join(log_dir, f"{name}.log")
     
     # ログレベル設定
     log_level = getattr(logging, level.upper(), logging.INFO)
@@ -24,21 +54,32 @@ def setup_logger(name: str = "bid_collector", level: str = "INFO") -> logging.Lo
     # ログ設定
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
+    logger.propagate = False
     
-    # 既存のハンドラーを削除（重複防止）
+    # 既存のハンドラー・書き込みスレッドを削除（重複防止）
     if logger.handlers:
         logger.handlers.clear()
+    previous: Optional[QueueListener] = _listeners.pop(name, None)
+    if previous is not None:
+        _stop_listener(previous)
     
-    # ファイルハンドラー
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # ファイルハンドラー（深夜0時に日付付きのファイルへ切り替え）
+    file_handler = TimedRotatingFileHandler(log_file, when='midnight', encoding='utf-8', delay=True)
+    file_handler.suffix = '%Y%m%d'
+    file_handler.namer = _dated_log_name
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
     # コンソールハンドラー
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    
+    # ロガーにはキューへの追加のみを行うハンドラーを設定
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+    logger.addHandler(QueueHandler(log_queue))
     
     return logger
\ No newline at end of file
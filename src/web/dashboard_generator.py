@@ -4,12 +4,81 @@ Webダッシュボード用データ生成器
 """
 
 import json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+import gzip
 import sqlite3
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, BinaryIO
 import shutil
 
+# 読み取り用接続のPRAGMA（WALモードはsimple_db側でデータベースファイルに設定済み）
+READ_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456"
+)
+
+# ローカルサーバー（start_dashboard.py）が配信する事前圧縮データの圧縮レベル
+DASHBOARD_GZIP_LEVEL = 6
+
+# ダッシュボードに載せる最新案件
+RECENT_ENTRIES_QUERY = """
+    SELECT * FROM procurement_entries 
+    ORDER BY created_at DESC 
+    LIMIT 100
+"""
+
+# ダッシュボード統計（各集計を種別タグ付きの行として一度の問い合わせで取得）
+# 日付はローカル日時で渡す（SQLiteのdate('now')はUTCのため使わない）
+# 日別件数はsimple_dbの式インデックス idx_pe_created_day (date(created_at)) で検索・集計する
+DASHBOARD_STATISTICS_QUERY = """
+    SELECT 'totals', NULL,
+        COUNT(*),
+        COALESCE(SUM(CASE WHEN relevance_score >= 80 THEN 1 ELSE 0 END), 0)
+    FROM procurement_entries
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'region', region, COUNT(*) as count, NULL
+        FROM procurement_entries 
+        GROUP BY region 
+        ORDER BY count DESC 
+        LIMIT 10
+    )
+    UNION ALL
+    SELECT 'priority',
+        CASE 
+            WHEN relevance_score >= 80 THEN 'high'
+            WHEN relevance_score >= 60 THEN 'medium'
+            ELSE 'low'
+        END as priority,
+        COUNT(*), NULL
+    FROM procurement_entries
+    GROUP BY priority
+    UNION ALL
+    SELECT 'daily', date(created_at) as day, COUNT(*), NULL
+    FROM procurement_entries
+    WHERE date(created_at) >= :since
+    GROUP BY day
+"""
+
+
+def dump_json(value: Any, depth: int = 0) -> bytes:
+    """json.dump(indent=2)の出力のうち、深さdepthに置かれる値の部分をUTF-8のバイト列にシリアライズ
+    
+    orjsonが利用可能な場合はorjsonのバイト列をそのまま書き出せる形で返す。
+    """
+    if HAS_ORJSON:
+        data = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(value, ensure_ascii=False, indent=2).encode('utf-8')
+    return data.replace(b'\n', b'\n' + b'  ' * depth) if depth else data
+
 class DashboardGenerator:
     """Webダッシュボード用データ生成クラス"""
     
@@ -25,16 +94,11 @@ class DashboardGenerator:
             return self._generate_empty_data()
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._connect()
             cursor = conn.cursor()
             
             # 案件データ取得
-            cursor.execute("""
-                SELECT * FROM procurement_entries 
-                ORDER BY created_at DESC 
-                LIMIT 100
-            """)
+            cursor.execute(RECENT_ENTRIES_QUERY)
             entries = [dict(row) for row in cursor.fetchall()]
             
             # 統計データ生成
@@ -63,56 +127,39 @@ class DashboardGenerator:
             print(f"ダッシュボードデータ生成エラー: {e}")
             return self._generate_error_data(str(e))
     
+    def _connect(self) -> sqlite3.Connection:
+        """読み取り用の接続を開く（書き込み中の収集処理と並行して読めるようWALのまま読み取る）"""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        for pragma in READ_CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
     def _generate_statistics(self, cursor) -> Dict[str, Any]:
         """統計データを生成"""
         
-        # 総案件数
-        cursor.execute("SELECT COUNT(*) FROM procurement_entries")
-        total_entries = cursor.fetchone()[0]
-        
-        # 高優先度案件数
-        cursor.execute("SELECT COUNT(*) FROM procurement_entries WHERE relevance_score >= 80")
-        high_priority = cursor.fetchone()[0]
+        now = datetime.now()
+        dates = [(now - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(7)]
         
-        # 本日追加案件数
-        today = datetime.now().strftime('%Y-%m-%d')
-        cursor.execute("SELECT COUNT(*) FROM procurement_entries WHERE date(created_at) = ?", (today,))
-        today_entries = cursor.fetchone()[0]
+        total_entries = high_priority = 0
+        region_stats = []
+        priority_distribution = {}
+        daily_counts = {}
         
-        # 地域別統計
-        cursor.execute("""
-            SELECT region, COUNT(*) as count 
-            FROM procurement_entries 
-            GROUP BY region 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        region_stats = [{"region": row[0], "count": row[1]} for row in cursor.fetchall()]
+        # 総案件数・高優先度・本日追加・地域別（上位10）・適合度分布・最近7日間の日別件数
+        cursor.execute(DASHBOARD_STATISTICS_QUERY, {"since": dates[-1]})
+        for kind, key, count, high in cursor.fetchall():
+            if kind == 'totals':
+                total_entries, high_priority = count, high
+            elif kind == 'region':
+                region_stats.append({"region": key, "count": count})
+            elif kind == 'priority':
+                priority_distribution[key] = count
+            else:
+                daily_counts[key] = count
         
-        # 適合度分布
-        cursor.execute("""
-            SELECT 
-                CASE 
-                    WHEN relevance_score >= 80 THEN 'high'
-                    WHEN relevance_score >= 60 THEN 'medium'
-                    ELSE 'low'
-                END as priority,
-                COUNT(*) as count
-            FROM procurement_entries
-            GROUP BY priority
-        """)
-        priority_distribution = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # 最近7日間の追加案件数
-        daily_stats = []
-        for i in range(7):
-            date = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
-            cursor.execute("SELECT COUNT(*) FROM procurement_entries WHERE date(created_at) = ?", (date,))
-            count = cursor.fetchone()[0]
-            daily_stats.append({
-                "date": date,
-                "count": count
-            })
+        daily_stats = [{"date": date, "count": daily_counts.get(date, 0)} for date in dates]
+        today_entries = daily_counts.get(dates[0], 0)
         
         return {
             "total_entries": total_entries,
@@ -135,13 +182,16 @@ class DashboardGenerator:
         log_files = []
         logs_dir = "logs"
         if os.path.exists(logs_dir):
-            for filename in os.listdir(logs_dir):
-                if filename.endswith('.log'):
-                    filepath = os.path.join(logs_dir, filename)
+            # scandirのエントリから一度のstatでサイズと更新時刻を取得
+            with os.scandir(logs_dir) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith('.log') or not dir_entry.is_file():
+                        continue
+                    stat = dir_entry.stat()
                     log_files.append({
-                        "name": filename,
-                        "size": os.path.getsize(filepath),
-                        "modified": datetime.fromtimestamp(os.path.getmtime(filepath)).isoformat()
+                        "name": dir_entry.name,
+                        "size": stat.st_size,
+                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
                     })
         
         return {
@@ -209,17 +259,31 @@ class DashboardGenerator:
         }
     
     def save_dashboard_data(self) -> bool:
-        """ダッシュボードデータをJSONファイルに保存"""
+        """ダッシュボードデータをJSONファイルに保存
+        
+        案件行はdictのリストにまとめず、カーソルから一行ずつシリアライズして書き出す。
+        書き込みは一時ファイルに行い、完了してから置き換える。
+        """
         try:
             # Webディレクトリ作成
             os.makedirs(self.web_dir, exist_ok=True)
             
-            # データ生成
-            data = self.generate_dashboard_data()
+            temp_file = f"{self.data_file}.tmp"
+            with open(temp_file, 'wb') as f:
+                if os.path.exists(self.db_path):
+                    try:
+                        self._stream_dashboard_data(f)
+                    except Exception as e:
+                        print(f"ダッシュボードデータ生成エラー: {e}")
+                        f.seek(0)
+                        f.truncate()
+                        f.write(dump_json(self._generate_error_data(str(e))))
+                else:
+                    f.write(dump_json(self._generate_empty_data()))
+            os.replace(temp_file, self.data_file)
             
-            # JSONファイルに保存
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 事前圧縮版（JSONより後に書き出すため、更新時刻は常にJSON以降になる）
+            self._write_gzip_copy(self.data_file)
             
             print(f"ダッシュボードデータ保存: {self.data_file}")
             return True
@@ -228,6 +292,49 @@ class DashboardGenerator:
             print(f"ダッシュボードデータ保存エラー: {e}")
             return False
     
+    def _write_gzip_copy(self, path: str):
+        """ファイルのgzip圧縮版を path + '.gz' に書き出す"""
+        with open(path, 'rb') as f:
+            compressed = gzip.compress(f.read(), compresslevel=DASHBOARD_GZIP_LEVEL)
+        
+        temp_file = f"{path}.gz.tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(compressed)
+        os.replace(temp_file, f"{path}.gz")
+    
+    def _stream_dashboard_data(self, f: BinaryIO):
+        """generate_dashboard_dataと同じ内容を、案件行を逐次書き出しながら出力"""
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            
+            # 統計データ・システム情報
+            stats = self._generate_statistics(cursor)
+            system_info = self._generate_system_info()
+            
+            f.write(b'{\n  "last_updated": ' + dump_json(datetime.now().isoformat()) + b',\n')
+            f.write(b'  "stats": ' + dump_json(stats, 1) + b',\n')
+            
+            # 案件データ（一行ずつ書き出す）
+            f.write(b'  "entries": [')
+            entry_count = 0
+            for row in cursor.execute(RECENT_ENTRIES_QUERY):
+                f.write(b',\n    ' if entry_count else b'\n    ')
+                f.write(dump_json(dict(row), 2))
+                entry_count += 1
+            f.write(b'\n  ],\n' if entry_count else b'],\n')
+            
+            metadata = {
+                "total_entries": entry_count,
+                "data_source": "bidding_system.db",
+                "generated_at": datetime.now().isoformat()
+            }
+            f.write(b'  "system_info": ' + dump_json(system_info, 1) + b',\n')
+            f.write(b'  "metadata": ' + dump_json(metadata, 1) + b'\n}')
+        
+        finally:
+            conn.close()
+    
     def update_dashboard_html(self) -> bool:
         """ダッシュボードHTMLファイルを最新データで更新"""
         try:
@@ -263,6 +370,10 @@ class DashboardGenerator:
             if os.path.exists(data_source):
                 shutil.copy2(data_source, data_dest)
                 print(f"データファイルコピー: {data_dest}")
+                
+                # 事前圧縮版（ローカルサーバーがgzipのまま配信する）
+                if os.path.exists(f"{data_source}.gz"):
+                    shutil.copy2(f"{data_source}.gz", f"{data_dest}.gz")
             
             # README作成
             readme_content = """# 入札案件自動収集システム - ダッシュボード
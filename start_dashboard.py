@@ -6,14 +6,50 @@
 import os
 import sys
 import webbrowser
+from functools import partial
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 import threading
 import time
 
+# 事前圧縮版（ファイル名 + '.gz'）があればgzipのまま配信する拡張子
+PRECOMPRESSED_SUFFIXES = ('.json',)
+
+class DashboardRequestHandler(SimpleHTTPRequestHandler):
+    """ダッシュボード配信用ハンドラ
+    
+    dashboard_generator.pyが書き出した事前圧縮版があり、元ファイル以降に更新されていれば、
+    gzip対応のクライアントにはContent-Encoding: gzipでそのまま返す。
+    """
+    
+    def send_head(self):
+        path = self.translate_path(self.path)
+        gzip_path = f"{path}.gz"
+        
+        if (path.endswith(PRECOMPRESSED_SUFFIXES)
+                and 'gzip' in self.headers.get('Accept-Encoding', '')
+                and os.path.isfile(path) and os.path.isfile(gzip_path)
+                and os.path.getmtime(gzip_path) >= os.path.getmtime(path)):
+            try:
+                f = open(gzip_path, 'rb')
+            except OSError:
+                return super().send_head()
+            
+            fs = os.fstat(f.fileno())
+            self.send_response(200)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(fs.st_size))
+            self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return f
+        
+        return super().send_head()
+
 def start_dashboard_server():
     """ダッシュボードサーバーを起動"""
     
-    # docsディレクトリに移動
+    # 配信するdocsディレクトリ
     docs_dir = os.path.join(os.getcwd(), 'docs')
     
     if not os.path.exists(docs_dir):
@@ -21,15 +57,14 @@ def start_dashboard_server():
         print("先にダッシュボードを生成してください: python src/web/dashboard_generator.py")
         return False
     
-    os.chdir(docs_dir)
-    
     # サーバー設定
     port = 8080
     host = 'localhost'
     
     # HTTPサーバー起動
     try:
-        server = HTTPServer((host, port), SimpleHTTPRequestHandler)
+        # カレントディレクトリは変更せず、ハンドラに配信ディレクトリを渡す
+        server = HTTPServer((host, port), partial(DashboardRequestHandler, directory=docs_dir))
         
         print("🚀 入札案件ダッシュボード起動中...")
         print(f"📍 URL: http://{host}:{port}")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# プロジェクトルートをパスに追加（src.main と同じ方法でインポートする）
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,38 @@
+"""
+BidCollectionSystem のテスト
+"""
+
+import sqlite3
+
+
+class FakeResource:
+    """close()の呼び出しを記録する"""
+    
+    def __init__(self, calls, name):
+        self.calls = calls
+        self.name = name
+    
+    def close(self):
+        self.calls.append(f"{self.name}.close")
+
+
+class LockedDatabase(FakeResource):
+    """古いデータの削除で失敗するデータベース"""
+    
+    def cleanup_old_data(self, days):
+        raise sqlite3.OperationalError("database is locked")
+
+
+def test_cleanup_closes_connections_when_cleanup_fails(tmp_path, monkeypatch):
+    # src.mainはインポート時にlogs/へログを作成するため、一時ディレクトリで実行する
+    monkeypatch.chdir(tmp_path)
+    from src.main import BidCollectionSystem
+    
+    calls = []
+    system = BidCollectionSystem.__new__(BidCollectionSystem)
+    system.db_manager = LockedDatabase(calls, "db_manager")
+    system.notifier = FakeResource(calls, "notifier")
+    
+    system._cleanup()
+    
+    assert calls == ["db_manager.close", "notifier.close"]
@@ -0,0 +1,116 @@
+"""
+NotificationService のテスト
+"""
+
+import gzip
+import json
+
+import pytest
+
+from src.notifications.notifier import (
+    ALERT_BATCH_MAX, JSON_HEADERS, WEBHOOK_GZIP_MIN_SIZE, NotificationService, encode_webhook_body
+)
+
+
+@pytest.fixture
+def service():
+    notifier = NotificationService(dry_run=True)
+    notifier.coalesce_window = 3600  # テスト中にタイマーで送信されないようにする
+    notifier.rate_limit_per_min = 3
+    notifier.max_daily_notifications = 100
+    notifier._tokens = 100.0
+    notifier.score_threshold = 80
+    
+    # 送信したアラートの件数を記録する
+    notifier.sent_batches = []
+    
+    def send_email_alert(entries, subject, sent_at):
+        notifier.sent_batches.append(len(entries))
+        return True
+    
+    notifier._send_email_alert = send_email_alert
+    notifier._send_teams_alert = lambda entries, title, sent_at: False
+    yield notifier
+    notifier.close()
+
+
+def make_entries(count, start=0):
+    return [
+        {
+            "title": f"システム構築業務 {i}",
+            "organization": "東京都",
+            "source_url": f"https://example.jp/bid/{i}",
+            "relevance_score": 90
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def test_full_batch_is_sent_by_the_caller(service):
+    assert service.send_high_priority_alert(make_entries(ALERT_BATCH_MAX - 1))
+    assert service.sent_batches == []
+    
+    assert service.send_high_priority_alert(make_entries(1, start=ALERT_BATCH_MAX - 1))
+    assert service.sent_batches == [ALERT_BATCH_MAX]
+    assert service.notification_count == 1
+    assert service.flush_pending_alerts()
+
+
+def test_full_batch_failure_is_reported(service):
+    service._send_email_alert = lambda entries, subject, sent_at: False
+    
+    assert not service.send_high_priority_alert(make_entries(ALERT_BATCH_MAX))
+    assert service.notification_count == 0
+
+
+def test_batches_over_rate_limit_are_requeued(service):
+    # 1分あたり3通の制限で4通目のまとまりは送信できない
+    assert not service.send_high_priority_alert(make_entries(ALERT_BATCH_MAX * 3 + 10))
+    assert service.sent_batches == [ALERT_BATCH_MAX, ALERT_BATCH_MAX, ALERT_BATCH_MAX]
+    assert len(service._pending) == 10
+    assert not service.flush_pending_alerts()
+    assert len(service._pending) == 10
+    
+    # 60秒の制限枠が空いた後の送信で、保留に戻った案件が送られる
+    service._push_times.clear()
+    assert service.flush_pending_alerts()
+    assert service.sent_batches == [ALERT_BATCH_MAX, ALERT_BATCH_MAX, ALERT_BATCH_MAX, 10]
+    assert not service._pending
+
+
+def test_immediate_alert_over_rate_limit_is_requeued(service):
+    service.coalesce_window = 0
+    for start in range(3):
+        assert service.send_high_priority_alert(make_entries(1, start=start))
+    
+    assert not service.send_high_priority_alert(make_entries(1, start=3))
+    assert len(service._pending) == 1
+    
+    service._push_times.clear()
+    assert service.flush_pending_alerts()
+    assert service.sent_batches == [1, 1, 1, 1]
+
+
+def test_webhook_body_is_not_compressed_by_default():
+    message = {"text": "x" * (WEBHOOK_GZIP_MIN_SIZE * 2)}
+    
+    body, headers = encode_webhook_body(message)
+    assert headers == JSON_HEADERS
+    assert json.loads(body) == message
+    
+    body, headers = encode_webhook_body(message, compress=True)
+    assert headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(body)) == message
+
+
+def test_teams_report_is_sent_uncompressed_unless_enabled(service):
+    entries = [dict(entry, description="仕様書参照。" * 50) for entry in make_entries(5)]
+    statistics = {"total_entries": len(entries)}
+    
+    assert service._send_teams_report(entries, entries, [], statistics)
+    assert len(service._last_payload) > WEBHOOK_GZIP_MIN_SIZE
+    json.loads(service._last_payload)
+    
+    service.teams_webhook_gzip = True
+    assert service._send_teams_report(entries, entries, [], statistics)
+    json.loads(gzip.decompress(service._last_payload))
@@ -0,0 +1,131 @@
+"""
+RSSCollector のテスト
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("feedparser")
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from src.collectors.rss_collector import RSSCollector, parse_feed_bytes
+
+ITEM_COUNT = 400
+
+
+def build_malformed_feed() -> bytes:
+    """エスケープされていない&を含む100KB超のRSS（feedparserはbozoとして扱うがエントリは取得できる）"""
+    items = ''.join(
+        f"<item><title>コールセンター業務委託 第{i}号 & 保守</title>"
+        f"<link>https://example.jp/bid/{i}</link>"
+        f"<description>{'仕様書参照。' * 50}</description></item>"
+        for i in range(ITEM_COUNT)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<rss version="2.0"><channel><title>テスト</title>{items}</channel></rss>'
+    ).encode('utf-8')
+
+
+def build_feed(name: str) -> bytes:
+    """対象キーワードを含むエントリが1件のRSS"""
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<rss version="2.0"><channel><title>{name}</title>'
+        f'<item><title>{name} コールセンター業務委託</title><link>https://example.jp/{name}</link></item>'
+        '</channel></rss>'
+    ).encode('utf-8')
+
+
+async def serve_feeds(routes):
+    """ローカルのaiohttpサーバーでフィードを配信し、(runner, port) を返す"""
+    app = web.Application()
+    for path, handler in routes:
+        app.router.add_get(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+def test_malformed_feed_is_bozo_but_has_entries():
+    content = build_malformed_feed()
+    assert len(content) >= 100 * 1024
+    
+    feed = parse_feed_bytes(content)
+    assert feed.bozo
+    assert len(feed.entries) == ITEM_COUNT
+
+
+def test_collect_all_async_keeps_entries_of_large_malformed_feed(tmp_path):
+    content = build_malformed_feed()
+    
+    async def handle_feed(request):
+        return web.Response(body=content, content_type='application/rss+xml')
+    
+    async def collect():
+        runner, port = await serve_feeds([('/feed.rss', handle_feed)])
+        try:
+            rss_info = {
+                "name": "テスト市",
+                "rss_url": f"http://127.0.0.1:{port}/feed.rss",
+                "website_url": "https://example.jp/",
+                "type": "municipality"
+            }
+            return await collector._collect_all_async([rss_info])
+        finally:
+            await runner.cleanup()
+    
+    collector = RSSCollector()
+    collector.feed_cache_path = str(tmp_path / "rss_feed_cache.json")
+    results = asyncio.run(collect())
+    
+    assert len(results) == 1
+    entries = results[0]
+    assert isinstance(entries, list)
+    assert len(entries) == 20
+    assert entries[0]['title'] == "コールセンター業務委託 第0号 & 保守"
+    assert entries[0]['source_url'] == "https://example.jp/bid/0"
+
+
+def test_collect_all_async_times_out_per_request_not_while_queued(tmp_path):
+    # 同一ホストの接続数制限を超える数の遅いフィード（全体では収集器のtimeoutを超える）
+    feed_count = 5
+    response_delay = 0.5
+    
+    async def handle_feed(request):
+        await asyncio.sleep(response_delay)
+        name = request.match_info['name']
+        return web.Response(body=build_feed(name), content_type='application/rss+xml')
+    
+    async def collect():
+        runner, port = await serve_feeds([('/{name}.rss', handle_feed)])
+        try:
+            rss_sources = [
+                {
+                    "name": f"feed{i}",
+                    "rss_url": f"http://127.0.0.1:{port}/feed{i}.rss",
+                    "website_url": "https://example.jp/",
+                    "type": "municipality"
+                }
+                for i in range(feed_count)
+            ]
+            return await collector._collect_all_async(rss_sources)
+        finally:
+            await runner.cleanup()
+    
+    collector = RSSCollector()
+    collector.feed_cache_path = str(tmp_path / "rss_feed_cache.json")
+    collector.timeout = 1
+    assert feed_count > collector.max_connections_per_host
+    assert response_delay * feed_count / collector.max_connections_per_host > collector.timeout
+    
+    results = asyncio.run(collect())
+    
+    assert [len(entries) for entries in results] == [1] * feed_count
+    assert [entries[0]['title'] for entries in results] == [
+        f"feed{i} コールセンター業務委託" for i in range(feed_count)
+    ]
@@ -0,0 +1,110 @@
+"""
+SimpleDatabaseManager のテスト
+"""
+
+import sqlite3
+
+import pytest
+
+from src.database.simple_db import SimpleDatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = SimpleDatabaseManager(str(tmp_path / "test.db"))
+    yield manager
+    manager.close()
+
+
+def entry_keywords(db: SimpleDatabaseManager) -> set:
+    """entry_keywordsの (案件タイトル, キーワード) の集合"""
+    rows = db.fetch_all("""
+    SELECT procurement_entries.title, entry_keywords.keyword FROM entry_keywords 
+    JOIN procurement_entries ON procurement_entries.id = entry_keywords.entry_id
+    """)
+    return {(row['title'], row['keyword']) for row in rows}
+
+
+def count_system_logs(db_path: str) -> int:
+    """別の接続からsystem_logsの行数を数える（共有接続の未コミット分は見えない）"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM system_logs").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_system_logs_are_buffered_until_flush(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    db = SimpleDatabaseManager(db_path)
+    try:
+        db.insert_system_log("INFO", "first", "test")
+        db.insert_system_log("ERROR", "second", "test", {"count": 1})
+        assert count_system_logs(db_path) == 0
+        
+        assert db.flush_system_logs() == 2
+        assert count_system_logs(db_path) == 2
+        assert db.flush_system_logs() == 0
+    finally:
+        db.close()
+
+
+def test_get_database_stats_flushes_system_logs(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    db = SimpleDatabaseManager(db_path)
+    try:
+        for i in range(3):
+            db.insert_system_log("INFO", f"message {i}", "test")
+        
+        assert db.get_database_stats()['system_logs'] == 3
+        assert count_system_logs(db_path) == 3
+    finally:
+        db.close()
+
+
+def test_close_flushes_system_logs(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    db = SimpleDatabaseManager(db_path)
+    db.insert_system_log("WARNING", "written on close", "test", {"key": "value"})
+    db.close()
+    
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT level, message, module, additional_data, execution_time FROM system_logs").fetchall()
+    finally:
+        conn.close()
+    assert len(rows) == 1
+    level, message, module, additional_data, execution_time = rows[0]
+    assert (level, message, module) == ("WARNING", "written on close", "test")
+    assert '"key"' in additional_data
+    assert execution_time is not None
+
+
+def test_insert_procurement_entries_skips_keywords_of_duplicates(db):
+    first = {"title": "データ入力業務", "organization": "東京都", "keywords_matched": ["データ入力"]}
+    assert db.insert_procurement_entries([first]) == 1
+    
+    duplicate = {"title": "データ入力業務", "organization": "東京都", "keywords_matched": ["コールセンター"]}
+    other = {"title": "キッティング作業", "organization": "東京都", "keywords_matched": ["キッティング"]}
+    assert db.insert_procurement_entries([duplicate, other, other]) == 1
+    
+    assert entry_keywords(db) == {("データ入力業務", "データ入力"), ("キッティング作業", "キッティング")}
+    assert db.get_entries_by_keyword("コールセンター") == []
+
+
+def test_insert_procurement_entries_links_keywords_without_organization(db):
+    entry = {"title": "電話受付業務", "organization": None, "keywords_matched": ["電話受付"]}
+    assert db.insert_procurement_entries([entry]) == 1
+    assert db.insert_procurement_entries([dict(entry, keywords_matched=["事務業務"])]) == 0
+    
+    assert entry_keywords(db) == {("電話受付業務", "電話受付")}
+
+
+def test_insert_procurement_entry_skips_keywords_of_duplicates(db):
+    entry = {"title": "運用保守業務", "organization": "総務省", "keywords_matched": ["運用保守"]}
+    entry_id = db.insert_procurement_entry(entry)
+    assert entry_id
+    assert db.insert_procurement_entry(dict(entry, keywords_matched=["システム構築"])) == 0
+    
+    assert [row['id'] for row in db.get_entries_by_keyword("運用保守")] == [entry_id]
+    assert entry_keywords(db) == {("運用保守業務", "運用保守")}